@@ -17,6 +17,7 @@ class AbstractAgent:
         """
 
         self.env = env              # ref. to the environment
+        self.rng = env.spawn_rng()  # the agent's own random generator (reproducible with the env seed)
         self.body = None            # ref. to the physical part of the agent in the environment
         self.NAME = ""              # the name of the agent
         self.TLIM = 0.0             # time limit to execute (cannot be exceeded)
@@ -0,0 +1,154 @@
+import math
+from random import Random
+import numpy as np
+
+from physical_agent import PhysAgent
+from agentes.utils.problema import Problema
+from agentes.utils.estado import ChavePosicao
+
+
+class Coordenador:
+    """Coordena uma equipe de agentes exploradores e de resgate a partir da base.
+
+    - Atribui a cada explorador um setor angular em torno da base;
+    - Recebe o problema de cada explorador que volta à base e, quando todos voltaram ou
+        morreram (o ambiente avisa cada morte em explorador_morreu), junta os problemas em um só;
+    - Particiona as vítimas entre os socorristas (k-means das posições) e acorda cada
+        socorrista com o problema restrito às suas vítimas.
+
+    Para os exploradores, faz o papel do agente de resgate (go_save_victims).
+    """
+
+    # Máximo de iterações do k-means
+    MAX_ITERACOES = 100
+
+    def __init__(self, resgatistas: list, n_exploradores: int, rng: Random = None) -> None:
+        """Instancia o coordenador da equipe.
+
+        Args:
+            resgatistas (list[Rescuer]): agentes de resgate da equipe, em estado IDLE.
+            n_exploradores (int): quantidade de exploradores da equipe.
+            rng (Random, optional): gerador aleatório do coordenador. Default: Random() sem semente.
+        """
+        self.rng = rng if rng is not None else Random()
+        self.resgatistas = resgatistas
+        self.n_exploradores = n_exploradores
+        self.exploradores: list = []
+
+        # Problemas recebidos dos exploradores que voltaram à base
+        self.problemas_recebidos: list[Problema] = []
+        self.problema: Problema = None
+        self.flag_resgate_iniciado: bool = False
+
+    def setor(self, indice: int) -> tuple[float, float] | None:
+        """Retorna o setor angular (radianos, em torno da base) do explorador de índice dado.
+
+        Args:
+            indice (int): índice do explorador na equipe.
+
+        Returns:
+            tuple[float, float] | None: ângulos inicial e final do setor, None se há
+                apenas um explorador.
+        """
+        if self.n_exploradores <= 1:
+            return None
+        largura = 2 * math.pi / self.n_exploradores
+        return (-math.pi + indice * largura, -math.pi + (indice + 1) * largura)
+
+    def adiciona_explorador(self, explorador) -> None:
+        """Registra um explorador da equipe, que entregará seu problema ao coordenador."""
+        self.exploradores.append(explorador)
+
+    def go_save_victims(self, problema_montado: Problema) -> None:
+        """Recebe o problema de um explorador na base.
+
+        Args:
+            problema_montado (Problema): problema elaborado pelo explorador.
+        """
+        self.problemas_recebidos.append(problema_montado)
+        self.__inicia_resgate_se_possivel()
+
+    def explorador_morreu(self, agente) -> None:
+        """Recebe do ambiente o aviso da morte de um agente (listener de Env.add_death_listener).
+
+        Um explorador morto nunca entregará seu problema: se era o último esperado, os
+            socorristas são acordados com os problemas já recebidos.
+
+        Args:
+            agente (AbstractAgent): agente que morreu.
+        """
+        if agente in self.exploradores:
+            self.__inicia_resgate_se_possivel()
+
+    def __inicia_resgate_se_possivel(self) -> None:
+        """Quando não há mais explorador ativo que possa voltar, junta os problemas
+            recebidos e acorda os socorristas (uma única vez).
+        """
+        if self.flag_resgate_iniciado:
+            return
+
+        # Exploradores mortos nunca entregarão seus problemas
+        entregues = len(self.problemas_recebidos)
+        mortos = sum(explorador.body.state == PhysAgent.DEAD for explorador in self.exploradores)
+        if entregues + mortos < self.n_exploradores:
+            return
+        self.flag_resgate_iniciado = True
+
+        self.problema = Problema()
+        for problema in self.problemas_recebidos:
+            self.problema.incorpora(problema)
+
+        print(
+            f"coordenador: {len(self.problemas_recebidos)} problemas unidos, "
+            f"{len(self.problema.grafo_posicoes)} posições, "
+            f"{len(self.problema.sinais_vitais_vitimas)} vítimas"
+        )
+
+        for resgatista, vitimas in zip(self.resgatistas, self.particiona_vitimas(self.problema)):
+            resgatista.go_save_victims(self.problema.copia_com_vitimas(vitimas))
+
+    def particiona_vitimas(self, problema: Problema) -> list[list[ChavePosicao]]:
+        """Particiona as vítimas do problema entre os socorristas com k-means das posições.
+
+        Args:
+            problema (Problema): problema com as vítimas encontradas.
+
+        Returns:
+            list[list[ChavePosicao]]: vítimas de cada socorrista, na ordem dos socorristas.
+        """
+        n_grupos = len(self.resgatistas)
+        chaves = list(problema.sinais_vitais_vitimas)
+        if n_grupos == 1 or len(chaves) <= n_grupos:
+            grupos = [[] for _ in range(n_grupos)]
+            for indice, chave in enumerate(chaves):
+                grupos[indice % n_grupos].append(chave)
+            return grupos
+
+        posicoes = np.array(chaves, dtype=np.float64)
+        rng = np.random.default_rng(self.rng.getrandbits(64))
+
+        # Inicialização k-means++: centros afastados entre si
+        centros = [posicoes[rng.integers(len(posicoes))]]
+        for _ in range(1, n_grupos):
+            distancias = np.min(
+                [np.sum((posicoes - centro) ** 2, axis=1) for centro in centros], axis=0
+            )
+            centros.append(posicoes[rng.choice(len(posicoes), p=distancias / distancias.sum())])
+        centros = np.array(centros)
+
+        grupo = np.full(len(posicoes), -1)
+        for _ in range(Coordenador.MAX_ITERACOES):
+            distancias = np.sum((posicoes[:, None, :] - centros[None, :, :]) ** 2, axis=2)
+            novo_grupo = np.argmin(distancias, axis=1)
+            if np.array_equal(novo_grupo, grupo):
+                break
+            grupo = novo_grupo
+            for indice in range(n_grupos):
+                membros = posicoes[grupo == indice]
+                # Grupo vazio: recomeça na vítima mais distante do seu centro
+                if len(membros) == 0:
+                    centros[indice] = posicoes[np.argmax(np.min(distancias, axis=1))]
+                else:
+                    centros[indice] = membros.mean(axis=0)
+
+        return [[chave for chave, g in zip(chaves, grupo) if g == indice] for indice in range(n_grupos)]
@@ -6,11 +6,13 @@
 #PLANOS POSSÍVEIS PARA O AGENTE EXPLORADOR
 from agentes.explorador.planos.aleatorio import PlanoAleatorio
 from agentes.explorador.planos.exploracao_dfs import ExploracaoDFS
+from agentes.explorador.planos.exploracao_fronteira import ExploracaoFronteira
 from agentes.explorador.planos.retorno import PlanoRetornoBase
 
 # PROBLEMA A SER DESENVOLVIDO PELO AGENTE EXPLORADOR
 from agentes.utils.problema import Problema
-from agentes.utils.estado import Estado
+from agentes.utils.estado import Estado, Passo, CHAVE_BASE
+from agentes.utils import movimentos
 
 from abstract_agent import AbstractAgent
 from physical_agent import PhysAgent
@@ -21,13 +23,32 @@ class Explorer(AbstractAgent):
     """Classe que define um agente explorador no ambiente e suas deliberações.
     """
 
-    def __init__(self, env, config_file: str, resc: Rescuer):
+    # Planos de exploração às cegas disponíveis
+    PLANOS_EXPLORACAO = {
+        'dfs': ExploracaoDFS,
+        'fronteira': ExploracaoFronteira,
+        'aleatorio': PlanoAleatorio,
+    }
+
+    def __init__(
+            self,
+            env,
+            config_file: str,
+            resc: Rescuer,
+            plano: str = 'dfs',
+            setor: tuple[float, float] = None
+        ):
         """Construtor do agente explorador.
 
         Args:
             env (_type_): referencia ao ambiente em que os agentes estão situados.
             config_file (str): path absoluto para arquivos de configuração do explorador.
-            resc (Rescuer): referência ao agente de resgate para poder acordá-lo.
+            resc (Rescuer): referência ao agente de resgate (ou ao Coordenador da equipe)
+                para poder acordá-lo.
+            plano (str, optional): plano de exploração (chave de PLANOS_EXPLORACAO).
+                Default: 'dfs'.
+            setor (tuple[float, float], optional): setor angular em torno da base a ser
+                priorizado (apenas no plano 'fronteira'). Default: None, o mapa todo.
         """
         self.body: PhysAgent
         super().__init__(env, config_file)
@@ -45,9 +66,11 @@ class Explorer(AbstractAgent):
         self.problema: Problema = Problema()
 
         # Instancia o plano de exploração às cegas
-        # self.plano_aleatorio = PlanoAleatorio()
-        self.plano_aleatorio = ExploracaoDFS()
-        # Instancia o plano de retorno à base (A*)
+        if plano == 'fronteira':
+            self.plano_aleatorio = ExploracaoFronteira(self.rng, setor)
+        else:
+            self.plano_aleatorio = Explorer.PLANOS_EXPLORACAO[plano](self.rng)
+        # Instancia o plano de retorno à base (campo de custos do problema)
         self.plano_retorno_base = PlanoRetornoBase()
 
     def deliberate(self) -> bool:
@@ -67,7 +90,7 @@ class Explorer(AbstractAgent):
             self.flag_exploracao_ativa = False
 
         if (not self.flag_exploracao_ativa
-            and self.estado_atual.get_chave_posicao() == '0:0'
+            and self.estado_atual.get_chave_posicao() == CHAVE_BASE
         ):
             # time to wake up the rescuer and pass the walls and the victims (here, they're empty)
             print(f"{self.NAME} I believe I've remaining time of {self.rtime:.1f}")
@@ -81,7 +104,7 @@ class Explorer(AbstractAgent):
                 self.estado_atual
             )
             if type(passo_atual) == bool:
-                passo_atual = {'linha': 0, 'coluna': 0}
+                passo_atual = movimentos.PASSO_NULO
                 self.flag_exploracao_ativa = False
 
             # Adiciona o passo_atual ao histórico de passos realizados
@@ -91,8 +114,8 @@ class Explorer(AbstractAgent):
 
         # Movimenta o explorador para outra posição
         result = self.body.walk(
-            dy = passo_atual['linha'],
-            dx = passo_atual['coluna']
+            dy = passo_atual.linha,
+            dx = passo_atual.coluna
         )
 
         self.__atualiza_tempo_restante(passo_atual)
@@ -100,7 +123,7 @@ class Explorer(AbstractAgent):
         # Test the result of the walk action
         if result == PhysAgent.BUMPED:
             condicao_posicao_atual = 'w'
-            self.plano_aleatorio.unbacktracked.pop()
+            self.plano_aleatorio.registra_colisao(passo_atual)
             explorador_movimentou = False
 
         if result == PhysAgent.EXECUTED:
@@ -152,16 +175,15 @@ class Explorer(AbstractAgent):
 
         return True
 
-    def __atualiza_estado_atual(self, passo_realizado: dict[str, int]) -> None:
+    def __atualiza_estado_atual(self, passo_realizado: Passo) -> None:
         """Atualiza o estado atual do explorador para ele mesmo.
 
         Args:
-            passo_realizado (dict[str, int]): variação da posição para linha e coluna.
+            passo_realizado (Passo): variação da posição para linha e coluna.
         """
-        self.estado_atual.linha += passo_realizado['linha']
-        self.estado_atual.coluna += passo_realizado['coluna']
+        self.estado_atual = self.estado_atual.desloca(passo_realizado)
 
-    def __atualiza_tempo_restante(self, passo_atual: dict) -> None:
+    def __atualiza_tempo_restante(self, passo_atual: Passo) -> None:
         """Faz a atualização do tempo restante conforme a movimentação decidida
             pelo explorador.
 
@@ -169,9 +191,9 @@ class Explorer(AbstractAgent):
         - Custo de tempo de movimentos nas diagonais depende do ambiente.
 
         Args:
-            passo_atual (dict): variação das posições nos eixos x e y.
+            passo_atual (Passo): variação das posições nos eixos x e y.
         """
-        if passo_atual['linha'] != 0 and passo_atual['coluna'] != 0:
+        if passo_atual.eh_diagonal():
             self.rtime -= self.COST_DIAG
         else:
             self.rtime -= self.COST_LINE
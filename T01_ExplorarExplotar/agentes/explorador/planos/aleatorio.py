@@ -1,6 +1,7 @@
-from random import choice
-from agentes.utils.estado import Estado
+from random import Random
+from agentes.utils.estado import Estado, Passo
 from agentes.utils.problema import Problema
+from agentes.utils import movimentos
 
 
 class PlanoAleatorio():
@@ -8,36 +9,27 @@ class PlanoAleatorio():
         para sua exploração sem informações do ambiente.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, rng: Random = None) -> None:
         """Define o plano aleatório tendo como base a posição inicial do agente.
 
         Args:
-            estado_atual (Estado, optional): Estado inicial do agente. Default: Estado(0, 0).
+            rng (Random, optional): gerador aleatório do agente. Default: Random() sem semente.
         """
+        self.rng = rng if rng is not None else Random()
+
         # Variávies associadas ao plano
         self.passos_anteriores: list[Estado] = []
+        # Oeste, Norte, Sul e Leste; depois Noroeste, Sudoeste, Sudeste e Nordeste
         self.direcoes_possiveis_cruz = {
-            'O': {'linha': 0, 'coluna': -1},      # Oeste
-            'N': {'linha': -1, 'coluna': 0},      # Norte
-            'S': {'linha': 1, 'coluna': 0},       # Sul
-            'L': {'linha': 0, 'coluna': 1}       # Leste
-        }
-        self.direcoes_possiveis_todas = {
-            'O': {'linha': 0, 'coluna': -1},      # Oeste
-            'N': {'linha': -1, 'coluna': 0},      # Norte
-            'S': {'linha': 1, 'coluna': 0},       # Sul
-            'L': {'linha': 0, 'coluna': 1},       # Leste
-            'NO': {'linha': -1, 'coluna': -1},    # Noroeste
-            'SO': {'linha': 1, 'coluna': -1},     # Sudoeste
-            'SD': {'linha': 1, 'coluna': 1},      # Sudeste
-            'ND': {'linha': -1, 'coluna': 1}     # Noreste
+            direcao: movimentos.PASSOS[direcao] for direcao in movimentos.DIRECOES_CRUZ
         }
+        self.direcoes_possiveis_todas = movimentos.PASSOS
 
     def escolhe_variacao_posicao(
             self,
             problema_atual: Problema,
             estado_atual: Estado
-     ) -> dict[str, int]:
+     ) -> Passo:
         """Decide qual a variação da posição em cada eixo da posição do explorador.
 
         Args:
@@ -45,17 +37,18 @@ class PlanoAleatorio():
             estado_atual (Estado): usado para calcular as possíveis próximas posições.
         """
         # Lista com as direções que a partir da posição atual resultam em posições não visitadas
+        mapa = problema_atual.mapa_crencas
         direcoes_nao_visitadas = [
             direcao for direcao, passo_direcao in self.direcoes_possiveis_cruz.items()
-            if (problema_atual.verifica_estado_inedito(
-                    self.__calcula_proximo_estado(estado_atual, passo_direcao)
-                )
+            if mapa.eh_desconhecida(
+                estado_atual.linha + passo_direcao.linha,
+                estado_atual.coluna + passo_direcao.coluna
             )
         ]
 
         # Escolhe entre as direções que resultam em posições que ainda não foram visitadas
         if direcoes_nao_visitadas:
-            direcao_escolhida = choice(direcoes_nao_visitadas)
+            direcao_escolhida = self.rng.choice(direcoes_nao_visitadas)
         # Caso não tenha posição não visitada, escolhe qualquer uma entre todas
         else:
             direcao_escolhida = self.__escolhe_direcao_possivel_todas_escolhidas()
@@ -63,19 +56,12 @@ class PlanoAleatorio():
         # Retorna o passo escolhido para executar a movimentação
         return self.direcoes_possiveis_todas[direcao_escolhida]
 
-    def __calcula_proximo_estado(self, estado_atual: Estado, passo: dict[str, int]) -> Estado:
-        """Efetua o cálculo para o agente verificar qual será a sua nova posição no mapa.
+    def registra_colisao(self, passo: Passo) -> None:
+        """O plano aleatório não guarda estado dos passos, nada a desfazer na colisão.
 
         Args:
-            passo (dict[str, int]): passo que o agente tenta relizar.
-
-        Returns:
-            Estado: a sua nova posição caso o passo seja bem sucedido.
+            passo (Passo): passo que resultou em colisão.
         """
-        estado_futuro = Estado()
-        estado_futuro.linha = estado_atual.linha + passo['linha']
-        estado_futuro.coluna = estado_atual.coluna + passo['coluna']
-        return estado_futuro
 
     def __escolhe_direcao_possivel_todas_escolhidas(self) -> str:
         """Escolhe uma direção entre as direções possíveis quando
@@ -91,5 +77,4 @@ class PlanoAleatorio():
         # TODO: evitar paredes
         # TODO: busca nas posições adjacentes...
 
-        lista_keys_direcoes_possiveis = list(self.direcoes_possiveis_todas.keys())
-        return choice(lista_keys_direcoes_possiveis)
+        return self.rng.choice(movimentos.DIRECOES_CRUZ + movimentos.DIRECOES_DIAGONAIS)
@@ -1,28 +1,31 @@
-from random import randint
-from random import choice
-from agentes.utils.estado import Estado
+from random import Random
+from agentes.utils.estado import Estado, Passo
 from agentes.utils.problema import Problema
+from agentes.utils import movimentos
 
 class ExploracaoDFS:
     """Representa o plano de execução aleatório do agente explorador
         para sua exploração sem informações do ambiente.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, rng: Random = None) -> None:
         """Define o plano aleatório tendo como base a posição inicial do agente.
+
+        Args:
+            rng (Random, optional): gerador aleatório do agente. Default: Random() sem semente.
         """
+        self.rng = rng if rng is not None else Random()
+
         # Estados relacionados ao plano (inicial e atual)
         # self.estado_inicial = estado_inicial
         # self.estado_atual = estado_atual
-        # self.passo_realizado = {'linha': 0, 'coluna': 0}
+        # self.passo_realizado = movimentos.PASSO_NULO
 
         # Variávies associadas ao plano
         self.passos_anteriores: list[Estado] = []
+        # Oeste, Norte, Sul e Leste
         self.direcoes_possiveis = {
-            'O': {'linha': 0, 'coluna': -1},      # Oeste
-            'N': {'linha': -1, 'coluna': 0},      # Norte
-            'S': {'linha': 1, 'coluna': 0},       # Sul
-            'L': {'linha': 0, 'coluna': 1},       # Leste
+            direcao: movimentos.PASSOS[direcao] for direcao in movimentos.DIRECOES_CRUZ
         }
 
         # Estrutura do problema
@@ -37,7 +40,7 @@ class ExploracaoDFS:
             self,
             problema_atual: Problema,
             estado_atual: Estado
-        ) -> dict[str, int]:
+        ) -> Passo:
         """Decide qual a variação da posição em cada eixo da posição do explorador.
 
         Args:
@@ -50,11 +53,11 @@ class ExploracaoDFS:
 
         # Escolhe entre as direções que resultam em posições que ainda não foram visitadas
         if direcoes_nao_visitadas:
-            rand = randint(0, len(direcoes_nao_visitadas)-1)
+            rand = self.rng.randint(0, len(direcoes_nao_visitadas)-1)
             direcao_escolhida = direcoes_nao_visitadas[rand]
             self.unbacktracked.append(direcao_escolhida)
             direcoes_nao_visitadas.pop(rand)
-            self.untried[str(estado_atual)] = direcoes_nao_visitadas
+            self.untried[estado_atual.get_chave_posicao()] = direcoes_nao_visitadas
             # print(direcoes_nao_visitadas)
             # print(self.unbacktracked)
         # Caso não tenha posição não visitada, escolhe qualquer uma entre todas
@@ -73,29 +76,16 @@ class ExploracaoDFS:
         # Retorna o passo escolhido para executar a movimentação
         return self.direcoes_possiveis[direcao_escolhida]
     
-    def escolhe_direcao_oposta(self, ultima_direcao):
-        if ultima_direcao == 'O':
-            return 'L'
-        if ultima_direcao == 'L':
-            return 'O'
-        if ultima_direcao == 'N':
-            return 'S'
-        if ultima_direcao == 'S':
-            return 'N'
-
-    def __calcula_proximo_estado(self, estado_atual: Estado, passo: dict[str, int]) -> Estado:
-        """Efetua o cálculo para o agente verificar qual será a sua nova posição no mapa.
+    def registra_colisao(self, passo: Passo) -> None:
+        """Desfaz o empilhamento da direção que resultou em colisão.
 
         Args:
-            passo (dict[str, int]): passo que o agente tenta relizar.
-
-        Returns:
-            Estado: a sua nova posição caso o passo seja bem sucedido.
+            passo (Passo): passo que resultou em colisão.
         """
-        estado_futuro = Estado()
-        estado_futuro.linha = estado_atual.linha + passo['linha']
-        estado_futuro.coluna = estado_atual.coluna + passo['coluna']
-        return estado_futuro
+        self.unbacktracked.pop()
+
+    def escolhe_direcao_oposta(self, ultima_direcao):
+        return movimentos.DIRECAO_OPOSTA[ultima_direcao]
 
     def __escolhe_direcao_possivel_todas_escolhidas(self, estado_atual: Estado, problema: Problema) -> list:
         """Escolhe uma direção entre as direções possíveis quando
@@ -111,11 +101,12 @@ class ExploracaoDFS:
         # TODO: evitar paredes
         # TODO: busca nas posições adjacentes...
 
+        mapa = problema.mapa_crencas
         direcoes_nao_visitadas = [
             direcao for direcao, passo_direcao in self.direcoes_possiveis.items()
-            if (problema.verifica_estado_inedito(
-                    self.__calcula_proximo_estado(estado_atual, passo_direcao)
-                )
+            if mapa.eh_desconhecida(
+                estado_atual.linha + passo_direcao.linha,
+                estado_atual.coluna + passo_direcao.coluna
             )
         ]
 
@@ -0,0 +1,234 @@
+import math
+import heapq
+from random import Random
+import numpy as np
+from agentes.utils.estado import Estado, Passo, ChavePosicao, CHAVE_BASE
+from agentes.utils.problema import Problema
+from agentes.utils.mapa_crencas import MapaCrencas
+from agentes.utils import movimentos
+
+
+class ExploracaoFronteira:
+    """Representa o plano de exploração por fronteiras do agente explorador.
+
+    - A fronteira são as posições livres conhecidas com vizinhas ainda desconhecidas;
+    - Estando na fronteira, o agente dá um passo (8 direções) para uma vizinha desconhecida,
+        a mais rodeada por posições conhecidas, o que varre o mapa sem deixar ilhas para trás;
+    - Caso contrário, escolhe a posição da fronteira com a maior utilidade (vizinhas
+        desconhecidas por custo do caminho) e vai até ela pelo grafo já conhecido;
+    - Com um setor (equipes de exploradores), as posições fora dele têm a utilidade
+        reduzida e só são exploradas quando o setor não oferece nada melhor.
+    """
+
+    # No máximo 8 vizinhas desconhecidas, o que limita a utilidade de qualquer posição
+    MAX_INFORMACAO = 8
+
+    # Peso da utilidade das posições fora do setor do explorador
+    PESO_FORA_SETOR = 0.1
+
+    def __init__(self, rng: Random = None, setor: tuple[float, float] = None) -> None:
+        """Define o plano de exploração por fronteiras.
+
+        Args:
+            rng (Random, optional): gerador aleatório do agente. Default: Random() sem semente.
+            setor (tuple[float, float], optional): ângulos (radianos, atan2(linha, coluna))
+                inicial e final do setor do explorador em torno da base. Default: None, o mapa todo.
+        """
+        self.rng = rng if rng is not None else Random()
+        self.setor = setor
+
+        # Variávies associadas ao plano
+        self.passos_anteriores: list[Passo] = []
+        self.direcoes_cruz = [movimentos.PASSOS[direcao] for direcao in movimentos.DIRECOES_CRUZ]
+        self.direcoes_diagonais = [
+            movimentos.PASSOS[direcao] for direcao in movimentos.DIRECOES_DIAGONAIS
+        ]
+
+        # Caminho até a posição da fronteira escolhida (a próxima posição é a última)
+        self.caminho: list[ChavePosicao] = []
+        # Indica se o explorador está na fronteira escolhida (ou explorando a partir dela)
+        self.no_alvo: bool = True
+
+    def escolhe_variacao_posicao(
+            self,
+            problema_atual: Problema,
+            estado_atual: Estado
+        ) -> Passo | bool:
+        """Decide qual a variação da posição em cada eixo da posição do explorador.
+
+        Args:
+            problema_atual (Problema): crenças e grafo das posições conhecidas.
+            estado_atual (Estado): posição atual do explorador.
+
+        Returns:
+            Passo | bool: passo para linha e coluna, True se não há mais fronteira.
+        """
+        mapa = problema_atual.mapa_crencas
+
+        # Na fronteira: passo para a vizinha desconhecida mais próxima da parte já
+        # conhecida do mapa (menos vizinhas desconhecidas), preferindo os passos mais baratos
+        for direcoes in (self.direcoes_cruz, self.direcoes_diagonais):
+            desconhecidas = [
+                passo for passo in direcoes
+                if mapa.eh_desconhecida(
+                    estado_atual.linha + passo.linha,
+                    estado_atual.coluna + passo.coluna
+                )
+            ]
+            # Fora do setor, só explora a partir da fronteira escolhida
+            if desconhecidas and self.setor is not None:
+                no_setor = [
+                    passo for passo in desconhecidas
+                    if self.__esta_no_setor(
+                        (estado_atual.linha + passo.linha, estado_atual.coluna + passo.coluna)
+                    )
+                ]
+                if no_setor:
+                    desconhecidas = no_setor
+                elif not self.no_alvo:
+                    desconhecidas = []
+
+            if desconhecidas:
+                self.caminho = []
+                self.no_alvo = True
+                qtd_desconhecidas = [
+                    self.__qtd_vizinhas_desconhecidas(
+                        problema_atual,
+                        (estado_atual.linha + passo.linha, estado_atual.coluna + passo.coluna)
+                    )
+                    for passo in desconhecidas
+                ]
+                menor_qtd = min(qtd_desconhecidas)
+                return self.rng.choice([
+                    passo for passo, qtd in zip(desconhecidas, qtd_desconhecidas)
+                    if qtd == menor_qtd
+                ])
+
+        # Segue o caminho até a fronteira escolhida enquanto ela ainda é fronteira
+        if not (self.caminho and self.__eh_fronteira(problema_atual, self.caminho[0])):
+            self.caminho = self.__escolhe_fronteira(problema_atual, estado_atual.get_chave_posicao())
+            if not self.caminho:
+                return True
+            self.no_alvo = False
+
+        proxima_posicao = self.caminho.pop()
+        if not self.caminho:
+            self.no_alvo = True
+        return movimentos.obtem_passo(
+            proxima_posicao[0] - estado_atual.linha,
+            proxima_posicao[1] - estado_atual.coluna
+        )
+
+    def registra_colisao(self, passo: Passo) -> None:
+        """Trata a colisão do último passo: a posição passa a ser parede nas crenças
+            e deixa de ser desconhecida, então não há estado do plano a desfazer.
+
+        Args:
+            passo (Passo): passo que resultou em colisão.
+        """
+        self.caminho = []
+
+    def __qtd_vizinhas_desconhecidas(self, problema: Problema, posicao: ChavePosicao) -> int:
+        """Retorna quantas das 8 vizinhas da posição são desconhecidas."""
+        mapa = problema.mapa_crencas
+        linha, coluna = posicao
+        return sum(
+            mapa.eh_desconhecida(linha + var_linha, coluna + var_coluna)
+            for var_linha, var_coluna in movimentos.VARIACOES
+        )
+
+    def __esta_no_setor(self, posicao: ChavePosicao) -> bool:
+        """Verifica se a posição está no setor do explorador (a base está em todos)."""
+        if self.setor is None or posicao == CHAVE_BASE:
+            return True
+        angulo = math.atan2(posicao[0], posicao[1])
+        return self.setor[0] <= angulo <= self.setor[1]
+
+    def __eh_fronteira(self, problema: Problema, posicao: ChavePosicao) -> bool:
+        """Verifica se a posição conhecida tem alguma vizinha desconhecida."""
+        return self.__qtd_vizinhas_desconhecidas(problema, posicao) > 0
+
+    def __escolhe_fronteira(
+            self,
+            problema: Problema,
+            chave_posicao_atual: ChavePosicao
+        ) -> list[ChavePosicao]:
+        """Escolhe a posição da fronteira de maior utilidade por Dijkstra a partir da
+            posição atual nas posições livres conhecidas.
+
+        - A busca corre sobre os índices planos da grade das crenças com uma borda de
+            células desconhecidas: as vizinhas ficam a deslocamentos constantes (módulo
+            movimentos) e nunca saem da grade;
+        - O código de cada célula é lido só quando ela é alcançada, sem converter a grade;
+        - A utilidade é a quantidade de vizinhas desconhecidas dividida pelo custo do caminho;
+        - A busca para quando nenhuma posição mais distante pode superar a melhor utilidade.
+
+        Args:
+            problema (Problema): crenças e grafo das posições conhecidas.
+            chave_posicao_atual (ChavePosicao): posição de partida.
+
+        Returns:
+            list[ChavePosicao]: caminho até a fronteira escolhida, da fronteira até a próxima
+                posição, ou lista vazia se não há fronteira alcançável.
+        """
+        mapa = problema.mapa_crencas
+        colunas = mapa.celulas.shape[1] + 2
+        # Cópia da grade com a borda (um memcpy de int8); memoryview lê inteiros Python
+        grade = memoryview(np.pad(mapa.celulas, 1).ravel())
+        deslocamentos = movimentos.deslocamentos_planos(colunas)
+        custos_passos = movimentos.CUSTOS
+        desconhecida = MapaCrencas.DESCONHECIDA
+        parede = MapaCrencas.PAREDE
+
+        origem = (
+            (chave_posicao_atual[0] + mapa.origem_linha + 1) * colunas
+            + chave_posicao_atual[1] + mapa.origem_coluna + 1
+        )
+        custos = {origem: 0.0}
+        celula_anterior = {origem: None}
+        fila = [(0.0, origem)]
+        melhor_utilidade = 0.0
+        melhor_celula = None
+
+        while fila:
+            custo, celula = heapq.heappop(fila)
+            if custo > custos[celula]:
+                continue
+            if custo > 0 and ExploracaoFronteira.MAX_INFORMACAO / custo <= melhor_utilidade:
+                break
+
+            if custo > 0:
+                qtd_desconhecidas = 0
+                for deslocamento in deslocamentos:
+                    if grade[celula + deslocamento] == desconhecida:
+                        qtd_desconhecidas += 1
+                if qtd_desconhecidas > 0:
+                    utilidade = qtd_desconhecidas / custo
+                    if not self.__esta_no_setor(self.__chave_celula(mapa, celula)):
+                        utilidade *= ExploracaoFronteira.PESO_FORA_SETOR
+                    if utilidade > melhor_utilidade:
+                        melhor_utilidade = utilidade
+                        melhor_celula = celula
+
+            for deslocamento, custo_passo in zip(deslocamentos, custos_passos):
+                vizinha = celula + deslocamento
+                codigo = grade[vizinha]
+                if codigo == desconhecida or codigo == parede:
+                    continue
+                novo_custo = custo + custo_passo
+                if novo_custo < custos.get(vizinha, float('inf')):
+                    custos[vizinha] = novo_custo
+                    celula_anterior[vizinha] = celula
+                    heapq.heappush(fila, (novo_custo, vizinha))
+
+        caminho = []
+        celula = melhor_celula
+        while celula is not None and celula != origem:
+            caminho.append(self.__chave_celula(mapa, celula))
+            celula = celula_anterior[celula]
+        return caminho
+
+    def __chave_celula(self, mapa: MapaCrencas, celula: int) -> ChavePosicao:
+        """Converte o índice plano de uma célula da grade com borda na posição relativa à base."""
+        i, j = divmod(celula, mapa.celulas.shape[1] + 2)
+        return (i - 1 - mapa.origem_linha, j - 1 - mapa.origem_coluna)
@@ -1,5 +1,6 @@
-from random import choice, random, randint
+from random import Random
 from tqdm import tqdm
+import numpy as np
 from agentes.resgate.planos.otimizador_genetico.individuo import Individuo
 
 
@@ -7,15 +8,17 @@ class AlgoritmoGenetico:
     def __init__(
             self,
             probabilidade_eventos: dict[str, float],
-            caminhos: dict[str, dict[str, list[tuple[str, int]]]],
-            vitimas: dict[str, list[str]],
-            tempo_disponivel: float
+            custos: np.ndarray,
+            gravidades: list[int],
+            tempo_disponivel: float,
+            rng: Random = None
         ) -> None:
+        self.rng = rng if rng is not None else Random()
         self.probabilidade_eventos = probabilidade_eventos
-        self.caminhos = caminhos
-        self.vitimas = vitimas
+        self.custos = custos
+        self.gravidades = gravidades
         self.tempo_disponivel = tempo_disponivel
-        self.max_subcaminhos = len(self.vitimas.keys()) + 1
+        self.max_subcaminhos = len(self.custos)
 
     def aplica_mutacao(self, individuo: Individuo) -> Individuo:
         """Aplica a mutação em uma das características mutáveis do indivíduo.
@@ -27,10 +30,10 @@ class AlgoritmoGenetico:
             Individuo: Indivíduo com a mutação aplicada.
         """
         # Escolhe um parâmetro aleatório dentro dos parâmetros possíveis.
-        parametro_mutacao = choice(list(individuo.parametros_possiveis.keys()))
+        parametro_mutacao = self.rng.choice(list(individuo.parametros_possiveis.keys()))
 
         # Faz a mutacao em cima do parâmetro escolhido
-        individuo.genes[parametro_mutacao] = choice(
+        individuo.genes[parametro_mutacao] = self.rng.choice(
             individuo.parametros_possiveis[parametro_mutacao]
         )
         if 'gravidade' in parametro_mutacao:
@@ -57,17 +60,17 @@ class AlgoritmoGenetico:
 
             # Escolhe aleatoriamente características para o filho.
             for param in pai.parametros_possiveis:
-                caracteristicas_filho[param] = choice([mae.genes[param], pai.genes[param]])
+                caracteristicas_filho[param] = self.rng.choice([mae.genes[param], pai.genes[param]])
 
             # Gera um filho com uma nova sequência de sub-caminhos aleatório
-            filho = Individuo(self.caminhos, self.tempo_disponivel, self.max_subcaminhos)
+            filho = Individuo(self.custos, self.tempo_disponivel, self.max_subcaminhos, self.rng)
             filho.gera_individuo_aleatorio()
 
             # Atribui as características de peso dos pais para a função de fitness do filho
             filho.set_caracteristicas(caracteristicas_filho)
 
             # Avalia a pontuação deste indivíduo
-            filho.avalia_individuo(self.vitimas)
+            filho.avalia_individuo(self.gravidades)
 
             # Se a pontuação do filho for menor que a dos pais, descarta o trajeto do filho
             if filho.pontuacao < pai.pontuacao and filho.pontuacao < mae.pontuacao:
@@ -79,7 +82,7 @@ class AlgoritmoGenetico:
                 filho.set_trajeto(trajeto)
 
             # Chance de mutação dos parâmetros de modo aleatório.
-            if self.probabilidade_eventos['chance_mutacao'] > random():
+            if self.probabilidade_eventos['chance_mutacao'] > self.rng.random():
                 filho = self.aplica_mutacao(filho)
 
             # Insere o filho gerado na lista de filhos destes pais
@@ -96,6 +99,35 @@ class AlgoritmoGenetico:
         Returns:
              list[Individuo]: lista de indivíduos (população) evoluída.
         """
+        individuos_geradores = self.seleciona_geradores(populacao)
+
+        # Quantidade de crianças que devem ser geradas
+        qtd_individuos_desejada = len(populacao) - len(individuos_geradores)
+
+        print("GERANDO FILHOS PARA GERAÇÃO SEGUINTE")
+        barra_progresso = tqdm(total = qtd_individuos_desejada)
+        individuos_filhos = self.gera_filhos(
+            individuos_geradores,
+            qtd_individuos_desejada,
+            barra_progresso
+        )
+        barra_progresso.close()
+
+        # Inclui os filhos gerados na nova população
+        individuos_geradores.extend(individuos_filhos)
+
+        # Retorna a população evoluída
+        return individuos_geradores
+
+    def seleciona_geradores(self, populacao: list[Individuo]) -> list[Individuo]:
+        """Seleciona os indivíduos que são mantidos e geram os filhos da próxima geração.
+
+        Args:
+            populacao (list[Individuo]): lista de indivíduos avaliados da população.
+
+        Returns:
+            list[Individuo]: os melhores indivíduos e alguns dos outros, sorteados.
+        """
         # Obtém a pontuacao para cada um dos individuos da população
         pontuacao_individuos = [
             {'pontuacao': individuo.pontuacao, 'individuo': individuo}
@@ -122,21 +154,35 @@ class AlgoritmoGenetico:
 
         # Aleatoriamente mantém alguns daqueles que foram descartados
         for individuo in individuos_ordenados[qtd_individuos_mantidos:]:
-            if self.probabilidade_eventos['chace_selecao_aleatoria'] > random():
+            if self.probabilidade_eventos['chace_selecao_aleatoria'] > self.rng.random():
                 individuos_geradores.append(individuo)
 
-        # Quantidade de crianças que devem ser geradas
+        return individuos_geradores
+
+    def gera_filhos(
+            self,
+            individuos_geradores: list[Individuo],
+            qtd_individuos_desejada: int,
+            barra_progresso: tqdm = None
+        ) -> list[Individuo]:
+        """Cruza pares aleatórios de indivíduos geradores até obter a quantidade de filhos.
+
+        Args:
+            individuos_geradores (list[Individuo]): indivíduos selecionados para gerar filhos.
+            qtd_individuos_desejada (int): quantidade de filhos a serem gerados.
+            barra_progresso (tqdm, optional): barra de progresso atualizada a cada filho.
+
+        Returns:
+            list[Individuo]: filhos gerados.
+        """
         qtd_individuos_geradores = len(individuos_geradores)
-        qtd_individuos_desejada = len(populacao) - qtd_individuos_geradores
         individuos_filhos = []
 
-        print("GERANDO FILHOS PARA GERAÇÃO SEGUINTE")
-        barra_progresso = tqdm(total = qtd_individuos_desejada)
         # Cria os filhos com as características dos individuos remanescentes.
         while len(individuos_filhos) < qtd_individuos_desejada:
             # Seleciona dois individuos geradores aleatórios.
-            pos_individuo_pai = randint(0, qtd_individuos_geradores-1)
-            pos_individuo_mae = randint(0, qtd_individuos_geradores-1)
+            pos_individuo_pai = self.rng.randint(0, qtd_individuos_geradores-1)
+            pos_individuo_mae = self.rng.randint(0, qtd_individuos_geradores-1)
 
             # Verifica se os individuos são diferentes
             if pos_individuo_pai != pos_individuo_mae:
@@ -150,13 +196,10 @@ class AlgoritmoGenetico:
                 for filho in filhos:
                     if len(individuos_filhos) < qtd_individuos_desejada:
                         individuos_filhos.append(filho)
-                        barra_progresso.update(1)
-        barra_progresso.close()
-        # Inclui os filhos gerados na nova população
-        individuos_geradores.extend(individuos_filhos)
+                        if barra_progresso is not None:
+                            barra_progresso.update(1)
 
-        # Retorna a população evoluída
-        return individuos_geradores
+        return individuos_filhos
 
     def gera_populacao_aleatoria(self, qtd_individuos: int) -> list[Individuo]:
         """Gera uma população de indivíduos com trajetos aleatorios.
@@ -171,7 +214,7 @@ class AlgoritmoGenetico:
         print("GERANDO INDIVIDUOS ALEATÓRIOS")
         barra_progresso = tqdm(total = qtd_individuos)
         for _ in range(qtd_individuos):
-            individuo = Individuo(self.caminhos, self.tempo_disponivel, self.max_subcaminhos)
+            individuo = Individuo(self.custos, self.tempo_disponivel, self.max_subcaminhos, self.rng)
             individuo.gera_individuo_aleatorio()
             populacao_gerada.append(individuo)
             individuo = None
@@ -1,24 +1,30 @@
-from random import choice
-from copy import deepcopy
+from random import Random
+import numpy as np
+
+# Índice da base dos agentes nas posições chave (as vítimas são os índices 1 a V)
+INDICE_BASE = 0
 
 
 class Individuo:
     def __init__(
             self,
-            caminhos: dict[str, dict[str, list[tuple[str, int]]]],
+            custos: np.ndarray,
             tempo_restante: float,
-            max_subcaminhos: int
+            max_subcaminhos: int,
+            rng: Random = None
         ) -> None:
+        self.rng = rng if rng is not None else Random()
         self.tempo_restante: float = tempo_restante
         self.max_subcaminhos: int = max_subcaminhos
         self.qtd_subcaminhos: int = 0
         self.pontuacao: int = 0
-        self.caminhos = caminhos
+        # Matriz (V + 1) x (V + 1) dos custos dos sub-caminhos entre as posições chave
+        self.custos = custos
         self.caminhos_possiveis = []
         self.ja_visitados = []
 
         # GENES E INFORMAÇÕES CARACTERÍSTICAS
-        self.genes: dict[str, list[tuple[str, str]] | int] = {
+        self.genes: dict[str, list[tuple[int, int]] | int] = {
             'trajeto': [], # [(origem, destino1), (destino1, destino2), ..., (destino2, origem)]
             'peso_gravidade': 0,
             'peso_custo': 0
@@ -56,35 +62,43 @@ class Individuo:
         self.genes['peso_gravidade'] = caracteristicas['peso_gravidade']
         self.genes['peso_custo'] = caracteristicas['peso_custo']
 
-    def set_trajeto(self, trajeto: list[tuple[str, str]]) -> None:
+    def set_trajeto(self, trajeto: list[tuple[int, int]]) -> None:
         """Atribui a sequência de sub-caminhos para um indivíduo.
 
         Args:
-            trajeto (list[tuple[str, str]]): lista de sub-caminhos a ser atribuída.
+            trajeto (list[tuple[int, int]]): lista de sub-caminhos (índices das posições chave)
+                a ser atribuída.
         """
         self.genes['trajeto'] = trajeto
 
-    def avalia_individuo(self, vitimas: dict[str, list[str]]):
+    def avalia_individuo(self, gravidades: list[int]):
         """Efetua a avaliação de um indivíduo, (aplica sua função de fitness).
 
         Args:
-            vitimas (dict[str, list[str]]): as vítimas conhecidas no ambiente.
+            gravidades (list[int]): classe de gravidade de cada posição chave (a da base
+                não é usada).
         """
         pontuacoes = []
         ordem_salvamento = self.qtd_subcaminhos + 1
-        vitimas_salvas = {}
-
-        for origem, destino in self.genes['trajeto']:
-            if destino in vitimas and destino not in vitimas_salvas:
-                gravidade = int(vitimas[destino][-1])
+        vitimas_salvas = set()
+
+        # Custos de todos os sub-caminhos do trajeto de uma só vez
+        trajeto = self.genes['trajeto']
+        custos_subcaminhos = self.custos[
+            [origem for origem, _ in trajeto],
+            [destino for _, destino in trajeto]
+        ].tolist()
+
+        for (_, destino), custo_subcaminho in zip(trajeto, custos_subcaminhos):
+            if destino != INDICE_BASE and destino not in vitimas_salvas:
+                gravidade = gravidades[destino]
                 gravidade_normalizada = ((4 - gravidade) + 1) * ordem_salvamento
-                vitimas_salvas[destino] = deepcopy(vitimas[destino])
+                vitimas_salvas.add(destino)
                 self.tempo_restante -= 1
             else:
                 gravidade_normalizada = 0
             ordem_salvamento -= 1
 
-            custo_subcaminho = self.__obtem_custo_caminho(origem, destino)
             pontuacao_subcaminho = (
                 (self.genes['peso_gravidade'] * gravidade_normalizada)
                 / (self.genes['peso_custo'] * custo_subcaminho)
@@ -97,7 +111,7 @@ class Individuo:
         cont = 0
         penalidade = 0
         for ordem, percurso in enumerate(self.genes['trajeto']):
-            if percurso[0] == ['0:0'] or percurso[1] == ['0:0']:
+            if percurso[0] == [INDICE_BASE] or percurso[1] == [INDICE_BASE]:
                 penalidade += self.qtd_subcaminhos - ordem + 1
                 cont += 1
 
@@ -118,52 +132,53 @@ class Individuo:
         5. O custo combinado de todos os sub-caminhos realizados deve ser inferior ao
             tempo disponível.
         """
-        chave_posicao_atual = '0:0'
+        posicao_atual = INDICE_BASE
 
-        while self.__tem_caminho_possivel_no_tempo(chave_posicao_atual):
+        while self.__tem_caminho_possivel_no_tempo(posicao_atual):
             if len(self.genes['trajeto']) >= self.max_subcaminhos:
                 break
 
-            if len(self.caminhos_possiveis) > 1:
-                destino_escolhido = choice(self.caminhos_possiveis)
-                if destino_escolhido == '0:0':
+            # Um único destino possível que não é a base também é uma vítima a resgatar
+            if len(self.caminhos_possiveis) > 1 or INDICE_BASE not in self.caminhos_possiveis:
+                destino_escolhido = self.rng.choice(self.caminhos_possiveis)
+                if destino_escolhido == INDICE_BASE:
                     for caminhozinho in self.caminhos_possiveis:
                         if (
-                            caminhozinho != "0:0"
-                            and self.__eh_possivel_ir_e_voltar(chave_posicao_atual, caminhozinho)
+                            caminhozinho != INDICE_BASE
+                            and self.__eh_possivel_ir_e_voltar(posicao_atual, caminhozinho)
                         ):
-                            if '0:0' in self.caminhos_possiveis:
-                                self.caminhos_possiveis.remove('0:0')
-                            while destino_escolhido == '0:0':
-                                destino_escolhido = choice(self.caminhos_possiveis)
+                            if INDICE_BASE in self.caminhos_possiveis:
+                                self.caminhos_possiveis.remove(INDICE_BASE)
+                            while destino_escolhido == INDICE_BASE:
+                                destino_escolhido = self.rng.choice(self.caminhos_possiveis)
                             break
 
-                self.genes['trajeto'].append([chave_posicao_atual, destino_escolhido])
+                self.genes['trajeto'].append([posicao_atual, destino_escolhido])
                 self.tempo_restante -= self.__obtem_custo_caminho(
-                    chave_origem = chave_posicao_atual,
-                    chave_destino = destino_escolhido
+                    origem = posicao_atual,
+                    destino = destino_escolhido
                 )
-                chave_posicao_atual = destino_escolhido
+                posicao_atual = destino_escolhido
                 self.qtd_subcaminhos += 1
-                if chave_posicao_atual != '0:0':
+                if posicao_atual != INDICE_BASE:
                     self.ja_visitados.append(destino_escolhido)
-            elif '0:0' in self.caminhos_possiveis:
+            elif INDICE_BASE in self.caminhos_possiveis:
                 if (self.__eh_possivel_ir_e_voltar(
-                        origem = chave_posicao_atual,
-                        destino = '0:0'
+                        origem = posicao_atual,
+                        destino = INDICE_BASE
                     )
                 ):
-                    self.genes['trajeto'].append([chave_posicao_atual, "0:0"])
+                    self.genes['trajeto'].append([posicao_atual, INDICE_BASE])
                     self.tempo_restante -= self.__obtem_custo_caminho(
-                        chave_origem = chave_posicao_atual,
-                        chave_destino = '0:0'
+                        origem = posicao_atual,
+                        destino = INDICE_BASE
                     )
                     self.qtd_subcaminhos += 1
             else:
                 break
 
             self.caminhos_possiveis = []
-        self.genes['peso_custo'] = choice([
+        self.genes['peso_custo'] = self.rng.choice([
             0.05, 0.1,
             0.15, 0.2,
             0.25, 0.3,
@@ -171,36 +186,38 @@ class Individuo:
         ])
         self.genes['peso_gravidade'] = 1 - self.genes['peso_custo']
 
-    def __tem_caminho_possivel_no_tempo(self, chave_origem: str) -> bool:
+    def __tem_caminho_possivel_no_tempo(self, origem: int) -> bool:
         """Retorna se ainda há algum sub-caminho possível para realizar.
 
-        Leva em consideração a ida até o destino e a volta até a base dos agentes.
+        Leva em consideração a ida até o destino e a volta até a base dos agentes, para
+            todos os destinos de uma vez pela matriz de custos.
 
         Args:
-            chave_origem (str): origem de partida do sub-caminho.
+            origem (int): índice da origem de partida do sub-caminho.
 
         Returns:
             bool: True se é possível ir até o sub-caminho e voltar até a base dos agentes,
                 False caso contrário.
         """
-        for destino in self.caminhos[chave_origem]:
-            if (
-                self.__eh_possivel_ir_e_voltar(chave_origem, destino)
-                and destino not in self.ja_visitados
-            ):
-                self.caminhos_possiveis.append(destino)
+        # O tempo em float64 evita que a comparação arredonde o tempo restante para float32
+        possiveis = (
+            self.custos[origem] + self.custos[:, INDICE_BASE] <= np.float64(self.tempo_restante)
+        )
+        possiveis[origem] = False
+        possiveis[self.ja_visitados] = False
+        self.caminhos_possiveis = np.flatnonzero(possiveis).tolist()
 
         if self.caminhos_possiveis:
             return True
         return False
 
-    def __eh_possivel_ir_e_voltar(self, origem: str, destino: str) -> bool:
+    def __eh_possivel_ir_e_voltar(self, origem: int, destino: int) -> bool:
         """Retorna se, partindo de determinada origem, é possível chegar até o destino
             e, deste destino, retornar até a base dos agentes.
 
         Args:
-            origem (str): origem do sub-caminho.
-            destino (str): destino do sub-caminho.
+            origem (int): índice da origem do sub-caminho.
+            destino (int): índice do destino do sub-caminho.
 
         Returns:
             bool: True se é possível ir até o destino e voltar até a base dos agentes,
@@ -209,27 +226,19 @@ class Individuo:
         if destino == origem:
             return True
         custo_ida = self.__obtem_custo_caminho(origem, destino)
-        custo_volta_base = self.__obtem_custo_caminho(destino, '0:0')
+        custo_volta_base = self.__obtem_custo_caminho(destino, INDICE_BASE)
         if (custo_ida + custo_volta_base) <= self.tempo_restante:
             return True
         return False
 
-    def __obtem_custo_caminho(self, chave_origem: str, chave_destino: str) -> float:
+    def __obtem_custo_caminho(self, origem: int, destino: int) -> float:
         """Retorna o custo de tempo para realizar o sub-caminho pretendido.
 
         Args:
-            chave_origem (str): origem do sub-caminho.
-            chave_destino (str): destino do sub-caminho.
+            origem (int): índice da origem do sub-caminho.
+            destino (int): índice do destino do sub-caminho.
 
         Returns:
             float: custo de tempo para realizar o sub-caminho.
         """
-        if chave_origem == chave_destino:
-            return 0
-
-        custo = 0
-        percurso = self.caminhos[chave_origem][chave_destino]
-
-        custo = sum(posicao[1] for posicao in percurso)
-
-        return custo
+        return float(self.custos[origem, destino])
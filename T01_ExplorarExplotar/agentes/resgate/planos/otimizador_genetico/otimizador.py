@@ -1,10 +1,15 @@
+import os
+from random import Random
 from tqdm import tqdm
+import numpy as np
 from operator import add
 from copy import deepcopy
 from functools import reduce
+from concurrent.futures import ProcessPoolExecutor
 from agentes.utils.problema import Problema
 from agentes.resgate.planos.otimizador_genetico.individuo import Individuo
 from agentes.resgate.planos.otimizador_genetico.algoritmo_genetico import AlgoritmoGenetico
+from agentes.resgate.planos.otimizador_genetico import paralelo
 
 class Otimizador:
     def __init__(
@@ -12,11 +17,25 @@ class Otimizador:
             n_populacao: int,
             n_geracoes: int,
             probabilidade_eventos: dict[str, float],
-            tempo_disponivel: float
+            tempo_disponivel: float,
+            rng: Random = None,
+            n_processos: int = 1
         ) -> None:
+        """
+        Args:
+            n_populacao (int): quantidade de indivíduos da população.
+            n_geracoes (int): quantidade de gerações da evolução.
+            probabilidade_eventos (dict[str, float]): probabilidades dos eventos do algoritmo.
+            tempo_disponivel (float): tempo disponível para o resgate.
+            rng (Random, optional): gerador aleatório do agente. Default: None.
+            n_processos (int, optional): processos que geram e avaliam a população; 1 executa
+                tudo no próprio processo e None usa todos os núcleos. Default: 1.
+        """
+        self.rng = rng if rng is not None else Random()
         self.probabilidade_eventos = probabilidade_eventos
         self.n_populacao = n_populacao
         self.n_geracoes = n_geracoes
+        self.n_processos = n_processos if n_processos is not None else os.cpu_count()
 
         self.tempo_disponivel = tempo_disponivel
 
@@ -26,30 +45,67 @@ class Otimizador:
     def evoluir(
             self,
             problema: Problema,
-            caminhos_possiveis: dict[str, dict[str, list[tuple[str, int]]]]
+            custos: np.ndarray
         ) -> None:
         """Faz a evolução dos indivíduos, isto é, a otimização por meio de algoritmo genético.
 
         Args:
             problema (Problema): instância do problema a ser resolvido.
 
-            caminhos_possiveis (dict[str, dict[str, list[tuple[str, int]]]]): dicionário de
-                caminhos possíveis entre todas as combinações de posições de interesse.
+            custos (np.ndarray): matriz float32 (V + 1) x (V + 1) dos custos dos caminhos entre
+                as posições de interesse: a base (índice 0) e as vítimas na ordem do problema.
         """
+        # Classe de gravidade de cada posição de interesse (a da base não é usada)
+        gravidades = [0] + [
+            int(sinais_vitais[-1]) for sinais_vitais in problema.sinais_vitais_vitimas.values()
+        ]
+
         algoritmo_genetico = AlgoritmoGenetico(
             self.probabilidade_eventos,
-            caminhos_possiveis,
-            problema.sinais_vitais_vitimas,
-            self.tempo_disponivel
+            custos,
+            gravidades,
+            self.tempo_disponivel,
+            self.rng
         )
         print(f"numero de vítimas para salvar: {len(problema.sinais_vitais_vitimas)}")
-        populacao = algoritmo_genetico.gera_populacao_aleatoria(self.n_populacao)
+
+        if self.n_processos > 1:
+            # Os processos recebem os dados do problema uma única vez, na inicialização
+            with ProcessPoolExecutor(
+                max_workers = self.n_processos,
+                initializer = paralelo.inicializa_processo,
+                initargs = (custos, gravidades, self.tempo_disponivel, self.probabilidade_eventos)
+            ) as executor:
+                self.__evoluir_geracoes(algoritmo_genetico, custos, gravidades, executor)
+        else:
+            self.__evoluir_geracoes(algoritmo_genetico, custos, gravidades)
+
+    def __evoluir_geracoes(
+            self,
+            algoritmo_genetico: AlgoritmoGenetico,
+            custos: np.ndarray,
+            gravidades: list[int],
+            executor: ProcessPoolExecutor = None
+        ) -> None:
+        """Gera a população inicial e a evolui pelas gerações.
+
+        Args:
+            algoritmo_genetico (AlgoritmoGenetico): operadores do algoritmo genético.
+            custos (np.ndarray): matriz dos custos dos sub-caminhos entre as posições chave.
+            gravidades (list[int]): classe de gravidade de cada posição de interesse.
+            executor (ProcessPoolExecutor, optional): processos que geram e avaliam os
+                indivíduos; None executa tudo no próprio processo.
+        """
+        if executor is None:
+            populacao = algoritmo_genetico.gera_populacao_aleatoria(self.n_populacao)
+        else:
+            populacao = self.__gera_populacao_paralela(executor, custos)
 
         for geracao in range(1, self.n_geracoes + 1):
             print(f"Geração {geracao} de {self.n_geracoes}")
 
             # Faz a avaliação da população da geração atual
-            self.avalia_populacao(populacao, problema.sinais_vitais_vitimas)
+            self.avalia_populacao(populacao, gravidades, executor)
 
             # Obtém a pontuação média da população atual
             pontuacao_media = self.get_pontuacao_media(populacao)
@@ -73,26 +129,117 @@ class Otimizador:
             # Evolui a geração, exceto se for a última geração.
             if geracao != self.n_geracoes:
                 # Faz a evolução da populacao
-                populacao = algoritmo_genetico.faz_evolucao(populacao)
+                if executor is None:
+                    populacao = algoritmo_genetico.faz_evolucao(populacao)
+                else:
+                    populacao = self.__faz_evolucao_paralela(
+                        executor, algoritmo_genetico, populacao, custos
+                    )
 
         # Descreve o top 5 indivíduos no terminal
         self.__print_modelos(populacao[:5])
 
-    def avalia_populacao(self, populacao: list[Individuo], vitimas: dict[str, list[str]]):
+    def avalia_populacao(
+            self,
+            populacao: list[Individuo],
+            gravidades: list[int],
+            executor: ProcessPoolExecutor = None
+        ):
         """Faz a avaliação de acordo com a função de fitness dos indivíduos para cada indivíduo.
 
         Args:
             populacao (list[Individuo]): lista de indivíduos.
-            vitimas (dict[str, list[str]]): posição e sinais vitais das vítimas.
+            gravidades (list[int]): classe de gravidade de cada posição de interesse.
+            executor (ProcessPoolExecutor, optional): processos entre os quais a população
+                é dividida; None avalia no próprio processo.
         """
+        if executor is not None:
+            fatias = []
+            inicio = 0
+            for qtd_individuos in paralelo.divide_quantidade(len(populacao), self.n_processos):
+                fatias.append(populacao[inicio:inicio + qtd_individuos])
+                inicio += qtd_individuos
+
+            genomas = [[paralelo.para_genoma(individuo) for individuo in fatia] for fatia in fatias]
+            for fatia, pontuacoes in zip(fatias, executor.map(paralelo.avalia_genomas, genomas)):
+                for individuo, pontuacao in zip(fatia, pontuacoes):
+                    individuo.pontuacao = pontuacao
+            return
+
         barra_progresso = tqdm(total=len(populacao))
 
         for individuo in populacao:
-            individuo.avalia_individuo(vitimas)
+            individuo.avalia_individuo(gravidades)
             barra_progresso.update(1)
 
         barra_progresso.close()
 
+    def __gera_populacao_paralela(
+            self,
+            executor: ProcessPoolExecutor,
+            custos: np.ndarray
+        ) -> list[Individuo]:
+        """Gera a população aleatória dividida entre os processos.
+
+        Args:
+            executor (ProcessPoolExecutor): processos que geram os indivíduos.
+            custos (np.ndarray): matriz dos custos dos sub-caminhos entre as posições chave.
+
+        Returns:
+            list[Individuo]: indivíduos aleatórios gerados.
+        """
+        print("GERANDO INDIVIDUOS ALEATÓRIOS")
+        quantidades = paralelo.divide_quantidade(self.n_populacao, self.n_processos)
+        sementes = [self.rng.getrandbits(64) for _ in quantidades]
+        return [
+            paralelo.de_genoma(genoma, custos, self.tempo_disponivel, self.rng)
+            for genomas in executor.map(paralelo.gera_genomas_aleatorios, quantidades, sementes)
+            for genoma in genomas
+        ]
+
+    def __faz_evolucao_paralela(
+            self,
+            executor: ProcessPoolExecutor,
+            algoritmo_genetico: AlgoritmoGenetico,
+            populacao: list[Individuo],
+            custos: np.ndarray
+        ) -> list[Individuo]:
+        """Evolui a população com os filhos gerados entre os processos.
+
+        A seleção dos geradores é feita neste processo; cada processo recebe os genomas
+            dos geradores e cruza uma parte dos filhos com a própria semente.
+
+        Args:
+            executor (ProcessPoolExecutor): processos que geram os filhos.
+            algoritmo_genetico (AlgoritmoGenetico): operadores do algoritmo genético.
+            populacao (list[Individuo]): lista de indivíduos avaliados da população.
+            custos (np.ndarray): matriz dos custos dos sub-caminhos entre as posições chave.
+
+        Returns:
+            list[Individuo]: lista de indivíduos (população) evoluída.
+        """
+        individuos_geradores = algoritmo_genetico.seleciona_geradores(populacao)
+        genomas_geradores = [paralelo.para_genoma(individuo) for individuo in individuos_geradores]
+
+        print("GERANDO FILHOS PARA GERAÇÃO SEGUINTE")
+        quantidades = paralelo.divide_quantidade(
+            len(populacao) - len(individuos_geradores),
+            self.n_processos
+        )
+        sementes = [self.rng.getrandbits(64) for _ in quantidades]
+        tarefas = executor.map(
+            paralelo.gera_genomas_filhos,
+            [genomas_geradores] * len(quantidades),
+            quantidades,
+            sementes
+        )
+        individuos_geradores.extend(
+            paralelo.de_genoma(genoma, custos, self.tempo_disponivel, self.rng)
+            for genomas in tarefas
+            for genoma in genomas
+        )
+        return individuos_geradores
+
     def get_pontuacao_media(self, populacao: list[Individuo]) -> float:
         """Calcula a pontuação média de uma população.
 
@@ -0,0 +1,240 @@
+from random import Random
+import numpy as np
+from agentes.utils.problema import Problema
+from agentes.resgate.planos.otimizador_genetico.individuo import Individuo, INDICE_BASE
+
+
+class OtimizadorVetorizado:
+    """Algoritmo genético do resgate com a população inteira em arrays NumPy.
+
+    - Cada indivíduo é uma permutação da ordem de visita das vítimas (linha de uma matriz
+        [populacao, V] do menor tipo inteiro que comporta V) e um peso de custo (o peso da
+        gravidade é 1 - peso do custo);
+    - O trajeto de um indivíduo é o maior prefixo da permutação em que ainda é possível
+        ir até a próxima vítima e voltar à base no tempo disponível (máscara de prefixo);
+    - A pontuação é a mesma do Individuo, calculada para toda a população de uma vez;
+    - Seleção por truncamento (mais alguns sorteados), crossover por ordenação de chaves
+        aleatórias e mutação por troca de duas posições, todos em lote.
+
+    Tem a mesma interface do Otimizador: evoluir(problema, custos) e melhor_individuo_,
+        mas só descreve as gerações no terminal se verboso.
+    """
+
+    def __init__(
+            self,
+            n_populacao: int,
+            n_geracoes: int,
+            probabilidade_eventos: dict[str, float],
+            tempo_disponivel: float,
+            rng: Random = None,
+            verboso: bool = False
+        ) -> None:
+        self.rng = rng if rng is not None else Random()
+        self.probabilidade_eventos = probabilidade_eventos
+        self.n_populacao = n_populacao
+        self.n_geracoes = n_geracoes
+        self.verboso = verboso
+
+        self.tempo_disponivel = tempo_disponivel
+
+        self.melhor_individuo_ = None
+        self.melhor_pontuacao_ = -9999999
+
+        # Pesos de custo possíveis, os mesmos do Individuo
+        self.pesos_custo = np.array([0.05, 0.1, 0.15, 0.2, 0.25, 0.3, 0.35])
+
+    def evoluir(self, problema: Problema, custos: np.ndarray) -> None:
+        """Faz a evolução da população, isto é, a otimização por meio de algoritmo genético.
+
+        Args:
+            problema (Problema): instância do problema a ser resolvido.
+            custos (np.ndarray): matriz float32 (V + 1) x (V + 1) dos custos dos caminhos entre
+                as posições de interesse: a base (índice 0) e as vítimas na ordem do problema.
+        """
+        gerador = np.random.default_rng(self.rng.getrandbits(64))
+        gravidades = np.array(
+            [0] + [int(sinais[-1]) for sinais in problema.sinais_vitais_vitimas.values()],
+            dtype=np.float64
+        )
+        qtd_vitimas = len(custos) - 1
+        self.__informa(f"numero de vítimas para salvar: {qtd_vitimas}")
+
+        # População inicial: permutações aleatórias das vítimas (índices 1 a V), no menor
+        # tipo inteiro que comporta o índice V
+        tipo_indices = np.min_scalar_type(qtd_vitimas)
+        chaves = gerador.random((self.n_populacao, qtd_vitimas))
+        permutacoes = (np.argsort(chaves, axis=1) + 1).astype(tipo_indices)
+        pesos_custo = gerador.choice(self.pesos_custo, self.n_populacao)
+
+        for geracao in range(1, self.n_geracoes + 1):
+            self.__informa(f"Geração {geracao} de {self.n_geracoes}")
+
+            pontuacoes, tamanhos = self.avalia_populacao(
+                permutacoes, pesos_custo, custos, gravidades
+            )
+            self.__informa(f"Media da geração {geracao}: {round(float(pontuacoes.mean()), 2)}")
+
+            melhor = int(np.argmax(pontuacoes))
+            if self.melhor_pontuacao_ < pontuacoes[melhor]:
+                self.melhor_pontuacao_ = float(pontuacoes[melhor])
+                self.melhor_individuo_ = self.__monta_individuo(
+                    permutacoes[melhor], int(tamanhos[melhor]), float(pesos_custo[melhor]), custos
+                )
+            self.__informa(f"{self.melhor_pontuacao_} -> {self.melhor_individuo_.genes['trajeto']}")
+
+            if geracao != self.n_geracoes:
+                permutacoes, pesos_custo = self.faz_evolucao(
+                    gerador, permutacoes, pesos_custo, pontuacoes
+                )
+
+    def avalia_populacao(
+            self,
+            permutacoes: np.ndarray,
+            pesos_custo: np.ndarray,
+            custos: np.ndarray,
+            gravidades: np.ndarray
+        ) -> tuple[np.ndarray, np.ndarray]:
+        """Calcula o trajeto possível no tempo e a pontuação de todos os indivíduos.
+
+        Args:
+            permutacoes (np.ndarray): ordens de visita das vítimas [populacao, V].
+            pesos_custo (np.ndarray): peso do custo de cada indivíduo [populacao].
+            custos (np.ndarray): matriz dos custos entre as posições de interesse.
+            gravidades (np.ndarray): classe de gravidade de cada posição de interesse.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: pontuação [populacao] e quantidade de vítimas
+                do trajeto [populacao] de cada indivíduo.
+        """
+        n_populacao, qtd_vitimas = permutacoes.shape
+        if qtd_vitimas == 0:
+            return np.zeros(n_populacao), np.zeros(n_populacao, dtype=np.int64)
+
+        origens = np.empty_like(permutacoes)
+        origens[:, 0] = INDICE_BASE
+        origens[:, 1:] = permutacoes[:, :-1]
+
+        # Custo de cada sub-caminho e custo acumulado ao chegar em cada vítima
+        custos_subcaminhos = custos[origens, permutacoes].astype(np.float64)
+        custos_acumulados = np.cumsum(custos_subcaminhos, axis=1)
+
+        # Prefixo possível: dá para chegar à vítima e ainda voltar à base no tempo
+        possiveis = custos_acumulados + custos[permutacoes, INDICE_BASE] <= self.tempo_disponivel
+        mascara = np.logical_and.accumulate(possiveis, axis=1)
+        tamanhos = mascara.sum(axis=1)
+
+        # Mesma pontuação do Individuo: a ordem de salvamento começa na quantidade de
+        # sub-caminhos (vítimas e a volta à base) + 1 e diminui a cada sub-caminho
+        ordem_salvamento = (tamanhos + 2)[:, None] - np.arange(1, qtd_vitimas + 1)
+        gravidades_normalizadas = (5 - gravidades[permutacoes]) * ordem_salvamento
+        pesos_gravidade = 1 - pesos_custo
+        pontuacoes_subcaminhos = np.where(
+            mascara,
+            (pesos_gravidade[:, None] * gravidades_normalizadas)
+            / (pesos_custo[:, None] * np.where(mascara, custos_subcaminhos, 1.0)),
+            0.0
+        )
+        return pontuacoes_subcaminhos.sum(axis=1), tamanhos
+
+    def faz_evolucao(
+            self,
+            gerador: np.random.Generator,
+            permutacoes: np.ndarray,
+            pesos_custo: np.ndarray,
+            pontuacoes: np.ndarray
+        ) -> tuple[np.ndarray, np.ndarray]:
+        """Gera a próxima população.
+
+        - Seleção por truncamento: os melhores são mantidos e alguns dos outros são
+            sorteados para também gerar filhos;
+        - Crossover: cada filho ordena as vítimas por chaves aleatórias tiradas, vítima a
+            vítima, da posição dela no pai ou na mãe (o resultado é sempre uma permutação);
+        - Mutação: troca duas posições da permutação e sorteia um novo peso de custo.
+
+        Args:
+            gerador (np.random.Generator): gerador aleatório da evolução.
+            permutacoes (np.ndarray): ordens de visita da população atual.
+            pesos_custo (np.ndarray): peso do custo de cada indivíduo.
+            pontuacoes (np.ndarray): pontuação de cada indivíduo.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: permutações e pesos de custo da nova população.
+        """
+        n_populacao, qtd_vitimas = permutacoes.shape
+        ordem = np.argsort(-pontuacoes, kind='stable')
+        qtd_mantidos = int(
+            self.probabilidade_eventos['percentagem_retencao_populacao'] * n_populacao
+        )
+        sorteados = ordem[qtd_mantidos:][
+            gerador.random(n_populacao - qtd_mantidos)
+            < self.probabilidade_eventos['chace_selecao_aleatoria']
+        ]
+        geradores = np.concatenate([ordem[:qtd_mantidos], sorteados])
+        if len(geradores) < 2:
+            return permutacoes, pesos_custo
+
+        qtd_filhos = n_populacao - len(geradores)
+        pais = gerador.choice(geradores, qtd_filhos)
+        maes = gerador.choice(geradores, qtd_filhos)
+
+        # Posição de cada vítima na permutação do pai e da mãe (permutação inversa)
+        posicoes_pais = np.argsort(permutacoes[pais], axis=1)
+        posicoes_maes = np.argsort(permutacoes[maes], axis=1)
+        do_pai = gerador.random((qtd_filhos, qtd_vitimas)) < 0.5
+        chaves = np.where(do_pai, posicoes_pais, posicoes_maes) + gerador.random(
+            (qtd_filhos, qtd_vitimas)
+        )
+        filhos = (np.argsort(chaves, axis=1) + 1).astype(permutacoes.dtype)
+        pesos_filhos = np.where(
+            gerador.random(qtd_filhos) < 0.5, pesos_custo[pais], pesos_custo[maes]
+        )
+
+        # Mutação por troca de duas posições e novo peso de custo
+        mutados = np.flatnonzero(
+            gerador.random(qtd_filhos) < self.probabilidade_eventos['chance_mutacao']
+        )
+        if len(mutados) and qtd_vitimas > 1:
+            i = gerador.integers(qtd_vitimas, size=len(mutados))
+            j = gerador.integers(qtd_vitimas, size=len(mutados))
+            filhos[mutados, i], filhos[mutados, j] = filhos[mutados, j], filhos[mutados, i]
+            pesos_filhos[mutados] = gerador.choice(self.pesos_custo, len(mutados))
+
+        return (
+            np.concatenate([permutacoes[geradores], filhos]),
+            np.concatenate([pesos_custo[geradores], pesos_filhos])
+        )
+
+    def __informa(self, mensagem: str) -> None:
+        """Descreve o andamento da evolução no terminal, se verboso."""
+        if self.verboso:
+            print(mensagem)
+
+    def __monta_individuo(
+            self,
+            permutacao: np.ndarray,
+            tamanho: int,
+            peso_custo: float,
+            custos: np.ndarray
+        ) -> Individuo:
+        """Converte um indivíduo da população em um Individuo com o trajeto de sub-caminhos,
+            como o do Otimizador.
+
+        Args:
+            permutacao (np.ndarray): ordem de visita das vítimas.
+            tamanho (int): quantidade de vítimas do trajeto possível no tempo.
+            peso_custo (float): peso do custo do indivíduo.
+            custos (np.ndarray): matriz dos custos entre as posições de interesse.
+
+        Returns:
+            Individuo: indivíduo com o trajeto da base, pelas vítimas, de volta à base.
+        """
+        visitas = [INDICE_BASE] + permutacao[:tamanho].tolist()
+        if tamanho:
+            visitas.append(INDICE_BASE)
+
+        individuo = Individuo(custos, self.tempo_disponivel, len(custos), self.rng)
+        individuo.set_trajeto([list(subcaminho) for subcaminho in zip(visitas, visitas[1:])])
+        individuo.qtd_subcaminhos = len(visitas) - 1
+        individuo.set_caracteristicas({'peso_custo': peso_custo, 'peso_gravidade': 1 - peso_custo})
+        individuo.pontuacao = self.melhor_pontuacao_
+        return individuo
@@ -0,0 +1,163 @@
+"""Tarefas do algoritmo genético do resgate executadas em processos separados.
+
+Cada processo recebe uma única vez, na inicialização, a matriz de custos, as gravidades,
+o tempo disponível e as probabilidades dos eventos. Entre os processos trafegam apenas
+genomas compactos: (trajeto, qtd_subcaminhos, peso_custo, peso_gravidade, pontuacao).
+"""
+from random import Random
+import numpy as np
+from agentes.resgate.planos.otimizador_genetico.individuo import Individuo
+from agentes.resgate.planos.otimizador_genetico.algoritmo_genetico import AlgoritmoGenetico
+
+Genoma = tuple[list[list[int]], int, float, float, float]
+
+# Dados do problema compartilhados pelas tarefas do processo
+_custos: np.ndarray = None
+_gravidades: list[int] = None
+_tempo_disponivel: float = 0.0
+_probabilidade_eventos: dict[str, float] = None
+
+
+def inicializa_processo(
+        custos: np.ndarray,
+        gravidades: list[int],
+        tempo_disponivel: float,
+        probabilidade_eventos: dict[str, float]
+    ) -> None:
+    """Guarda os dados do problema no processo (initializer do ProcessPoolExecutor).
+
+    Args:
+        custos (np.ndarray): matriz dos custos dos sub-caminhos entre as posições chave.
+        gravidades (list[int]): classe de gravidade de cada posição chave.
+        tempo_disponivel (float): tempo disponível para o resgate.
+        probabilidade_eventos (dict[str, float]): probabilidades dos eventos do algoritmo.
+    """
+    global _custos, _gravidades, _tempo_disponivel, _probabilidade_eventos
+    _custos = custos
+    _gravidades = gravidades
+    _tempo_disponivel = tempo_disponivel
+    _probabilidade_eventos = probabilidade_eventos
+
+
+def para_genoma(individuo: Individuo) -> Genoma:
+    """Extrai o genoma de um indivíduo.
+
+    Args:
+        individuo (Individuo): indivíduo a ser convertido.
+
+    Returns:
+        Genoma: trajeto, quantidade de sub-caminhos, pesos e pontuação do indivíduo.
+    """
+    return (
+        individuo.genes['trajeto'],
+        individuo.qtd_subcaminhos,
+        individuo.genes['peso_custo'],
+        individuo.genes['peso_gravidade'],
+        individuo.pontuacao
+    )
+
+
+def de_genoma(
+        genoma: Genoma,
+        custos: np.ndarray,
+        tempo_disponivel: float,
+        rng: Random = None
+    ) -> Individuo:
+    """Reconstrói um indivíduo a partir do genoma.
+
+    Args:
+        genoma (Genoma): genoma do indivíduo.
+        custos (np.ndarray): matriz dos custos dos sub-caminhos entre as posições chave.
+        tempo_disponivel (float): tempo disponível para o resgate.
+        rng (Random, optional): gerador aleatório do indivíduo.
+
+    Returns:
+        Individuo: indivíduo com os genes e a pontuação do genoma.
+    """
+    trajeto, qtd_subcaminhos, peso_custo, peso_gravidade, pontuacao = genoma
+    individuo = Individuo(custos, tempo_disponivel, len(custos), rng)
+    individuo.set_trajeto(trajeto)
+    individuo.qtd_subcaminhos = qtd_subcaminhos
+    individuo.set_caracteristicas({'peso_custo': peso_custo, 'peso_gravidade': peso_gravidade})
+    individuo.pontuacao = pontuacao
+    return individuo
+
+
+def gera_genomas_aleatorios(qtd_individuos: int, semente: int) -> list[Genoma]:
+    """Gera indivíduos com trajetos aleatórios.
+
+    Args:
+        qtd_individuos (int): quantidade de indivíduos a gerar.
+        semente (int): semente do gerador aleatório da tarefa.
+
+    Returns:
+        list[Genoma]: genomas dos indivíduos gerados.
+    """
+    rng = Random(semente)
+    genomas = []
+    for _ in range(qtd_individuos):
+        individuo = Individuo(_custos, _tempo_disponivel, len(_custos), rng)
+        individuo.gera_individuo_aleatorio()
+        genomas.append(para_genoma(individuo))
+    return genomas
+
+
+def avalia_genomas(genomas: list[Genoma]) -> list[float]:
+    """Aplica a função de fitness nos indivíduos.
+
+    Args:
+        genomas (list[Genoma]): genomas dos indivíduos a avaliar.
+
+    Returns:
+        list[float]: pontuação de cada indivíduo, na ordem dos genomas.
+    """
+    pontuacoes = []
+    for genoma in genomas:
+        individuo = de_genoma(genoma, _custos, _tempo_disponivel)
+        individuo.avalia_individuo(_gravidades)
+        pontuacoes.append(individuo.pontuacao)
+    return pontuacoes
+
+
+def gera_genomas_filhos(
+        genomas_geradores: list[Genoma],
+        qtd_individuos: int,
+        semente: int
+    ) -> list[Genoma]:
+    """Cruza os indivíduos geradores até obter a quantidade de filhos.
+
+    Args:
+        genomas_geradores (list[Genoma]): genomas dos indivíduos selecionados para gerar filhos.
+        qtd_individuos (int): quantidade de filhos a gerar.
+        semente (int): semente do gerador aleatório da tarefa.
+
+    Returns:
+        list[Genoma]: genomas dos filhos gerados (já avaliados no crossover).
+    """
+    rng = Random(semente)
+    algoritmo_genetico = AlgoritmoGenetico(
+        _probabilidade_eventos,
+        _custos,
+        _gravidades,
+        _tempo_disponivel,
+        rng
+    )
+    individuos_geradores = [
+        de_genoma(genoma, _custos, _tempo_disponivel, rng) for genoma in genomas_geradores
+    ]
+    filhos = algoritmo_genetico.gera_filhos(individuos_geradores, qtd_individuos)
+    return [para_genoma(filho) for filho in filhos]
+
+
+def divide_quantidade(quantidade: int, partes: int) -> list[int]:
+    """Divide uma quantidade em partes de tamanhos quase iguais (sem partes vazias).
+
+    Args:
+        quantidade (int): quantidade a dividir.
+        partes (int): número máximo de partes.
+
+    Returns:
+        list[int]: tamanho de cada parte.
+    """
+    partes = max(1, min(partes, quantidade))
+    return [quantidade // partes + (1 if parte < quantidade % partes else 0) for parte in range(partes)]
@@ -1,172 +1,238 @@
 import heapq
-from copy import deepcopy
+from random import Random
+import numpy as np
 from agentes.utils.problema import Problema
+from agentes.utils.estado import Passo, ChavePosicao, CHAVE_BASE
+from agentes.utils import movimentos
 from agentes.resgate.planos.otimizador_genetico.otimizador import Otimizador
+from agentes.resgate.planos.otimizador_genetico.otimizador_vetorizado import OtimizadorVetorizado
 
 class PlanoResgateGenetico:
     """Plano de resgate das vítimas potencializado com algoritmo genético.
     """
+
+    # Motores do algoritmo genético disponíveis
+    MOTORES = {
+        'objetos': Otimizador,
+        'vetorizado': OtimizadorVetorizado,
+    }
+
     def __init__(
         self,
         problema_atual: Problema,
-        tempo_restante: float
+        tempo_restante: float,
+        rng: Random = None,
+        motor: str = 'objetos',
+        n_processos: int = 1
     ) -> None:
+        """
+        Args:
+            problema_atual (Problema): problema com o mapa e as vítimas a resgatar.
+            tempo_restante (float): tempo disponível para o resgate.
+            rng (Random, optional): gerador aleatório do agente. Default: None.
+            motor (str, optional): motor do algoritmo genético (chave de MOTORES): 'objetos',
+                um Individuo por indivíduo, ou 'vetorizado', a população em arrays NumPy.
+            n_processos (int, optional): processos que geram e avaliam a população do motor
+                'objetos'; None usa todos os núcleos. Default: 1.
+        """
         self.problema = problema_atual
+
+        # Grafo das posições sobre índices: adjacentes e custos dos passos de cada posição
+        self.posicoes: list[ChavePosicao] = []
+        self.indice_posicao: dict[ChavePosicao, int] = {}
+        self.adjacencias: list[list[int]] = []
+        self.custos_adjacencias: list[list[float]] = []
+        # Posições chave na ordem dos índices do otimizador: a base e as vítimas
+        self.posicoes_chave: list[ChavePosicao] = []
+        # Distâncias e predecessores da última busca, compartilhados por todas as buscas
+        # (só as posições alcançadas pela busca anterior são reinicializadas)
+        self.distancias: list[float] = []
+        self.anteriores: list[int] = []
+        self.alcancadas: list[int] = []
         self.probabilidade_eventos = {
             'chance_mutacao': 0.1,
             'chace_selecao_aleatoria': 0.05,
             'percentagem_retencao_populacao': 0.35
         }
 
-        self.otimizador = Otimizador(
+        parametros_otimizador = {}
+        if motor == 'objetos':
+            parametros_otimizador['n_processos'] = n_processos
+
+        self.otimizador = PlanoResgateGenetico.MOTORES[motor](
             n_populacao = 10000,
             n_geracoes = 6,
             probabilidade_eventos = self.probabilidade_eventos,
-            tempo_disponivel = tempo_restante
+            tempo_disponivel = tempo_restante,
+            rng = rng,
+            **parametros_otimizador
         )
 
     def executar(self) -> None:
         """Executa o otimzador com algoritmo genético.
         """
-        caminhos_possiveis = self.processa_problema()
+        custos = self.processa_problema()
 
-        self.otimizador.evoluir(self.problema, caminhos_possiveis)
-        passos_resgates = self.obtem_passos_trajeto(caminhos_possiveis)
+        self.otimizador.evoluir(self.problema, custos)
+        passos_resgates = self.obtem_passos_trajeto()
 
         return passos_resgates
 
-    def obtem_passos_trajeto(
-            self,
-            caminhos_possiveis: dict[str, dict[str, list[str]]]
-        ) -> list[tuple[int, int]]:
+    def obtem_passos_trajeto(self) -> list[Passo]:
         """Transcreve as origens e destinos da sequência de sub-caminhos obtidos em
             passos que podem ser executados pelo agente socorrista.
 
-        Args:
-            caminhos_possiveis (dict[str, dict[str, list[str]]]): caminhos possíveis para
-                cada posição, computado com algoritmo de Dijkstra.
+        Apenas os sub-caminhos do trajeto escolhido são materializados.
 
         Returns:
-            list[tuple[int, int]]: retorna uma lista de passos a serem realizados para o
+            list[Passo]: retorna uma lista de passos a serem realizados para o
                 agente socorrista executar todo o trajeto.
         """
         passos_trajeto = []
         melhores_caminhos = self.otimizador.melhor_individuo_.genes['trajeto']
-        for origem, destino in melhores_caminhos:
-            posicoes_trajeto = caminhos_possiveis[origem][destino]
-            posicao_anterior = self.obtem_inteiros_chave_posicao(origem)
-            for posicao, _ in posicoes_trajeto:
-                posicao_atual = self.obtem_inteiros_chave_posicao(posicao)
+        for indice_origem, indice_destino in melhores_caminhos:
+            origem = self.posicoes_chave[indice_origem]
+            destino = self.posicoes_chave[indice_destino]
+            posicao_anterior = origem
+            for posicao_atual in self.materializa_caminho(origem, destino).tolist():
                 var_linha = posicao_atual[0] - posicao_anterior[0]
                 var_coluna = posicao_atual[1] - posicao_anterior[1]
-                posicao_anterior = deepcopy(posicao_atual)
-                passos_trajeto.append((var_linha, var_coluna))
+                posicao_anterior = posicao_atual
+                passos_trajeto.append(movimentos.obtem_passo(var_linha, var_coluna))
         passos_trajeto.reverse()
         return passos_trajeto
 
-    def obtem_inteiros_chave_posicao(self, chave_posicao: str) -> tuple[int, int]:
-        """Retorna os valores inteiros das posições de uma chave posição 
-            (representa um estado do ambiente)
-
-        Args:
-            chave_posicao (str): chave posição para se obter os inteiros.
-
-        Returns:
-            tuple[int, int]: retorna os inteiros da chave da posição.
-        """
-        posicoes = chave_posicao.split(':')
-        return int(posicoes[0]), int(posicoes[1])
-
-    def processa_problema(self) -> dict[str, dict[str, list[str]]]:
+    def processa_problema(self) -> np.ndarray:
         """Faz o processamento do problema permitindo encontrar todos os sub-caminhos
             entre todas as posições chave
         
         - base e vítimas, vítimas e vítimas e vítimas e base.
 
         Returns:
-            dict[str, dict[str, list[str]]]: _description_
+            np.ndarray: matriz float32 (V + 1) x (V + 1) dos custos dos sub-caminhos entre as
+                posições chave (índice 0 é a base).
         """
-        caminhos = self.encontrar_caminhos(
+        custos = self.encontrar_caminhos(
             self.problema.grafo_posicoes,
             self.problema.sinais_vitais_vitimas
         )
-        return caminhos
+        return custos
 
     def encontrar_caminhos(
             self,
-            grafo_posicoes: dict[str, list[str]],
-            vitimas: dict[str, list[float]]
-        ) -> dict[str, dict[str, list[str]]]:
-        """Por meio do algoritmo de Dijkstra, monta um dicionário com todos os sub-caminhos ótimos
-            ótimos dado origens para as posições chave.
-
-        - base e vítimas, vítimas e vítimas e vítimas e base.
+            grafo_posicoes: dict[ChavePosicao, list[ChavePosicao]],
+            vitimas: dict[ChavePosicao, list[float]]
+        ) -> np.ndarray:
+        """Por meio do algoritmo de Dijkstra, encontra os custos de todos os sub-caminhos
+            ótimos entre as posições chave.
+
+        - base e vítimas, vítimas e vítimas e vítimas e base;
+        - Uma única busca por origem encontra os caminhos até todas as outras posições
+            chave (V + 1 buscas em vez de (V + 1)²);
+        - Os caminhos não são guardados: as buscas compartilham os mesmos arrays de
+            distâncias e predecessores (memória O(N), não O(V·N)) e materializa_caminho
+            refaz a busca só para os sub-caminhos do trajeto escolhido.
 
         Args:
-            grafo_posicoes (dict[str, list[str]]): dicionário com as posições e suas adjacências.
-            vitimas (dict[str, list[float]]): lista com os sinais vitais e posição das vítimas.
+            grafo_posicoes (dict[ChavePosicao, list[ChavePosicao]]): dicionário com as posições
+                e suas adjacências.
+            vitimas (dict[ChavePosicao, list[float]]): lista com os sinais vitais e posição das vítimas.
 
         Returns:
-            dict[str, dict[str, list[str]]]: _description_
+            np.ndarray: matriz float32 (V + 1) x (V + 1) com o custo do sub-caminho de cada
+                origem (linha) para cada destino (coluna), na ordem de self.posicoes_chave;
+                inf se o destino não é alcançável e 0 na diagonal.
         """
-        caminhos = {}
-        for vitima1 in ['0:0'] + list(vitimas):
-            caminhos[vitima1] = {}
-            for vitima2 in ['0:0'] + list(vitimas):
-                if vitima1 == vitima2:
-                    continue
-                caminho = self.dijkstra(grafo_posicoes, vitima1, vitima2)
-                caminhos[vitima1][vitima2] = caminho
-        return caminhos
-
-    def dijkstra(
-            self,
-            grafo_posicoes: dict[str, list[str]],
-            origem: str, destino: str
-        ) -> list[str]:
-        """Algoritmo de Dijkstra adaptado para o problema a ser resolvido.
+        self.posicoes = list(grafo_posicoes)
+        self.indice_posicao = {posicao: indice for indice, posicao in enumerate(self.posicoes)}
+        self.adjacencias = [
+            [self.indice_posicao[adjacente] for adjacente in grafo_posicoes[posicao]]
+            for posicao in self.posicoes
+        ]
+        self.custos_adjacencias = [
+            [
+                movimentos.custo_passo(adjacente[0] - posicao[0], adjacente[1] - posicao[1])
+                for adjacente in grafo_posicoes[posicao]
+            ]
+            for posicao in self.posicoes
+        ]
+        self.distancias = [float('inf')] * len(self.posicoes)
+        self.anteriores = [-1] * len(self.posicoes)
+        self.alcancadas = []
+
+        self.posicoes_chave = [CHAVE_BASE] + list(vitimas)
+        indices_chave = [self.indice_posicao[posicao] for posicao in self.posicoes_chave]
+        custos = np.empty((len(indices_chave), len(indices_chave)), dtype=np.float32)
+        for linha, indice_origem in enumerate(indices_chave):
+            self.dijkstra(indice_origem, indices_chave)
+            custos[linha] = [self.distancias[indice] for indice in indices_chave]
+        return custos
+
+    def dijkstra(self, origem: int, destinos: list[int]) -> None:
+        """Algoritmo de Dijkstra de uma origem para vários destinos sobre os índices das posições.
+
+        A busca termina quando todos os destinos alcançáveis têm a distância definitiva.
+            O resultado fica em self.distancias (inf se não alcançada) e self.anteriores
+            (índice da posição anterior no menor caminho, -1 se não há), válidos até a
+            próxima busca.
 
         Args:
-            grafo_posicoes (dict[str, list[str]]): dicionário com as posições e suas adjacências.
-            origem (str): chave posição da origem do sub-caminho.
-            destino (str): chave posição do destino do sub-caminho.
-
-        Returns:
-            list[str]: sequência de posições que devem ser alcançadas para
-                completar o sub-caminho.
+            origem (int): índice da posição de origem dos sub-caminhos.
+            destinos (list[int]): índices das posições de destino.
         """
-        distancias = {posicao: float('inf') for posicao in grafo_posicoes}
-        distancias[origem] = 0.0
-        fila = [(0.0, origem, [])]
-        while fila:
-            (distancia, posicao, caminho) = heapq.heappop(fila)
-            if posicao == destino:
-                return caminho
+        distancias = self.distancias
+        anteriores = self.anteriores
+        adjacencias = self.adjacencias
+        custos_adjacencias = self.custos_adjacencias
+
+        # Reinicializa só o que a busca anterior alcançou
+        for posicao in self.alcancadas:
+            distancias[posicao] = float('inf')
+            anteriores[posicao] = -1
+        alcancadas = [origem]
+        self.alcancadas = alcancadas
 
+        distancias[origem] = 0.0
+        pendentes = set(destinos)
+        pendentes.discard(origem)
+        fila = [(0.0, origem)]
+        while fila and pendentes:
+            distancia, posicao = heapq.heappop(fila)
             if distancia > distancias[posicao]:
                 continue
+            pendentes.discard(posicao)
 
-            for adjacente in grafo_posicoes[posicao]:
-                custo = self.__calcular_custo(posicao, adjacente)
+            for adjacente, custo in zip(adjacencias[posicao], custos_adjacencias[posicao]):
                 nova_distancia = distancia + custo
                 if nova_distancia < distancias[adjacente]:
+                    if anteriores[adjacente] < 0:
+                        alcancadas.append(adjacente)
                     distancias[adjacente] = nova_distancia
-                    novo_caminho = caminho + [(adjacente, custo)]
-                    heapq.heappush(fila, (nova_distancia, adjacente, novo_caminho))
-        return []
+                    anteriores[adjacente] = posicao
+                    heapq.heappush(fila, (nova_distancia, adjacente))
 
-    def __calcular_custo(self, origem: str, destino: str) -> float:
-        """Obtém o custo de realizar um movimento de passo.
+    def materializa_caminho(self, origem: ChavePosicao, destino: ChavePosicao) -> np.ndarray:
+        """Reconstrói o sub-caminho da origem até o destino, refazendo a busca a partir da
+            origem até o destino.
 
         Args:
-            origem (str): chave posição da origem.
-            destino (str): chave posição do destino.
+            origem (ChavePosicao): chave posição da origem do sub-caminho.
+            destino (ChavePosicao): chave posição do destino do sub-caminho.
 
         Returns:
-            float: custo para realizar o passo.
+            np.ndarray: posições [n, 2] (int32) a serem alcançadas para completar o sub-caminho,
+                sem a origem; vazio se não há caminho.
         """
-        ox, oy = map(int, origem.split(':'))
-        dx, dy = map(int, destino.split(':'))
-        if ox == dx or oy == dy:
-            return 1.0
-        return 1.5
+        indice_origem = self.indice_posicao[origem]
+        indice = self.indice_posicao[destino]
+        self.dijkstra(indice_origem, [indice])
+
+        indices = []
+        while indice != indice_origem and indice >= 0:
+            indices.append(indice)
+            indice = self.anteriores[indice]
+        if indice < 0:
+            return np.empty((0, 2), dtype=np.int32)
+
+        indices.reverse()
+        return np.array([self.posicoes[i] for i in indices], dtype=np.int32).reshape(-1, 2)
@@ -7,7 +7,7 @@ from physical_agent import PhysAgent
 
 # Módulos do problema e do estado
 from agentes.utils.problema import Problema
-from agentes.utils.estado import Estado
+from agentes.utils.estado import Estado, ChavePosicao, CHAVE_BASE
 
 # Módulo do plano do agente
 from agentes.resgate.planos.resgate_genetico import PlanoResgateGenetico
@@ -17,10 +17,12 @@ class Rescuer(AbstractAgent):
     """Classe que define o Agente Rescuer com um plano fixo
     """
 
-    def __init__(self, env, config_file):
+    def __init__(self, env, config_file, motor='objetos', processos=1):
         """ 
         @param env: a reference to an instance of the environment class
-        @param config_file: the absolute path to the agent's config file"""
+        @param config_file: the absolute path to the agent's config file
+        @param motor: engine of the genetic rescue plan (a key of PlanoResgateGenetico.MOTORES)
+        @param processos: processes of the 'objetos' genetic engine, None for all the cores"""
 
         super().__init__(env, config_file)
 
@@ -37,10 +39,12 @@ class Rescuer(AbstractAgent):
         self.estado_atual: Estado = Estado()
 
         self.flag_resgate_ativo: bool = True
-        self.vitimas_resgatadas: list[str] = []
+        self.vitimas_resgatadas: list[ChavePosicao] = []
 
         # Planos do agente de resgate
         self.plano_genetico: PlanoResgateGenetico = None
+        self.motor_genetico: str = motor
+        self.processos_genetico: int = processos
         self.plano_retorno: PlanoRetornoBase = PlanoRetornoBase()
 
 
@@ -54,9 +58,17 @@ class Rescuer(AbstractAgent):
         self.body.set_state(PhysAgent.ACTIVE)
         self.problema = problema_montado
 
+        # Sem vítimas atribuídas não há trajeto a otimizar: termina na base
+        if not self.problema.sinais_vitais_vitimas:
+            self.plan = []
+            return
+
         self.plano_genetico = PlanoResgateGenetico(
             self.problema,
-            self.rtime
+            self.rtime,
+            self.rng,
+            self.motor_genetico,
+            self.processos_genetico
         )
         self.plan = self.plano_genetico.executar()
 
@@ -76,7 +88,7 @@ class Rescuer(AbstractAgent):
             self.flag_resgate_ativo = False
 
         if (not self.flag_resgate_ativo
-            and self.estado_atual.get_chave_posicao() == '0:0'
+            and self.estado_atual.get_chave_posicao() == CHAVE_BASE
         ):
             print(f"{self.NAME} I believe I've remaining time of {self.rtime:.1f}")
             return False
@@ -88,9 +100,7 @@ class Rescuer(AbstractAgent):
         if self.flag_resgate_ativo:
             passo_linha, passo_coluna = self.plan.pop()
         else:
-            dict_passo = self.plano_retorno.escolhe_variacao_posicao()
-            passo_linha = dict_passo['linha']
-            passo_coluna = dict_passo['coluna']
+            passo_linha, passo_coluna = self.plano_retorno.escolhe_variacao_posicao()
 
         # Atualiza a posição atual do agente para ele mesmo
         self.atualiza_estado_atual(passo_linha, passo_coluna)
@@ -123,8 +133,10 @@ class Rescuer(AbstractAgent):
             passo_linha (int): variação da posição do agente na linha.
             passo_coluna (int): variação da posição do agente na coluna.
         """
-        self.estado_atual.linha += passo_linha
-        self.estado_atual.coluna += passo_coluna
+        self.estado_atual = Estado(
+            self.estado_atual.linha + passo_linha,
+            self.estado_atual.coluna + passo_coluna
+        )
 
     def __atualiza_tempo_restante(self, passo_linha: int, passo_coluna: int) -> None:
         """Faz a atualização do tempo restante conforme a movimentação decidida
@@ -1,8 +1,36 @@
+from typing import NamedTuple
+
+# Chave de uma posição nos dicionários dos agentes: (linha, coluna) relativos à base
+ChavePosicao = tuple[int, int]
+
+# Chave da posição da base dos agentes
+CHAVE_BASE: ChavePosicao = (0, 0)
+
+
+class Passo(NamedTuple):
+    """Variação da posição em cada eixo em um movimento do agente.
+
+    É imutável, comparável e pode ser chave de dicionários; os 8 passos possíveis
+        (e o passo nulo) são constantes compartilhadas do módulo movimentos.
+    """
+    linha: int
+    coluna: int
+
+    def eh_diagonal(self) -> bool:
+        """Verifica se o passo muda a linha e a coluna ao mesmo tempo."""
+        return self.linha != 0 and self.coluna != 0
+
+
 class Estado:
     """Esta classe representa um estado do problema para os agentes, ou seja,
         é um par ordenado que indica uma posição no espaço do ambiente.
+
+    Usa __slots__ (sem __dict__ por instância) e é comparável e hashable pelo par
+        (linha, coluna): não deve ser alterado enquanto for chave de um dicionário.
     """
 
+    __slots__ = ('linha', 'coluna')
+
     def __init__(self, linha: int = 0, coluna: int = 0) -> None:
         """Define um par ordenado (x, y) como a posição do agente,
             isto é, um estado do problema.
@@ -14,13 +42,38 @@ class Estado:
         self.linha = linha
         self.coluna = coluna
 
-    def get_chave_posicao(self):
+    def get_chave_posicao(self) -> ChavePosicao:
         """Retorna a posição que o estado representa, no formato das chaves dos dicionários.
 
         Returns:
-            str: chave da posicao que este estado representa.
+            ChavePosicao: chave (linha, coluna) da posicao que este estado representa.
         """
-        return str(self.linha) + ':' + str(self.coluna)
+        return (self.linha, self.coluna)
+
+    def desloca(self, passo: Passo) -> 'Estado':
+        """Retorna o estado alcançado a partir deste com o passo dado.
+
+        Args:
+            passo (Passo): variação da posição em cada eixo.
+
+        Returns:
+            Estado: novo estado, este não é alterado.
+        """
+        return Estado(self.linha + passo.linha, self.coluna + passo.coluna)
+
+    def __eq__(self, outro: object) -> bool:
+        if not isinstance(outro, Estado):
+            return NotImplemented
+        return self.linha == outro.linha and self.coluna == outro.coluna
+
+    def __lt__(self, outro: 'Estado') -> bool:
+        return (self.linha, self.coluna) < (outro.linha, outro.coluna)
+
+    def __hash__(self) -> int:
+        return hash((self.linha, self.coluna))
 
     def __str__(self) -> str:
         return f"({self.linha}, {self.coluna})"
+
+    def __repr__(self) -> str:
+        return f"Estado({self.linha}, {self.coluna})"
@@ -0,0 +1,191 @@
+import numpy as np
+from agentes.utils import movimentos
+
+
+class MapaCrencas:
+    """Representa as crenças do agente sobre o conteúdo das posições do ambiente
+        como uma grade de ocupação densa (NumPy int8).
+
+    - As posições são relativas à base (linha, coluna), podendo ser negativas;
+    - A grade dobra de tamanho no sentido necessário quando uma posição fora dela
+        é definida, mantendo a origem deslocada para dentro da grade;
+    - Consultas vetorizadas (posições livres, fronteira, vizinhas desconhecidas)
+        permitem raciocinar sobre o mapa inteiro de uma só vez.
+    """
+
+    # Códigos das células
+    DESCONHECIDA = 0
+    VAZIA = 1
+    VITIMA = 2
+    PAREDE = 3
+    BASE = 4
+
+    # Códigos correspondentes às descrições usadas pelos agentes
+    CODIGOS = {'e': VAZIA, 'v': VITIMA, 'w': PAREDE, 'b': BASE}
+    DESCRICOES = {codigo: descricao for descricao, codigo in CODIGOS.items()}
+
+    def __init__(self, tamanho_inicial: int = 16) -> None:
+        """Instancia o mapa com a base no centro de uma grade quadrada.
+
+        Args:
+            tamanho_inicial (int, optional): lado inicial da grade. Default: 16.
+        """
+        self.celulas = np.zeros((tamanho_inicial, tamanho_inicial), dtype=np.int8)
+
+        # Índice da grade em que está a posição (0, 0), isto é, a base
+        self.origem_linha = tamanho_inicial // 2
+        self.origem_coluna = tamanho_inicial // 2
+
+        self.define(0, 0, MapaCrencas.BASE)
+
+    def obtem(self, linha: int, coluna: int) -> int:
+        """Retorna o código da crença sobre uma posição.
+
+        Args:
+            linha (int): linha relativa à base.
+            coluna (int): coluna relativa à base.
+
+        Returns:
+            int: código da célula, DESCONHECIDA se estiver fora da grade.
+        """
+        i = linha + self.origem_linha
+        j = coluna + self.origem_coluna
+        if 0 <= i < self.celulas.shape[0] and 0 <= j < self.celulas.shape[1]:
+            return int(self.celulas[i, j])
+        return MapaCrencas.DESCONHECIDA
+
+    def obtem_descricao(self, linha: int, coluna: int) -> str:
+        """Retorna a descrição ('b', 'e', 'v', 'w') da posição ou None se desconhecida."""
+        return MapaCrencas.DESCRICOES.get(self.obtem(linha, coluna))
+
+    def eh_desconhecida(self, linha: int, coluna: int) -> bool:
+        """Verifica se ainda não há crença sobre a posição."""
+        return self.obtem(linha, coluna) == MapaCrencas.DESCONHECIDA
+
+    def define(self, linha: int, coluna: int, codigo: int) -> None:
+        """Define a crença sobre uma posição, aumentando a grade se necessário.
+
+        Args:
+            linha (int): linha relativa à base.
+            coluna (int): coluna relativa à base.
+            codigo (int): código da célula (VAZIA, VITIMA, PAREDE ou BASE).
+        """
+        i = linha + self.origem_linha
+        j = coluna + self.origem_coluna
+        if not (0 <= i < self.celulas.shape[0] and 0 <= j < self.celulas.shape[1]):
+            self.__aumenta_grade(i, j)
+            i = linha + self.origem_linha
+            j = coluna + self.origem_coluna
+        self.celulas[i, j] = codigo
+
+    def incorpora(self, outro: 'MapaCrencas') -> None:
+        """Acrescenta as crenças de outro mapa com a mesma base (ex.: de outro explorador).
+
+        As células desconhecidas neste mapa recebem o conteúdo conhecido no outro.
+
+        Args:
+            outro (MapaCrencas): mapa cujas crenças são incorporadas.
+        """
+        linhas, colunas = outro.celulas.shape
+        primeira_linha, primeira_coluna = -outro.origem_linha, -outro.origem_coluna
+        ultima_linha, ultima_coluna = primeira_linha + linhas - 1, primeira_coluna + colunas - 1
+
+        # Garante que a grade contenha os cantos do outro mapa
+        for linha, coluna in ((primeira_linha, primeira_coluna), (ultima_linha, ultima_coluna)):
+            i = linha + self.origem_linha
+            j = coluna + self.origem_coluna
+            if not (0 <= i < self.celulas.shape[0] and 0 <= j < self.celulas.shape[1]):
+                self.__aumenta_grade(i, j)
+
+        i = primeira_linha + self.origem_linha
+        j = primeira_coluna + self.origem_coluna
+        regiao = self.celulas[i:i + linhas, j:j + colunas]
+        desconhecidas = regiao == MapaCrencas.DESCONHECIDA
+        regiao[desconhecidas] = outro.celulas[desconhecidas]
+
+    def __aumenta_grade(self, i: int, j: int) -> None:
+        """Dobra as dimensões da grade, no sentido de cada eixo em que o índice
+            (i, j) está fora dela, até que ele esteja contido.
+
+        Args:
+            i (int): índice da linha na grade atual.
+            j (int): índice da coluna na grade atual.
+        """
+        linhas, colunas = self.celulas.shape
+        antes_linhas = antes_colunas = 0
+        novas_linhas, novas_colunas = linhas, colunas
+
+        while i < -antes_linhas or i >= novas_linhas - antes_linhas:
+            if i < -antes_linhas:
+                antes_linhas += novas_linhas
+            novas_linhas *= 2
+        while j < -antes_colunas or j >= novas_colunas - antes_colunas:
+            if j < -antes_colunas:
+                antes_colunas += novas_colunas
+            novas_colunas *= 2
+
+        celulas = np.zeros((novas_linhas, novas_colunas), dtype=np.int8)
+        celulas[antes_linhas:antes_linhas + linhas, antes_colunas:antes_colunas + colunas] = self.celulas
+        self.celulas = celulas
+        self.origem_linha += antes_linhas
+        self.origem_coluna += antes_colunas
+
+    def mascara_livres(self) -> np.ndarray:
+        """Retorna a máscara das células conhecidas por onde o agente pode andar
+            (vazias, vítimas e base)."""
+        return (self.celulas != MapaCrencas.DESCONHECIDA) & (self.celulas != MapaCrencas.PAREDE)
+
+    def contagem_vizinhas_desconhecidas(self) -> np.ndarray:
+        """Retorna, para cada célula da grade, quantas das 8 vizinhas são desconhecidas.
+
+        As posições fora da grade são consideradas desconhecidas.
+        """
+        desconhecidas = np.pad(
+            self.celulas == MapaCrencas.DESCONHECIDA, 1, constant_values=True
+        ).astype(np.int8)
+        linhas, colunas = self.celulas.shape
+        contagem = np.zeros((linhas, colunas), dtype=np.int8)
+        for var_linha, var_coluna in movimentos.VARIACOES:
+            contagem += desconhecidas[
+                1 + var_linha:1 + var_linha + linhas,
+                1 + var_coluna:1 + var_coluna + colunas
+            ]
+        return contagem
+
+    def mascara_vizinhas_desconhecidas(self) -> np.ndarray:
+        """Retorna a máscara das células com ao menos uma das 8 vizinhas desconhecida.
+
+        As posições fora da grade são consideradas desconhecidas.
+        """
+        return self.contagem_vizinhas_desconhecidas() > 0
+
+    def mascara_fronteira(self) -> np.ndarray:
+        """Retorna a máscara das células livres com alguma vizinha desconhecida."""
+        return self.mascara_livres() & self.mascara_vizinhas_desconhecidas()
+
+    def fronteira(self) -> np.ndarray:
+        """Retorna as posições (linha, coluna) relativas à base das células da fronteira.
+
+        Returns:
+            np.ndarray: matriz de inteiros [n, 2].
+        """
+        return self.posicoes_relativas(self.mascara_fronteira())
+
+    def posicoes_relativas(self, mascara: np.ndarray) -> np.ndarray:
+        """Converte uma máscara da grade nas posições (linha, coluna) relativas à base.
+
+        Args:
+            mascara (np.ndarray): máscara booleana com a forma da grade.
+
+        Returns:
+            np.ndarray: matriz de inteiros [n, 2].
+        """
+        return np.argwhere(mascara) - (self.origem_linha, self.origem_coluna)
+
+    def qtd_livres(self) -> int:
+        """Retorna a quantidade de células conhecidas por onde o agente pode andar."""
+        return int(np.count_nonzero(self.mascara_livres()))
+
+    def qtd_conhecidas(self) -> int:
+        """Retorna a quantidade de células sobre as quais há crença."""
+        return int(np.count_nonzero(self.celulas))
@@ -0,0 +1,81 @@
+# Movimentos dos agentes no grid: direções, variações, custos e tabelas de vizinhança.
+# Tudo é calculado uma única vez na importação do módulo e compartilhado pelos planos,
+# que enumeram as vizinhas de uma posição sem criar objetos Estado nem dicionários
+# (nas grades densas, por deslocamentos constantes dos índices planos).
+import numpy as np
+from agentes.utils.estado import Passo
+
+# Custos dos passos na horizontal/vertical e na diagonal
+CUSTO_LINHA = 1.0
+CUSTO_DIAGONAL = 1.5
+
+# Passos (variação da linha e da coluna) de cada direção
+PASSOS: dict[str, Passo] = {
+    'O': Passo(0, -1),      # Oeste
+    'N': Passo(-1, 0),      # Norte
+    'S': Passo(1, 0),       # Sul
+    'L': Passo(0, 1),       # Leste
+    'NO': Passo(-1, -1),    # Noroeste
+    'SO': Passo(1, -1),     # Sudoeste
+    'SD': Passo(1, 1),      # Sudeste
+    'ND': Passo(-1, 1),     # Nordeste
+}
+PASSO_NULO = Passo(0, 0)
+
+# Instância única de cada passo pela sua variação, para não criar novos objetos
+PASSOS_POR_VARIACAO: dict[tuple[int, int], Passo] = {
+    tuple(passo): passo for passo in (PASSO_NULO, *PASSOS.values())
+}
+
+DIRECOES_CRUZ = ('O', 'N', 'S', 'L')
+DIRECOES_DIAGONAIS = ('NO', 'SO', 'SD', 'ND')
+
+# Direção oposta de cada direção (volta do passo)
+DIRECAO_OPOSTA = {
+    'O': 'L', 'L': 'O', 'N': 'S', 'S': 'N',
+    'NO': 'SD', 'SD': 'NO', 'SO': 'ND', 'ND': 'SO',
+}
+
+# Passos até as 8 vizinhas em ordem de linha e coluna e os custos correspondentes
+VARIACOES: tuple[Passo, ...] = (
+    PASSOS['NO'], PASSOS['N'], PASSOS['ND'],
+    PASSOS['O'],               PASSOS['L'],
+    PASSOS['SO'], PASSOS['S'], PASSOS['SD'],
+)
+CUSTOS: tuple[float, ...] = tuple(
+    CUSTO_DIAGONAL if var_linha != 0 and var_coluna != 0 else CUSTO_LINHA
+    for var_linha, var_coluna in VARIACOES
+)
+
+# Mesmas variações e custos como arrays, para operações vetorizadas na grade
+VARIACOES_ARRAY = np.array(VARIACOES, dtype=np.int64)
+CUSTOS_ARRAY = np.array(CUSTOS, dtype=np.float64)
+
+
+def obtem_passo(var_linha: int, var_coluna: int) -> Passo:
+    """Retorna a constante compartilhada do passo com a variação da linha e da coluna."""
+    return PASSOS_POR_VARIACAO[(var_linha, var_coluna)]
+
+
+def custo_passo(var_linha: int, var_coluna: int) -> float:
+    """Retorna o custo de um passo pela sua variação da linha e da coluna."""
+    if var_linha != 0 and var_coluna != 0:
+        return CUSTO_DIAGONAL
+    return CUSTO_LINHA
+
+
+def deslocamentos_planos(colunas: int) -> tuple[int, ...]:
+    """Retorna os deslocamentos dos índices planos das 8 vizinhas em uma grade com a
+        quantidade de colunas dada, na ordem de VARIACOES.
+
+    A célula (i, j) tem índice plano i * colunas + j e a vizinha (i + dl, j + dc) tem o
+    índice da célula + dl * colunas + dc. Em uma grade com uma borda de uma célula, as
+    vizinhas das células internas nunca saem da grade, então não há teste de limites.
+
+    Args:
+        colunas (int): quantidade de colunas da grade (com a borda, se houver).
+
+    Returns:
+        tuple[int, ...]: deslocamento do índice plano até cada uma das 8 vizinhas.
+    """
+    return tuple(var_linha * colunas + var_coluna for var_linha, var_coluna in VARIACOES)
@@ -1,4 +1,9 @@
-from agentes.utils.estado import Estado
+import copy
+import heapq
+import numpy as np
+from agentes.utils.estado import Estado, Passo, ChavePosicao, CHAVE_BASE
+from agentes.utils.mapa_crencas import MapaCrencas
+from agentes.utils import movimentos
 
 class Problema:
     """Representa um problema para servir de informações aos agentes.
@@ -7,104 +12,296 @@ class Problema:
     - O agente de resgate usa essas informações para tomada de decisões.
 
     Contém os atributos:
-        - ambiente_crencas (dict[int, dict[int, int]]): posições do ambiente e seu conteúdo.
-        - grafo_posicoes (dict[str, list[str]]): lista de adjacências das posições visitadas.
-        - sinais_vitais_vitimas (dict[str, list[float]]): sinais vitais das vítimas encontradas.
+        - mapa_crencas (MapaCrencas): grade com o conteúdo conhecido das posições do ambiente.
+        - grafo_posicoes (dict[ChavePosicao, list[ChavePosicao]]): lista de adjacências das
+            posições visitadas.
+        - sinais_vitais_vitimas (dict[ChavePosicao, list[float]]): sinais vitais das vítimas
+            encontradas.
+        - custo_base (dict[ChavePosicao, float]): custo do menor caminho de cada posição do
+            grafo até a base, mantido a cada posição nova.
+        - proximo_passo_base (dict[ChavePosicao, ChavePosicao]): próxima posição desse caminho.
     """
+
+    # Custos dos passos na horizontal/vertical e na diagonal
+    CUSTO_LINHA = movimentos.CUSTO_LINHA
+    CUSTO_DIAGONAL = movimentos.CUSTO_DIAGONAL
+
     def __init__(self) -> None:
         """Instância um problema para servir de troca de informações
             entre os agentes explorador e de resgate.
         """
-        # Crenças do ambiente: {linha: {coluna: 'descricao'}}
-        self.ambiente_crencas: dict[int, dict[int, int]] = {0: {0: 'b'}}
+        # Crenças do ambiente: grade de ocupação com a base na posição (0, 0)
+        self.mapa_crencas: MapaCrencas = MapaCrencas()
 
-        # Grafo das posições: {'linha:coluna': [lista_adjacencia]}
-        self.grafo_posicoes: dict[str, list[str]] = {'0:0': []}
+        # Grafo das posições: {(linha, coluna): [lista_adjacencia]}
+        self.grafo_posicoes: dict[ChavePosicao, list[ChavePosicao]] = {CHAVE_BASE: []}
 
-        # Sinais vitais das vítimas: {'linha:coluna': [s.i, i.n, a.i, s.v, i.t, a.i, s]}
-        self.sinais_vitais_vitimas: dict[str, list[float]] = {}
+        # Sinais vitais das vítimas: {(linha, coluna): [s.i, i.n, a.i, s.v, i.t, a.i, s]}
+        self.sinais_vitais_vitimas: dict[ChavePosicao, list[float]] = {}
+
+        # Campo de custos até a base: {(linha, coluna): custo} e {(linha, coluna): próxima posição}
+        self.custo_base: dict[ChavePosicao, float] = {CHAVE_BASE: 0.0}
+        self.proximo_passo_base: dict[ChavePosicao, ChavePosicao] = {}
 
     def atualiza_crenca_posicao_ambiente(
             self,
-            passo_usado: dict[str, int],
+            passo_usado: Passo,
             posicao_atual: Estado,
             descricao: str
         ) -> None:
         """Atualiza a crença de uma posição do ambiente com o que foi encontrado nela.
 
         Args:
-            passo_usado (dict[str, int]): passo utilziado.
+            passo_usado (Passo): passo utilziado.
             posicao_atual (Estado): ojbeto Estado que identifica a posição.
             descricao (str): descrição do quê foi encontrado na posição.
         """
         # Se não for uma parede, atualiza o grafo_posicoes
         if descricao != 'w':
             posicao_anterior = Estado(
-                linha = (posicao_atual.linha - passo_usado['linha']),
-                coluna = (posicao_atual.coluna - passo_usado['coluna'])
+                linha = (posicao_atual.linha - passo_usado.linha),
+                coluna = (posicao_atual.coluna - passo_usado.coluna)
             )
             chave_pos_atual = posicao_atual.get_chave_posicao()
             chave_pos_anterior = posicao_anterior.get_chave_posicao()
 
             if chave_pos_atual not in self.grafo_posicoes:
-                self.grafo_posicoes[chave_pos_atual] = []
+                self.__adiciona_posicao_no_grafo(chave_pos_atual)
 
             if chave_pos_anterior not in self.grafo_posicoes[chave_pos_atual]:
                 self.grafo_posicoes[chave_pos_atual].append(chave_pos_anterior)
+                self.__atualiza_campo_base(chave_pos_atual)
 
             if chave_pos_atual not in self.grafo_posicoes[chave_pos_anterior]:
                 self.grafo_posicoes[chave_pos_anterior].append(chave_pos_atual)
-
-            for chave_posicao, adjacencias_posicao in self.grafo_posicoes.items():
-                for chave_pos_grafo in self.grafo_posicoes:
-                    if chave_pos_grafo == chave_posicao:
-                        continue
-                    if chave_pos_grafo in adjacencias_posicao:
-                        continue
-                    if chave_pos_grafo in self.obtem_adjacencias(chave_posicao.split(':')):
-                        adjacencias_posicao.append(chave_pos_grafo)
+                self.__atualiza_campo_base(chave_pos_anterior)
 
             self.__adiciona_posicao_nas_crencas(posicao_atual, descricao)
             # print(f"{posicao_anterior} -> {posicao_atual}")
             # print(self.grafo_posicoes)
         else:
-            posicao_bloqueada = Estado(
-                (posicao_atual.linha + passo_usado['linha']),
-                (posicao_atual.coluna + passo_usado['coluna'])
-            )
+            posicao_bloqueada = posicao_atual.desloca(passo_usado)
             self.__adiciona_posicao_nas_crencas(posicao_bloqueada, descricao)
 
+    def __adiciona_posicao_no_grafo(self, chave_posicao: ChavePosicao) -> None:
+        """Insere uma posição inédita no grafo ligando-a às posições adjacentes já conhecidas.
+
+        As posições conhecidas já estão ligadas entre si, então apenas as (no máximo 8)
+        adjacências da nova posição mudam: O(1) por passo do explorador.
+
+        Args:
+            chave_posicao (ChavePosicao): posição inédita visitada pelo agente.
+        """
+        adjacencias_posicao = []
+        for chave_adjacente in self.obtem_adjacencias(chave_posicao):
+            adjacencias_adjacente = self.grafo_posicoes.get(chave_adjacente)
+            if adjacencias_adjacente is not None:
+                adjacencias_posicao.append(chave_adjacente)
+                adjacencias_adjacente.append(chave_posicao)
+        self.grafo_posicoes[chave_posicao] = adjacencias_posicao
+        self.__atualiza_campo_base(chave_posicao)
+
+    def custo_passo(self, origem: ChavePosicao, destino: ChavePosicao) -> float:
+        """Retorna o custo de um passo entre duas posições adjacentes."""
+        return movimentos.custo_passo(destino[0] - origem[0], destino[1] - origem[1])
+
+    def __atualiza_campo_base(self, chave_posicao: ChavePosicao) -> None:
+        """Atualiza o campo de custos até a base após a posição ganhar adjacências (Dijkstra
+            dinâmico).
+
+        O grafo só ganha posições e arestas, então os custos só diminuem: a posição toma o
+            menor custo por suas adjacências e as reduções são propagadas a partir dela, sem
+            refazer a busca no grafo inteiro.
+
+        Args:
+            chave_posicao (ChavePosicao): posição que ganhou adjacências.
+        """
+        custo_base = self.custo_base
+        proximo_passo_base = self.proximo_passo_base
+
+        for adjacente in self.grafo_posicoes[chave_posicao]:
+            if adjacente in custo_base:
+                custo = custo_base[adjacente] + self.custo_passo(adjacente, chave_posicao)
+                if custo < custo_base.get(chave_posicao, float('inf')):
+                    custo_base[chave_posicao] = custo
+                    proximo_passo_base[chave_posicao] = adjacente
+
+        if chave_posicao not in custo_base:
+            return
+
+        fila = [(custo_base[chave_posicao], chave_posicao)]
+        while fila:
+            custo, posicao = heapq.heappop(fila)
+            if custo > custo_base[posicao]:
+                continue
+            for adjacente in self.grafo_posicoes[posicao]:
+                novo_custo = custo + self.custo_passo(posicao, adjacente)
+                if novo_custo < custo_base.get(adjacente, float('inf')):
+                    custo_base[adjacente] = novo_custo
+                    proximo_passo_base[adjacente] = posicao
+                    heapq.heappush(fila, (novo_custo, adjacente))
+
     def __adiciona_posicao_nas_crencas(self, posicao: Estado, descricao: str) -> None:
-        if posicao.linha not in self.ambiente_crencas:
-            self.ambiente_crencas[posicao.linha] = {}
+        self.mapa_crencas.define(posicao.linha, posicao.coluna, MapaCrencas.CODIGOS[descricao])
+
+    def obtem_adjacencias(self, posicao: ChavePosicao) -> list[ChavePosicao]:
+        """Retorna uma lista onde cada item é a chave de uma posição adjacente.
+
+        Args:
+            posicao (ChavePosicao): posição que se deseja descobrir as adjacências.
+
+        Returns:
+            list[ChavePosicao]: lista com as chaves das posições adjacentes.
+        """
+        linha, coluna = posicao
 
-        self.ambiente_crencas[posicao.linha][posicao.coluna] = descricao
-        # print(self.ambiente_crencas)
+        return [
+            (linha + var_linha, coluna + var_coluna)
+            for var_linha, var_coluna in movimentos.VARIACOES
+        ]
 
-    def obtem_adjacencias(self, posicao: list) -> list[str]:
-        """Retorna uma lista de strings onde cada item é a
-            chave de uma posição adjacente.
+    def incorpora(self, outro: 'Problema') -> None:
+        """Junta ao problema o que foi descoberto em outro problema com a mesma base
+            (ex.: o de outro agente explorador).
+
+        - As crenças desconhecidas aqui recebem as do outro mapa;
+        - As posições do outro grafo são inseridas ligadas às adjacentes conhecidas,
+            atualizando o campo de custos até a base;
+        - As vítimas do outro problema são acrescentadas.
+
+        Args:
+            outro (Problema): problema a ser incorporado.
+        """
+        self.mapa_crencas.incorpora(outro.mapa_crencas)
+
+        for chave_posicao in outro.grafo_posicoes:
+            if chave_posicao not in self.grafo_posicoes:
+                self.__adiciona_posicao_no_grafo(chave_posicao)
+
+        for chave_posicao, sinais_vitais in outro.sinais_vitais_vitimas.items():
+            self.set_sinais_vitais_vitima(chave_posicao, sinais_vitais)
+
+    def copia_com_vitimas(self, chaves_vitimas: list[ChavePosicao]) -> 'Problema':
+        """Retorna uma cópia do problema que compartilha mapa, grafo e campo de custos,
+            mas contém apenas as vítimas indicadas (ex.: as atribuídas a um socorrista).
+
+        Args:
+            chaves_vitimas (list[ChavePosicao]): posições das vítimas mantidas.
+
+        Returns:
+            Problema: cópia rasa do problema com as vítimas selecionadas.
+        """
+        copia = copy.copy(self)
+        copia.sinais_vitais_vitimas = {
+            chave: self.sinais_vitais_vitimas[chave] for chave in chaves_vitimas
+        }
+        return copia
+
+    def salva(self, arquivo) -> None:
+        """Salva o problema em um arquivo NPZ compacto, para que o planejamento do resgate
+            possa ser refeito fora da simulação (ex.: em benchmarks dos planejadores).
+
+        - Crenças: a grade int8 e a posição da base nela;
+        - Grafo: posições [V, 2] na ordem de inserção e adjacências em formato CSR
+            (indptr [V + 1], indices [E]), mantendo a ordem das listas de adjacência;
+        - Campo de custos até a base: custo [V] (inf se desconhecido) e índice da próxima
+            posição [V] (-1 se não há);
+        - Vítimas: posições [n, 2] e matriz dos sinais vitais [n, k].
+
+        Args:
+            arquivo (str | file): caminho ou arquivo aberto em modo binário.
+        """
+        posicoes = list(self.grafo_posicoes)
+        indice_posicao = {chave_posicao: indice for indice, chave_posicao in enumerate(posicoes)}
+
+        indptr = np.zeros(len(posicoes) + 1, dtype=np.int32)
+        indptr[1:] = np.cumsum([len(self.grafo_posicoes[chave]) for chave in posicoes])
+        indices = np.fromiter(
+            (
+                indice_posicao[adjacente]
+                for chave in posicoes
+                for adjacente in self.grafo_posicoes[chave]
+            ),
+            dtype=np.int32,
+            count=int(indptr[-1])
+        )
+
+        custo_base = np.array(
+            [self.custo_base.get(chave, np.inf) for chave in posicoes], dtype=np.float64
+        )
+        proximo_passo_base = np.array(
+            [
+                indice_posicao[self.proximo_passo_base[chave]]
+                if chave in self.proximo_passo_base else -1
+                for chave in posicoes
+            ],
+            dtype=np.int32
+        )
+
+        vitimas = list(self.sinais_vitais_vitimas)
+        np.savez_compressed(
+            arquivo,
+            celulas=self.mapa_crencas.celulas,
+            origem=np.array(
+                [self.mapa_crencas.origem_linha, self.mapa_crencas.origem_coluna], dtype=np.int64
+            ),
+            posicoes=np.array(posicoes, dtype=np.int32).reshape(-1, 2),
+            indptr=indptr,
+            indices=indices,
+            custo_base=custo_base,
+            proximo_passo_base=proximo_passo_base,
+            vitimas=np.array(vitimas, dtype=np.int32).reshape(-1, 2),
+            sinais_vitais=np.array(
+                [self.sinais_vitais_vitimas[chave] for chave in vitimas] or np.zeros((0, 0)),
+                dtype=np.float64
+            ),
+        )
+
+    @classmethod
+    def carrega(cls, arquivo) -> 'Problema':
+        """Recria um problema salvo com Problema.salva.
+
+        Os sinais vitais voltam como listas de float.
 
         Args:
-            posicao (list): posição que se deseja descobrir as adjacências.
+            arquivo (str | file): caminho ou arquivo aberto em modo binário.
 
         Returns:
-            list[str]: lista com as chaves das posições adjacentes.
+            Problema: problema com as mesmas crenças, grafo, campo de custos e vítimas.
         """
-        lista_adjacencias = []
-        linha = int(posicao[0])
-        coluna = int(posicao[1])
+        problema = cls()
+        with np.load(arquivo) as dados:
+            problema.mapa_crencas.celulas = dados['celulas'].copy()
+            problema.mapa_crencas.origem_linha, problema.mapa_crencas.origem_coluna = (
+                int(origem) for origem in dados['origem']
+            )
+
+            posicoes = [tuple(posicao) for posicao in dados['posicoes'].tolist()]
+            indptr = dados['indptr'].tolist()
+            indices = dados['indices'].tolist()
+            problema.grafo_posicoes = {
+                chave: [posicoes[indice] for indice in indices[indptr[i]:indptr[i + 1]]]
+                for i, chave in enumerate(posicoes)
+            }
 
-        lista_adjacencias.append(f"{str(linha - 1)}:{str(coluna - 1)}") # (-1, -1)
-        lista_adjacencias.append(f"{str(linha - 1)}:{str(coluna)}")     # (-1, 0)
-        lista_adjacencias.append(f"{str(linha - 1)}:{str(coluna + 1)}") # (-1, 1)
-        lista_adjacencias.append(f"{str(linha)}:{str(coluna - 1)}")     # (0, -1)
-        lista_adjacencias.append(f"{str(linha)}:{str(coluna + 1)}")     # (0, 1)
-        lista_adjacencias.append(f"{str(linha + 1)}:{str(coluna - 1)}") # (1, -1)
-        lista_adjacencias.append(f"{str(linha + 1)}:{str(coluna)}")     # (1, 0)
-        lista_adjacencias.append(f"{str(linha + 1)}:{str(coluna + 1)}") # (1, 1)
+            problema.custo_base = {
+                chave: custo
+                for chave, custo in zip(posicoes, dados['custo_base'].tolist())
+                if custo != np.inf
+            }
+            problema.proximo_passo_base = {
+                chave: posicoes[indice]
+                for chave, indice in zip(posicoes, dados['proximo_passo_base'].tolist())
+                if indice >= 0
+            }
 
-        return lista_adjacencias
+            problema.sinais_vitais_vitimas = {
+                tuple(chave): sinais_vitais
+                for chave, sinais_vitais in zip(
+                    dados['vitimas'].tolist(), dados['sinais_vitais'].tolist()
+                )
+            }
+        return problema
 
     def verifica_estado_inedito(self, estado_futuro: Estado) -> bool:
         """Verifica se a posição ainda não foi visitada no mapa.
@@ -116,29 +313,25 @@ class Problema:
         Returns:
             bool: True se o estado é inedito, False caso contrário.
         """
-        if estado_futuro.linha not in self.ambiente_crencas:
-            return True
-        if estado_futuro.coluna not in self.ambiente_crencas[estado_futuro.linha]:
-            return True
-        return False
+        return self.mapa_crencas.eh_desconhecida(estado_futuro.linha, estado_futuro.coluna)
 
-    def set_sinais_vitais_vitima(self, chave_posicao: str, sinais_vitais: list):
+    def set_sinais_vitais_vitima(self, chave_posicao: ChavePosicao, sinais_vitais: list):
         """Salva os sinais vitais da vítima de acordo com a sua posição no ambiente.
 
         Args:
-            chave_posicao (str): chave da posição da vítima.
+            chave_posicao (ChavePosicao): chave da posição da vítima.
             sinais_vitais (list): sinais vitais da vítima.
         """
         if self.verifica_vitima_inedita(chave_posicao):
             self.sinais_vitais_vitimas[chave_posicao] = sinais_vitais
         # print(self.sinais_vitais_vitimas)
 
-    def verifica_vitima_inedita(self, chave_posicao: str) -> bool:
+    def verifica_vitima_inedita(self, chave_posicao: ChavePosicao) -> bool:
         """Verifica se a chave da posição passada está presente na chave do
             dicionário dos sinais vitais.
 
         Args:
-            chave_posicao (str): chave que identifica a posição da vítima.
+            chave_posicao (ChavePosicao): chave que identifica a posição da vítima.
         Returns:
             bool: True se a vítima nunca foi encontrada, False caso contrário.
         """
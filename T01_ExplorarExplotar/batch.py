@@ -0,0 +1,120 @@
+## BATCH RUNNER
+### Runs many scenario folders with the headless engine on a pool of processes
+### and aggregates the found/saved metrics of every agent in one table.
+###
+### Usage: python batch.py [scenarios...] [--workers N] [--seed S] [--plan P] [--engine E] [--csv file] [--json file]
+###   scenarios are folder names or glob patterns relative to data_folder/
+###   (or absolute paths). Without scenarios, every folder of data_folder/ is run.
+
+import os
+import io
+import sys
+import glob
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import metrics
+from main import build_env
+from agentes.explorador.explorer import Explorer
+from agentes.resgate.planos.resgate_genetico import PlanoResgateGenetico
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data_folder")
+
+
+def find_scenarios(patterns):
+    """ Expand the scenario names and glob patterns into scenario folders
+    @param patterns: list of folder names or glob patterns
+    @return: sorted list of absolute paths of the folders that have an env_size.txt"""
+
+    if not patterns:
+        patterns = ["*"]
+
+    folders = set()
+    for pattern in patterns:
+        if not os.path.isabs(pattern):
+            pattern = os.path.join(DATA_FOLDER, pattern)
+        for folder in glob.glob(pattern):
+            if os.path.isfile(os.path.join(folder, "env_size.txt")):
+                folders.add(os.path.abspath(folder))
+
+    return sorted(folders)
+
+
+def run_scenario(data_folder, seed=None, plan="dfs", engine="objetos"):
+    """ Run one scenario with the headless engine. The output of the agents is discarded.
+    @param data_folder: absolute path of the scenario folder
+    @param seed: seed of the simulation, None for a non reproducible run
+    @param plan: exploration plan of the explorer
+    @param engine: genetic engine of the rescuers
+    @return: list of rows (dicts with the metrics.COLUMNS keys), one per agent; a run
+    stopped by the tick limit of the environment has complete=False"""
+
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        env = build_env(data_folder, seed, plan, engine)
+        result = env.run_headless(env.get_tick_limit())
+
+    return metrics.results_rows(result)
+
+
+def run_batch(folders, workers=None, seed=None, plan="dfs", engine="objetos"):
+    """ Run the scenarios on a pool of processes. Each scenario has its own
+    environment and generators, so the results do not depend on the workers.
+    @param folders: list of absolute paths of scenario folders
+    @param workers: number of processes, None for the number of cores
+    @param seed: seed of every simulation, None for non reproducible runs
+    @param plan: exploration plan of the explorers
+    @param engine: genetic engine of the rescuers
+    @return: the rows of every scenario, in the order of the folders"""
+
+    rows = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_scenario, folder, seed, plan, engine): folder for folder in folders}
+        for future in as_completed(futures):
+            folder = futures[future]
+            try:
+                rows[folder] = future.result()
+            except (Exception, SystemExit) as error:
+                print(f"from batch: {os.path.basename(folder)} failed: {error!r}", file=sys.stderr)
+                rows[folder] = []
+            print(f"from batch: {os.path.basename(folder)} done", file=sys.stderr)
+
+    return [row for folder in folders for row in rows[folder]]
+
+
+def print_table(rows):
+    """ Print the aggregated rows as an aligned table """
+    columns = metrics.COLUMNS
+    cells = [[f"{row[col]:.2f}" if isinstance(row[col], float) else str(row[col]) for col in columns]
+             for row in rows]
+    widths = [max([len(col)] + [len(line[i]) for line in cells]) for i, col in enumerate(columns)]
+    print("  ".join(col.ljust(w) for col, w in zip(columns, widths)))
+    print("  ".join("-" * w for w in widths))
+    for line in cells:
+        print("  ".join(cell.ljust(w) for cell, w in zip(line, widths)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run many VictimSim scenarios in parallel")
+    parser.add_argument("scenarios", nargs="*", help="folder names or glob patterns under data_folder/")
+    parser.add_argument("--workers", type=int, default=None, help="number of processes (default: cores)")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the simulations (reproducible runs)")
+    parser.add_argument("--plan", choices=sorted(Explorer.PLANOS_EXPLORACAO), default="dfs",
+                        help="exploration plan of the explorer (default: dfs)")
+    parser.add_argument("--engine", choices=sorted(PlanoResgateGenetico.MOTORES), default="objetos",
+                        help="genetic engine of the rescuers (default: objetos)")
+    parser.add_argument("--csv", default=None, help="also write the table to this csv file")
+    parser.add_argument("--json", default=None, help="also write the table to this json file")
+    args = parser.parse_args()
+
+    folders = find_scenarios(args.scenarios)
+    if not folders:
+        print("from batch: no scenario folder found")
+        sys.exit(1)
+
+    rows = run_batch(folders, args.workers, args.seed, args.plan, args.engine)
+    print_table(rows)
+    if args.csv:
+        metrics.write_csv(rows, args.csv)
+    if args.json:
+        metrics.write_json(rows, args.json)
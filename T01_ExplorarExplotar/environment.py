@@ -3,12 +3,22 @@
 
 import sys
 import os
-import pygame
 import random
-import csv
 import time
+import numpy as np
 from agentes.explorador.explorer import Explorer
 from physical_agent import PhysAgent
+from grid import Grid
+import scenario_format
+from results import AgentResult, SimulationResult
+import metrics
+
+# pygame is only needed for the visual run; the headless engine works without it
+try:
+    import pygame
+    from renderer import Renderer
+except ImportError:
+    pygame = None
 
 
 ## Class Environment
@@ -31,61 +41,56 @@ class Env:
     IDX_GRAVITY = 6
     IDX_SEVERITY = 7
 
-    def __init__(self, data_folder):
+    def __init__(self, data_folder, seed=None):
         # instance attributes
         self.data_folder = data_folder # folder for the config and data files
+        self.seed = seed       # seed of the simulation, None for a non reproducible run
+        self.rng = random.Random(seed) # master generator: each agent gets its own (spawn_rng)
         self.dic = {}          # configuration of grid and window
         self.agents = []       # list of running physical agents
-        self.walls  = None     # list of walls - 1 for walls, 0 for no walls - inner list is row
+        self.grid   = None     # NumPy layers of walls, traces and victims indexed by [x, y]
                                # explorer agent cannot access this attribute, it has to find!
         self.nb_of_victims = 0 # total number of victims
-        self.victims = []      # positional: the coordinates of the victims [(x1,y1), ..., (xn, yn)]
-        self.severity = []     # positional: the injury severity for each victim (label)
-        self.gravity = []      # positional: the injury gravity for each victim (float value)
+        self.victims = None    # positional: the coordinates of the victims, int array [[x1,y1], ..., [xn, yn]]
+        self.severity = None   # positional: the injury severity for each victim (label) - int array
+        self.gravity = None    # positional: the injury gravity for each victim (float value) - float array
         self.sum_gravity = 0   # sum of all gravity values for peg and psg calculation
-        self.signals = []      # positional: the vital signals of the victims [[i,s1,...,s5,g,l],...]
-        self.found   = [[]]    # positional: Physical agents that found each victim [[ag1] [ag2, ag3], ...] ag1 found vict 0, ag2 and 3, vict 1, ... 
-        self.saved   = [[]]    # positional: Physical agents that saved each victim
+        self.signals = None    # positional: the vital signals of the victims, float32 array [[i,s1,...,s5,g,l],...]
+        self.found   = None    # positional: True if at least one agent found the victim (bool array)
+        self.saved   = None    # positional: True if at least one agent saved the victim (bool array)
+                               # each physical agent keeps the set of victims it found and saved
+        self.death_listeners = [] # functions called with the mind of an agent when it dies
 
         # Read the environment config file
         self.__read_config()
         # print(self.dic)
 
-        # Set up the walls - it's a list composed of GRID_WIDTH lists. Each sublist is a column (y=0, 1, ...)
-        self.walls = [[0 for y in range(self.dic["GRID_HEIGHT"])] for x in range(self.dic["GRID_WIDTH"])]
-        walls_file = os.path.join(self.data_folder,"env_walls.txt")
-
-        with open(walls_file, 'r') as csvfile:
-            csvreader = csv.reader(csvfile)
-            for row in csvreader:
-                x = int(row[0])
-                y = int(row[1])
-                self.walls[x][y] = 1
-        # print(self.walls)
-
-        # Read and put the victims into the grid
-
-        victims_file = os.path.join(self.data_folder,"env_victims.txt")
-
-        with open(victims_file, 'r') as csvfile:
-            csvreader = csv.reader(csvfile)
-            for row in csvreader:
-                x = int(row[0])
-                y = int(row[1])
-                self.victims.append((x, y))   # append tuples
-
+        # Read the walls, the victims and their vital signals: memory-mapped from the
+        # binary scenario file when it is up to date, from the text files otherwise
+        width, height = self.dic["GRID_WIDTH"], self.dic["GRID_HEIGHT"]
+        scenario_file = os.path.join(self.data_folder, scenario_format.SCENARIO_FILE)
+        if scenario_format.is_up_to_date(self.data_folder):
+            walls, victims, signals = scenario_format.open_scenario(scenario_file)
+            if walls.shape != (width, height):
+                print(f"from env: {scenario_format.SCENARIO_FILE} grid size differs from env_size.txt")
+                print("from env: end of execution")
+                exit()
+        else:
+            walls, victims, signals = scenario_format.read_text_scenario(self.data_folder, width, height)
+
+        # Set up the grid - walls, traces and victims layers, indexed by [x, y]
+        self.grid = Grid(width, height, walls)
+
+        # Put the victims into the grid
+        self.victims = victims
         self.nb_of_victims = len(self.victims)
+        self.grid.set_victims(self.victims)
 
-        # Load the vital signals of the victims
-        vs_file = os.path.join(self.data_folder,"sinais_vitais.txt")
-
-        with open(vs_file, 'r') as csvfile:
-            csvreader = csv.reader(csvfile)
-            for row in csvreader:
-                self.signals.append(row)
-                self.severity.append(int(row[Env.IDX_SEVERITY]))
-                self.gravity.append(float(row[Env.IDX_GRAVITY]))
-                self.sum_gravity = self.sum_gravity + float(row[Env.IDX_GRAVITY])
+        # Vital signals, severity labels and gravity values of the victims
+        self.severity = signals[:, Env.IDX_SEVERITY].astype(np.int32)
+        self.gravity = signals[:, Env.IDX_GRAVITY].astype(np.float64)
+        self.sum_gravity = float(self.gravity.sum())
+        self.signals = signals if signals.dtype == np.float32 else signals.astype(np.float32)
 
         if self.nb_of_victims > len(self.signals):
             print("from env: number of victims of env_victims.txt greater than vital signals")
@@ -96,12 +101,9 @@ class Env:
             print("from env: nb of victims of env_victims.txt less than vital signals")
             print("from env: Assuming nb of victims of env_victims.txt")
 
-        # Set up found and saved victims' lists 
-        self.found = [[] for v in range(self.nb_of_victims)]
-        self.saved = [[] for v in range(self.nb_of_victims)]
-
-        # Set up with the trace color of the last physical agent who visited the cell
-        self.visited = [[(0,0,0) for y in range(self.dic["GRID_HEIGHT"])] for x in range(self.dic["GRID_WIDTH"])]
+        # Set up found and saved victims' masks
+        self.found = np.zeros(self.nb_of_victims, dtype=bool)
+        self.saved = np.zeros(self.nb_of_victims, dtype=bool)
 
     def __read_config(self):
         """ Read the size of the grid and window and loads into a dictionary """   
@@ -135,66 +137,87 @@ class Env:
         @param state: the state of the physical agent
         @return: an object that is the physical agent"""
 
+        if len(self.agents) >= Grid.MAX_AGENTS:
+            print(f"from env: at most {Grid.MAX_AGENTS} agents are supported")
+            print("from env: end of execution")
+            exit()
+
         body = PhysAgent(mind, self, self.dic["BASE"][0], self.dic["BASE"][1], state) 
         self.agents.append(body)
+        body.id = len(self.agents)   # ids start at 1, 0 means no agent in the trace layer
         return body
 
-    def __draw(self):
-        """ This private method draw the grid and its items """
-
-        # Set cell width and height
-        cell_w = self.dic["WINDOW_WIDTH"]/self.dic["GRID_WIDTH"]
-        cell_h = self.dic["WINDOW_HEIGHT"]/self.dic["GRID_HEIGHT"]
-
-        # Clear the screen
-        self.screen.fill(Env.WHITE)
-
-        # Draw the grid
-        for x in range(self.dic["GRID_WIDTH"]):
-            for y in range(self.dic["GRID_HEIGHT"]):
-                rect = pygame.Rect(x * cell_w, y * cell_h, cell_w, cell_h)
-                pygame.draw.rect(self.screen, Env.BLACK, rect, 1)
-
-                if self.walls[x][y] == 1:
-                    wall_rect = pygame.Rect(x * cell_w + 1, y * cell_h + 1, cell_w - 2, cell_h - 2)
-                    pygame.draw.rect(self.screen, Env.BLACK, wall_rect)                   
-
-                # Paint visited cells
-                if self.visited[x][y] != (0,0,0):
-                    trace_color = self.visited[x][y]
-                    visited_rect = pygame.Rect(x * cell_w + 1, y * cell_h + 1, cell_w - 2, cell_h - 2)
-                    pygame.draw.rect(self.screen, trace_color, visited_rect)
-
-        # Draw a marker at the base
-        rect = pygame.Rect(self.dic["BASE"][0] * cell_w, self.dic["BASE"][1] * cell_h, cell_w, cell_h)
-        pygame.draw.rect(self.screen, Env.CYAN, rect, 4)       
-
-        # Draw the victims
-        v=0
-        for victim in self.victims:
-            victim_rect = pygame.Rect(victim[0] * cell_w + 2, victim[1] * cell_h + 2, cell_w - 4, cell_h - 4)
-            c = self.severity[v]-1
-            pygame.draw.ellipse(self.screen, Env.VICTIM_COLOR[c], victim_rect)
-            if self.saved[v] != []:
-                pygame.draw.ellipse(self.screen, self.WHITE, victim_rect, 3)
-            elif self.found[v] != []:
-                pygame.draw.ellipse(self.screen, self.BLACK, victim_rect, 3)
-            v = v + 1
-
-        # Draw the physical agents
+    def spawn_rng(self):
+        """ This public method creates an independent random generator for an agent.
+        The generators are drawn from the master one in the order the agents are
+        created, so the same seed reproduces the same run.
+        @return: a random.Random instance"""
+
+        return random.Random(self.rng.getrandbits(64))
+
+    def add_death_listener(self, listener):
+        """ This public method registers a function to be called when an agent dies, e.g.
+        a coordinator that waits for the maps of several explorers.
+        @param listener: function receiving the mind of the dead agent"""
+
+        self.death_listeners.append(listener)
+
+    def __kill_agent(self, body):
+        """ This private method sets an agent DEAD and notifies the death listeners
+        @param body: the physical agent"""
+
+        body.set_state(PhysAgent.DEAD)
+        for listener in self.death_listeners:
+            listener(body.mind)
+
+    def get_trace_color(self, agent_id):
+        """ This public method returns the trace color of an agent
+        @param agent_id: the id of the physical agent (as stored in the trace layer)
+        @return: the TRACE_COLOR of the agent"""
+
+        return self.agents[agent_id - 1].mind.TRACE_COLOR
+
+    def __schedule_agents(self, verbose=True):
+        """ This private method runs one reasoning cycle: it calls the deliberate
+        method of each ACTIVE agent and updates the state of the agents.
+        IDLE agents cannot wake themselves up: only an ACTIVE agent can activate them
+        (e.g. an explorer sending its map to a rescuer), so they do not keep the
+        simulation running.
+        @param verbose: if True, print the changes of state of the agents
+        @return: True if there is at least one ACTIVE agent after the cycle, False otherwise"""
+
+        # ask each agent to deliberate the next action
         for body in self.agents:
+
+            # Asks the agent to choose and to do the next action if it is ACTIVE
             if body.state == PhysAgent.ACTIVE:
-               ag_rect = pygame.Rect(body.x * cell_w, body.y * cell_h, cell_w, cell_h)
-               pygame.draw.rect(self.screen, body.mind.COLOR, ag_rect)
-               active_idle = True
+                more_actions_to_do = body.mind.deliberate()
+
+                # Test if the agent exceeded the time limit
+                if body.end_of_time():
+                    self.__kill_agent(body)
+                    if verbose:
+                        print("from env: " + body.mind.NAME + ": time limit reached, no batt, it is dead")
+                elif not more_actions_to_do: # agent do not have more actions to do
+                    if body.at_base():
+                        if verbose:
+                            print("from env: ag " + body.mind.NAME + " succesfully terminated, it is at the base")
+                        body.set_state(PhysAgent.ENDED)
+                    else:
+                        if verbose:
+                            print("from env: ag " + body.mind.NAME + " lost its mind, not at the base, and asked for termination. Now, it's dead")
+                        self.__kill_agent(body)
 
-        # Update the display
-        pygame.display.update()
+        # an agent may have been activated by another one during the cycle
+        return any(body.state == PhysAgent.ACTIVE for body in self.agents)
 
     def run(self):
         """ This public method is the engine of the simulator. It calls the deliberate
         method of each ACTIVE agent situated in the environment. Then, it updates the state
         of the agents and of the environment"""
+        if pygame is None:
+            raise RuntimeError("from env: pygame is not installed, use run_headless() instead")
+
         # Set up Pygame
         pygame.init()
 
@@ -204,8 +227,10 @@ class Env:
         # Create the window
         self.screen = pygame.display.set_mode((self.dic["WINDOW_WIDTH"], self.dic["WINDOW_HEIGHT"]))
 
-        # Draw the environment with items
-        self.__draw()
+        # Draw the environment with items: the static layer is rendered once,
+        # then only the cells touched by the agents are redrawn
+        self.renderer = Renderer(self, self.screen)
+        self.renderer.draw()
 
         # Create the main loop
         running = True
@@ -216,41 +241,19 @@ class Env:
                 if event.type == pygame.QUIT:
                     running = False
 
-            # control whether or not there are active or idle agents
-            active_or_idle = False
-
-            # ask each agent to deliberate the next action
-            for body in self.agents:
-
-                # Asks the agent to choose and to do the next action if it is ACTIVE
-                if body.state == PhysAgent.ACTIVE:
-                    active_or_idle = True
-                    more_actions_to_do = body.mind.deliberate()
-
-                    # Test if the agent exceeded the time limit
-                    if body.end_of_time():
-                        body.set_state(PhysAgent.DEAD)
-                        print("from env: " + body.mind.NAME + ": time limit reached, no batt, it is dead")
-                    elif not more_actions_to_do: # agent do not have more actions to do
-                        if body.at_base():
-                            print("from env: ag " + body.mind.NAME + " succesfully terminated, it is at the base")
-                            body.set_state(PhysAgent.ENDED)
-                        else:
-                            print("from env: ag " + body.mind.NAME + " lost its mind, not at the base, and asked for termination. Now, it's dead")
-                            body.set_state(PhysAgent.DEAD)
-
-                elif body.state == PhysAgent.IDLE:
-                    active_or_idle = True
+            active = self.__schedule_agents()
 
             # Update the grid after the delay
             if self.dic["DELAY"] > 0:
                 time.sleep(self.dic["DELAY"])
 
-            self.__draw()
+            self.renderer.draw()
 
             # Show metrics
-            if not active_or_idle:
-                print("from env: no active or idle agent scheduled for execution... terminating")
+            if not active:
+                print("from env: no active agent scheduled for execution... terminating")
+                for name in self.get_idle_agents():
+                    print(f"from env: ag {name} is still IDLE, no agent can activate it")
                 self.print_results()
                 print("\n--------------")
                 input("from env: Tecle qualquer coisa para encerrar >>")
@@ -259,6 +262,80 @@ class Env:
         # Quit Pygame
         pygame.quit()
 
+    def run_headless(self, max_ticks=None):
+        """ This public method is the engine of the simulator without any display.
+        It schedules the agents exactly as run() does, but it does not draw, does not
+        wait for the DELAY and does not ask for a key at the end.
+        The run stops when no agent is ACTIVE; the agents left IDLE are reported in
+        the result (SimulationResult.idle_agents).
+        @param max_ticks: optional limit of reasoning cycles, None for no limit
+        @return: a SimulationResult with what happened to each agent"""
+
+        ticks = 0
+        active = True
+        while active and (max_ticks is None or ticks < max_ticks):
+            active = self.__schedule_agents(verbose=False)
+            ticks = ticks + 1
+
+        # the cap stopped agents that were still ACTIVE: the run is incomplete
+        return self.get_results(ticks, capped=active)
+
+    def get_tick_limit(self):
+        """ This public method bounds the number of reasoning cycles of a run. Each
+        deliberation of an ACTIVE agent consumes at least its cheapest action, so an agent
+        cannot be ACTIVE for more than TLIM / (cheapest cost) cycles; in the worst case the
+        agents run one after the other.
+        @return: an upper bound of the ticks of a run, to be passed as max_ticks"""
+
+        ticks = 0
+        for body in self.agents:
+            mind = body.mind
+            costs = [cost for cost in (mind.COST_LINE, mind.COST_DIAG, mind.COST_READ, mind.COST_FIRST_AID)
+                     if cost > 0]
+            ticks += int(mind.TLIM / min(costs, default=1.0)) + 1
+        return ticks
+
+    def get_idle_agents(self):
+        """ @return: the names of the agents that are still IDLE (never activated) """
+        return [body.mind.NAME for body in self.agents if body.state == PhysAgent.IDLE]
+
+    def get_results(self, ticks=0, capped=False):
+        """ This public method collects the found and saved victims of each agent.
+        @param ticks: number of reasoning cycles executed so far
+        @param capped: True if the run was stopped by max_ticks with ACTIVE agents
+        @return: a SimulationResult"""
+
+        agents = []
+        for body in self.agents:
+            found = body.get_found_victims()
+            saved = body.get_saved_victims()
+            agents.append(AgentResult(body.mind.NAME, body.state, body.mind.TLIM, body.rtime,
+                                      found, saved,
+                                      self.get_victims_metrics(found), self.get_victims_metrics(saved)))
+
+        return SimulationResult(self.data_folder, self.nb_of_victims, ticks, agents, capped)
+
+    def count_by_severity(self, victims=None):
+        """ Count victims per severity label
+        @param victims: sequential numbers or bool mask (found/saved), None for all the victims
+        @return: int array with the number of victims of severity 1, 2, 3 and 4"""
+
+        return metrics.count_by_severity(self.severity, victims)
+
+    def sum_gravities(self, victims=None):
+        """ Sum the gravity values of victims
+        @param victims: sequential numbers or bool mask (found/saved), None for all the victims
+        @return: the sum of the gravities"""
+
+        return metrics.sum_gravities(self.gravity, victims)
+
+    def get_victims_metrics(self, victims):
+        """ Compute the metrics of found or saved victims
+        @param victims: sequential numbers or bool mask (found/saved)
+        @return: a VictimsMetrics with V1..V4, V, Vg and the gravity percentages"""
+
+        return metrics.compute_metrics(self.severity, self.gravity, victims, self.nb_of_victims)
+
     def __print_victims(self, victims, type_str, sub):
         """ Print either the found or the saved victims list
         @param victims: it is the list to be printed
@@ -269,43 +346,35 @@ class Env:
         if len(victims) > 0:
             print(f"\nList of {type_str} victims followed by the corresponding severity label and gravity")
             print(victims)
-            
-            sev = []
-            grav = []
-            tot_grav = 0        # for peg or psg calculation
-            for v in victims:
-                sev.append(self.severity[v])
-                grav.append(self.gravity[v])
-                tot_grav = tot_grav + self.gravity[v]
-                
-            print(sev)
+
+            print([int(self.severity[v]) for v in victims])
+            result = self.get_victims_metrics(victims)
+            sev = result.severity
 
             print("\n")
-            print(f"Critical victims {type_str}     (V{sub}1) = {sev.count(1):3d} ")
-            print(f"Instable victims {type_str}     (V{sub}2) = {sev.count(2):3d} ")
-            print(f"Pot. inst. victims {type_str}   (V{sub}3) = {sev.count(3):3d} ")
-            print(f"Stable victims {type_str}       (V{sub}4) = {sev.count(4):3d} ")
+            print(f"Critical victims {type_str}     (V{sub}1) = {sev[0]:3d} ")
+            print(f"Instable victims {type_str}     (V{sub}2) = {sev[1]:3d} ")
+            print(f"Pot. inst. victims {type_str}   (V{sub}3) = {sev[2]:3d} ")
+            print(f"Stable victims {type_str}       (V{sub}4) = {sev[3]:3d} ")
             print("--------------------------------------")
-            print(f"Total of {type_str} victims     (V{sub})  = {len(sev):3d} ({100*float(len(sev)/self.nb_of_victims):.2f}%)")
+            print(f"Total of {type_str} victims     (V{sub})  = {result.total:3d} ({result.percent:.2f}%)")
 
-            weighted = ((6*sev.count(1) + 3*sev.count(2) + 2*sev.count(3) + sev.count(4))/
-            (6*self.severity.count(1)+3*self.severity.count(2)+2*self.severity.count(3)+self.severity.count(4)))
+            print(f"Weighted {type_str} victims per severity (V{sub}g) = {result.weighted:.2f}\n")
 
-            print(f"Weighted {type_str} victims per severity (V{sub}g) = {weighted:.2f}\n")
-            
-            print(f"Sum of gravities of all {type_str} victims = {tot_grav:.2f} of a total of {self.sum_gravity:.2f}")
-            print(f"  % of gravities of all {type_str} victims = {tot_grav/self.sum_gravity:.2f}")
+            print(f"Sum of gravities of all {type_str} victims = {result.sum_gravity:.2f} of a total of {self.sum_gravity:.2f}")
+            print(f"  % of gravities of all {type_str} victims = {result.percent_gravity:.2f}")
 
     def print_results(self):
         """ For each agent, print found victims and saved victims by severity
         This is what actually happened in the environment. Observe that the
         beliefs of the agents may be different."""      
 
+        sev = self.count_by_severity()
         print("\n\n\n*** Numbers of Victims in the Environment ***")
-        print(f"Critical victims   (V1) = {self.severity.count(1):3d}")
-        print(f"Instable victims   (V2) = {self.severity.count(2):3d}")
-        print(f"Pot. inst. victims (V3) = {self.severity.count(3):3d}")
-        print(f"Stable victims     (V4) = {self.severity.count(4):3d}")
+        print(f"Critical victims   (V1) = {sev[0]:3d}")
+        print(f"Instable victims   (V2) = {sev[1]:3d}")
+        print(f"Pot. inst. victims (V3) = {sev[2]:3d}")
+        print(f"Stable victims     (V4) = {sev[3]:3d}")
         print("--------------------------------------")
         print(f"Total of victims   (V)  = {self.nb_of_victims:3d}")
 
@@ -314,6 +383,8 @@ class Env:
             print(f"\n[ Agent {body.mind.NAME} ]")
             if body.state == PhysAgent.DEAD:
                 print("This agent is dead, you should discard its results, but...")
+            elif body.state == PhysAgent.IDLE:
+                print("This agent was never activated, it is still IDLE")
 
             # Remaining time
             print("\n*** Used time ***")
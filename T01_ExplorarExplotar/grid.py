@@ -0,0 +1,65 @@
+## GRID
+### NumPy store of the cells of the environment. Each layer is a contiguous
+### array indexed by [x, y], as the walls and visited lists it replaces:
+###   walls   - uint8, 1 for walls, 0 for no walls
+###   trace   - uint8, id of the last physical agent that visited the cell (0 = never visited)
+###   victims - int32, sequential number of the victim in the cell (-1 = no victim)
+
+import numpy as np
+
+
+class Grid:
+    """ Layers of the grid of the environment. The agents' minds MUST NOT access it """
+
+    NO_VICTIM = -1   # value of the victims layer for cells without victim
+    NO_TRACE = 0     # value of the trace layer for cells never visited
+    MAX_AGENTS = 255 # the trace layer stores the agent id in one byte
+
+    def __init__(self, width, height, walls=None):
+        """
+        @param width: GRID_WIDTH of the environment
+        @param height: GRID_HEIGHT of the environment
+        @param walls: optional uint8 wall mask [width, height] to be used as is (it may be
+        a read-only memory map), None for a grid without walls"""
+
+        self.width = width
+        self.height = height
+        self.walls = np.zeros((width, height), dtype=np.uint8) if walls is None else walls
+        self.trace = np.zeros((width, height), dtype=np.uint8)
+        self.victims = np.full((width, height), Grid.NO_VICTIM, dtype=np.int32)
+
+    def set_walls(self, positions):
+        """ Put walls in the grid
+        @param positions: sequence of (x, y) of the walls"""
+
+        positions = np.asarray(positions, dtype=np.intp).reshape(-1, 2)
+        self.walls[positions[:, 0], positions[:, 1]] = 1
+
+    def set_victims(self, positions):
+        """ Put the victims in the grid. If two victims share a cell, the cell keeps
+        the first one (lowest sequential number).
+        @param positions: sequence of (x, y) of the victims, in sequential order"""
+
+        positions = np.asarray(positions, dtype=np.intp).reshape(-1, 2)
+
+        # keep only the first occurrence of each cell
+        cells = positions[:, 0] * self.height + positions[:, 1]
+        _, first = np.unique(cells, return_index=True)
+        self.victims[positions[first, 0], positions[first, 1]] = first.astype(np.int32)
+
+    def victim_at(self, x, y):
+        """ Constant time lookup of the victim in a cell
+        @return: the sequential number of the victim in (x, y) or -1 if there is no victim"""
+        return int(self.victims[x, y])
+
+    def is_free(self, x, y):
+        """ @return: True if (x, y) is inside the grid and it is not a wall """
+        return 0 <= x < self.width and 0 <= y < self.height and self.walls[x, y] == 0
+
+    def mark_visited(self, x, y, agent_id):
+        """ Record the agent as the last one that visited (x, y) """
+        self.trace[x, y] = agent_id
+
+    def visited_cells(self):
+        """ @return: array of (x, y) of the cells visited by any agent """
+        return np.argwhere(self.trace != Grid.NO_TRACE)
@@ -1,45 +1,91 @@
-import sys
 import os
+import argparse
 
 ## importa classes
 from environment import Env
 
 from agentes.explorador.explorer import Explorer
 from agentes.resgate.rescuer import Rescuer
+from agentes.resgate.planos.resgate_genetico import PlanoResgateGenetico
+from agentes.coordenacao.coordenador import Coordenador
 
-def main(data_folder_name):
-    # Set the path to config files and data files for the environment
-    current_folder = os.path.abspath(os.getcwd())
-    data_folder = os.path.abspath(os.path.join(current_folder, data_folder_name))
+def build_env(data_folder, seed=None, plan="dfs", engine="objetos", processes=1):
+    """ Instantiate the environment of a scenario folder with its explorers and rescuers.
+    N_EXPLORERS and N_RESCUERS in env_size.txt set the size of the team (default 1 and 1);
+    a team is wired through a Coordenador that merges the maps and splits the victims.
+    @param data_folder: absolute path to the folder with the config and data files
+    @param seed: seed of the simulation, the same seed reproduces the same run
+    @param plan: exploration plan of the explorer (a key of Explorer.PLANOS_EXPLORACAO)
+    @param engine: genetic engine of the rescuers (a key of PlanoResgateGenetico.MOTORES)
+    @param processes: processes of the 'objetos' genetic engine of each rescuer, None for all the cores
+    @return: the environment, ready to run"""
 
     # Instantiate the environment
-    env = Env(data_folder)
+    env = Env(data_folder, seed)
 
     # config files for the agents
     explorer_file = os.path.join(data_folder, "explorer_config.txt")
     rescuer_file = os.path.join(data_folder, "rescuer_config.txt")
 
+    n_explorers = env.dic.get("N_EXPLORERS", 1)
+    n_rescuers = env.dic.get("N_RESCUERS", 1)
+
     # Instantiate agents rescuer and explorer
-    resc = Rescuer(env, rescuer_file)
+    rescuers = [Rescuer(env, rescuer_file, engine, processes) for _ in range(n_rescuers)]
 
     # Explorer needs to know rescuer to send the map
     # that's why rescuer is instatiated before
-    exp = Explorer(env, explorer_file, resc)
+    if n_explorers == 1 and n_rescuers == 1:
+        exp = Explorer(env, explorer_file, rescuers[0], plan)
+        return env
+
+    # Team: the explorers send their maps to the coordinator at the base
+    coordinator = Coordenador(rescuers, n_explorers, env.spawn_rng())
+    env.add_death_listener(coordinator.explorador_morreu)
+    for i in range(n_explorers):
+        exp = Explorer(env, explorer_file, coordinator, plan, coordinator.setor(i))
+        coordinator.adiciona_explorador(exp)
+        if n_explorers > 1:
+            exp.NAME += str(i + 1)
+
+    if n_rescuers > 1:
+        for i, resc in enumerate(rescuers):
+            resc.NAME += str(i + 1)
+
+    return env
+
+def main(data_folder_name, headless=False, seed=None, plan="dfs", engine="objetos", processes=1):
+    # Set the path to config files and data files for the environment
+    current_folder = os.path.abspath(os.getcwd())
+    data_folder = os.path.abspath(os.path.join(current_folder, data_folder_name))
+
+    env = build_env(data_folder, seed, plan, engine, processes)
 
     # Run the environment simulator
+    if headless:
+        # No window, no delay and no prompt: the results are returned
+        result = env.run_headless()
+        env.print_results()
+        return result
+
     env.run()
 
 data_folder_name = "./data_folder/"
 
 if __name__ == '__main__':
     # To get data from a different folder than the default called data pass it by the argument line
+    # (other folders: data_treino1, "TESTE 2", "TESTE 3")
+    parser = argparse.ArgumentParser(description="Run a VictimSim scenario")
+    parser.add_argument("folder", nargs="?", default="data", help="folder name under data_folder/ (default: data)")
+    parser.add_argument("--headless", action="store_true", help="run without the pygame window")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the simulation (reproducible run)")
+    parser.add_argument("--plan", choices=sorted(Explorer.PLANOS_EXPLORACAO), default="dfs",
+                        help="exploration plan of the explorer (default: dfs)")
+    parser.add_argument("--engine", choices=sorted(PlanoResgateGenetico.MOTORES), default="objetos",
+                        help="genetic engine of the rescuers (default: objetos)")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="processes of the objetos engine, 0 for all the cores (default: 1)")
+    args = parser.parse_args()
 
-    if len(sys.argv) > 1:
-        data_folder_name += sys.argv[1]
-    else:
-        data_folder_name += "data"
-        # data_folder_name += "data_treino1"
-        # data_folder_name += "TESTE 2"
-        # data_folder_name += "TESTE 3"
-
-    main(data_folder_name)
+    main(data_folder_name + args.folder, args.headless, args.seed, args.plan, args.engine,
+         args.processes or None)
@@ -0,0 +1,143 @@
+## METRICS
+### Metrics of the found and saved victims - Ve1..Ve4, Veg, Vs1..Vs4, Vsg and the
+### percentages of gravity - computed from the NumPy arrays of severity and gravity
+### of the environment. They can be used programmatically (VictimsMetrics) or
+### written as JSON/CSV rows, one row per agent of a simulation.
+
+import csv
+import json
+import os
+import numpy as np
+from physical_agent import PhysAgent
+
+# Weights of the severity labels 1 (critical), 2, 3 and 4 (stable) for Veg and Vsg
+SEVERITY_WEIGHTS = np.array([6, 3, 2, 1])
+
+STATE_NAMES = {
+    PhysAgent.ENDED: "ENDED",
+    PhysAgent.ACTIVE: "ACTIVE",
+    PhysAgent.IDLE: "IDLE",
+    PhysAgent.DEAD: "DEAD",
+}
+
+# columns of the rows: sub "e" for the found victims and "s" for the saved ones
+COLUMNS = (["scenario", "agent", "state", "complete", "used_time", "tlim"]
+           + [f"V{sub}{c}" for sub in "es" for c in ("1", "2", "3", "4", "", "g")]
+           + [f"{m}_{sub}" for sub in "es" for m in ("pct_V", "sum_grav", "pct_grav")])
+
+
+def select_victims(values, victims=None):
+    """ Select the positions of a per-victim array
+    @param values: array with one value per victim (severity or gravity)
+    @param victims: sequential numbers (list or array) or a bool mask such as Env.found;
+    None for all the victims
+    @return: the selected values"""
+
+    if victims is None:
+        return values
+    if isinstance(victims, np.ndarray) and victims.dtype == bool:
+        return values[:len(victims)][victims]
+    return values[np.asarray(victims, dtype=np.intp)]
+
+
+def count_by_severity(severity, victims=None):
+    """ @return: int array with the number of victims of severity 1, 2, 3 and 4 """
+    return np.bincount(select_victims(severity, victims), minlength=5)[1:5]
+
+
+def sum_gravities(gravity, victims=None):
+    """ @return: the sum of the gravities of the victims """
+    return float(select_victims(gravity, victims).sum())
+
+
+class VictimsMetrics:
+    """ Metrics of a set of found or saved victims """
+
+    def __init__(self, severity, total, percent, weighted, sum_gravity, percent_gravity):
+        """
+        @param severity: list with the number of victims of severity 1, 2, 3 and 4 (V1..V4)
+        @param total: number of victims (V)
+        @param percent: percentage of the victims of the environment
+        @param weighted: victims weighted per severity (Vg)
+        @param sum_gravity: sum of the gravities of the victims
+        @param percent_gravity: fraction of the sum of gravities of all the victims"""
+
+        self.severity = severity
+        self.total = total
+        self.percent = percent
+        self.weighted = weighted
+        self.sum_gravity = sum_gravity
+        self.percent_gravity = percent_gravity
+
+    def as_dict(self, sub):
+        """ @param sub: character of the metric, "e" for found and "s" for saved
+        @return: a flat dict with the COLUMNS names of the metrics"""
+
+        return {
+            f"V{sub}1": self.severity[0], f"V{sub}2": self.severity[1],
+            f"V{sub}3": self.severity[2], f"V{sub}4": self.severity[3],
+            f"V{sub}": self.total,
+            f"V{sub}g": self.weighted,
+            f"pct_V_{sub}": self.percent,
+            f"sum_grav_{sub}": self.sum_gravity,
+            f"pct_grav_{sub}": self.percent_gravity,
+        }
+
+
+def compute_metrics(severity, gravity, victims, nb_of_victims):
+    """ Compute the metrics of found or saved victims
+    @param severity: int array with the severity label of every victim of the environment
+    @param gravity: float array with the gravity of every victim of the environment
+    @param victims: sequential numbers or bool mask of the found or saved victims
+    @param nb_of_victims: total number of victims of the environment
+    @return: a VictimsMetrics"""
+
+    sev = count_by_severity(severity, victims)
+    tot_grav = sum_gravities(gravity, victims)
+    all_grav = float(gravity.sum())
+
+    weighted_all = int(SEVERITY_WEIGHTS @ count_by_severity(severity))
+    weighted = int(SEVERITY_WEIGHTS @ sev)
+    total = int(sev.sum())
+
+    return VictimsMetrics(
+        [int(c) for c in sev],
+        total,
+        100*total/nb_of_victims if nb_of_victims > 0 else 0.0,
+        weighted/weighted_all if weighted_all > 0 else 0.0,
+        tot_grav,
+        tot_grav/all_grav if all_grav > 0 else 0.0,
+    )
+
+
+def results_rows(result):
+    """ Flatten a SimulationResult into rows with the COLUMNS keys, one per agent """
+
+    rows = []
+    for agent in result.agents:
+        row = {
+            "scenario": os.path.basename(result.data_folder),
+            "agent": agent.name,
+            "state": STATE_NAMES.get(agent.state, str(agent.state)),
+            "complete": result.complete(),
+            "used_time": agent.used_time(),
+            "tlim": agent.tlim,
+        }
+        row.update(agent.found_metrics.as_dict("e"))
+        row.update(agent.saved_metrics.as_dict("s"))
+        rows.append(row)
+    return rows
+
+
+def write_csv(rows, csv_file):
+    """ Write the rows to a csv file """
+    with open(csv_file, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(rows, json_file):
+    """ Write the rows to a json file (a list of objects) """
+    with open(json_file, "w") as file:
+        json.dump(rows, file, indent=2)
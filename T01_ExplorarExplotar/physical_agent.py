@@ -1,6 +1,5 @@
 import sys
 import os
-import pygame
 import random
 import csv
 import time
@@ -38,6 +37,9 @@ class PhysAgent:
         self.y = y_base               # current y coordinate
         self.rtime = mind.TLIM        # current remaining time
         self.state = state            # -1=dead  0=successfully ended 1=alive
+        self.id = 0                   # id in the trace layer of the grid, set by the environment
+        self.found_victims = set()    # sequential numbers of the victims found by this agent
+        self.saved_victims = set()    # sequential numbers of the victims saved by this agent
 
     def set_state(self, state):
         self.state = state
@@ -83,15 +85,10 @@ class PhysAgent:
         new_x = self.x + dx
         new_y = self.y + dy
 
-        if (new_x >= 0
-            and new_x < self.env.dic["GRID_WIDTH"]
-            and new_y >= 0
-            and new_y < self.env.dic["GRID_HEIGHT"]
-            and self.env.walls[new_x][new_y] == 0
-        ):
+        if self.env.grid.is_free(new_x, new_y):
             self.x = new_x
             self.y = new_y
-            self.env.visited[new_x][new_y] = self.mind.TRACE_COLOR
+            self.env.grid.mark_visited(new_x, new_y, self.id)
             return PhysAgent.EXECUTED
         return PhysAgent.BUMPED
 
@@ -102,12 +99,7 @@ class PhysAgent:
         victims.txt and sinais_vitais.txt)
         @returns -1: if there is no victim at the current position of the agent"""
 
-        seq = -1
-
-        if (self.x, self.y) in self.env.victims:
-            seq = self.env.victims.index((self.x, self.y))
-
-        return seq
+        return self.env.grid.victim_at(self.x, self.y)
 
     def read_vital_signals(self, seq):
         """ Public method for reading the vital signals and marking a victim as found.
@@ -127,9 +119,10 @@ class PhysAgent:
             return []
 
         # Mark the victim as found by this agent.
-        # More than one agent can found the same victim, so it's a list
-        self.env.found[seq].append(self)
-        return self.env.signals[seq]
+        # More than one agent can found the same victim, each one keeps its own set
+        self.found_victims.add(seq)
+        self.env.found[seq] = True
+        return self.env.signals[seq].tolist()
 
     def first_aid(self, seq):
         """ Public method for dropping the first aid package to the victim identified
@@ -149,35 +142,20 @@ class PhysAgent:
         if seq >= self.env.nb_of_victims:
             return False
 
-        # Mark the victim as found by this agent.
-        # More than one agent can drop a first-aid package to the same victim, so it's a list
-        self.env.saved[seq].append(self)
+        # Mark the victim as saved by this agent.
+        # More than one agent can drop a first-aid package to the same victim, each one keeps its own set
+        self.saved_victims.add(seq)
+        self.env.saved[seq] = True
         return True
 
     def get_found_victims(self):
         """ Public method for returning the number of found victims by the agent
         @returns a list with the sequential number of found victims """
 
-        victims = []
-
-        v = 0
-        for finders in self.env.found:
-            if self in finders:
-                victims.append(v)
-            v = v + 1
-
-        return victims
+        return sorted(self.found_victims)
 
     def get_saved_victims(self):
         """ Public method for returning the number of saved victims by the agent
         @returns a list with the sequential number of saved victims """
 
-        victims = []
-
-        v = 0
-        for rescuers in self.env.saved:
-            if self in rescuers:
-                victims.append(v)
-            v = v + 1
-
-        return victims
+        return sorted(self.saved_victims)
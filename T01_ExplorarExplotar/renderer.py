@@ -0,0 +1,123 @@
+## RENDERER
+### Draws the environment in the pygame window. The static items (grid lines,
+### walls and the base) are pre-rendered once on a surface; at each cycle only
+### the cells touched by the agents since the last frame are redrawn and sent
+### to the display with pygame.display.update(rects).
+
+import pygame
+from physical_agent import PhysAgent
+from grid import Grid
+
+
+class Renderer:
+    """ Incremental (dirty rectangles) drawing of an environment """
+
+    def __init__(self, env, screen):
+        """
+        @param env: the environment to be drawn
+        @param screen: the pygame display surface"""
+
+        self.env = env
+        self.screen = screen
+
+        # Set cell width and height
+        self.cell_w = env.dic["WINDOW_WIDTH"]/env.dic["GRID_WIDTH"]
+        self.cell_h = env.dic["WINDOW_HEIGHT"]/env.dic["GRID_HEIGHT"]
+
+        # The victims (sequential numbers) in each cell
+        self.victims_at = {}
+        for v, (x, y) in enumerate(env.victims):
+            self.victims_at.setdefault((int(x), int(y)), []).append(v)
+
+        # Position of each agent in the last frame: cells to be erased in the next one
+        self.last_positions = {}
+
+        self.static = self.__draw_static_layer()
+        self.first_frame = True
+
+    def __cell_rect(self, x, y):
+        """ @return: the rect of the cell (x, y) in the window """
+        return pygame.Rect(x * self.cell_w, y * self.cell_h, self.cell_w, self.cell_h)
+
+    def __draw_static_layer(self):
+        """ Pre-render the grid lines, the walls and the base marker
+        @return: a surface with the size of the window"""
+
+        static = pygame.Surface(self.screen.get_size())
+        static.fill(self.env.WHITE)
+
+        for x in range(self.env.dic["GRID_WIDTH"]):
+            for y in range(self.env.dic["GRID_HEIGHT"]):
+                pygame.draw.rect(static, self.env.BLACK, self.__cell_rect(x, y), 1)
+
+                if self.env.grid.walls[x, y] == 1:
+                    wall_rect = pygame.Rect(x * self.cell_w + 1, y * self.cell_h + 1, self.cell_w - 2, self.cell_h - 2)
+                    pygame.draw.rect(static, self.env.BLACK, wall_rect)
+
+        # Draw a marker at the base
+        base = self.__cell_rect(self.env.dic["BASE"][0], self.env.dic["BASE"][1])
+        pygame.draw.rect(static, self.env.CYAN, base, 4)
+
+        return static
+
+    def __draw_cell(self, x, y):
+        """ Redraw one cell: static layer, trace, victims and active agents
+        @return: the rect of the cell"""
+
+        rect = self.__cell_rect(x, y)
+        self.screen.blit(self.static, rect, rect)
+
+        # Paint visited cells with the trace color of the last agent
+        agent_id = self.env.grid.trace[x, y]
+        if agent_id != Grid.NO_TRACE:
+            visited_rect = pygame.Rect(x * self.cell_w + 1, y * self.cell_h + 1, self.cell_w - 2, self.cell_h - 2)
+            pygame.draw.rect(self.screen, self.env.get_trace_color(agent_id), visited_rect)
+
+            # the trace covers the base marker
+            if x == self.env.dic["BASE"][0] and y == self.env.dic["BASE"][1]:
+                pygame.draw.rect(self.screen, self.env.CYAN, rect, 4)
+
+        # Draw the victims
+        for v in self.victims_at.get((x, y), []):
+            victim_rect = pygame.Rect(x * self.cell_w + 2, y * self.cell_h + 2, self.cell_w - 4, self.cell_h - 4)
+            c = self.env.severity[v]-1
+            pygame.draw.ellipse(self.screen, self.env.VICTIM_COLOR[c], victim_rect)
+            if self.env.saved[v]:
+                pygame.draw.ellipse(self.screen, self.env.WHITE, victim_rect, 3)
+            elif self.env.found[v]:
+                pygame.draw.ellipse(self.screen, self.env.BLACK, victim_rect, 3)
+
+        # Draw the physical agents
+        for body in self.env.agents:
+            if body.state == PhysAgent.ACTIVE and body.x == x and body.y == y:
+                pygame.draw.rect(self.screen, body.mind.COLOR, rect)
+
+        return rect
+
+    def draw(self):
+        """ Draw a frame. The first one is complete, the next ones only redraw the cells
+        where the agents were in the last frame and where they are now. The victims
+        are found or saved at the position of the agents, so these cells also cover
+        the changes of the victims' markers."""
+
+        full_frame = self.first_frame
+        if full_frame:
+            self.first_frame = False
+            self.screen.blit(self.static, (0, 0))
+
+            dirty = set(self.victims_at)
+            for x, y in self.env.grid.visited_cells():
+                dirty.add((int(x), int(y)))
+        else:
+            dirty = set(self.last_positions.values())
+
+        for body in self.env.agents:
+            self.last_positions[body] = (body.x, body.y)
+            dirty.add((body.x, body.y))
+
+        rects = [self.__draw_cell(x, y) for x, y in dirty]
+
+        if full_frame:
+            pygame.display.update()
+        elif len(rects) > 0:
+            pygame.display.update(rects)
@@ -0,0 +1,123 @@
+## OFFLINE RESCUE REPLANNING
+### Snapshots the problems that the explorers hand to the rescuers and re-runs
+### the rescue planner on them without re-exploring the scenario.
+###
+### Usage:
+###   python replan.py snapshot <scenario> <out_folder> [--seed S] [--plan P]
+###       runs the scenario headless and saves the Problema received by each rescuer
+###       as <out_folder>/<RESCUER NAME>.npz (see Problema.salva)
+###   python replan.py run <snapshot.npz> --time T [--runs N] [--seed S] [--engine E] [--processes P]
+###       plans the rescue of a snapshot N times with T units of time available
+
+import os
+import io
+import sys
+import time
+import random
+import argparse
+import contextlib
+
+from main import build_env
+from agentes.explorador.explorer import Explorer
+from agentes.resgate.rescuer import Rescuer
+from agentes.utils.problema import Problema
+from agentes.resgate.planos.resgate_genetico import PlanoResgateGenetico
+from agentes.resgate.planos.otimizador_genetico.individuo import INDICE_BASE
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data_folder")
+
+
+def snapshot(data_folder, out_folder, seed=None, plan="dfs"):
+    """ Run one scenario with the headless engine and save the problem of each rescuer.
+    The output of the agents is discarded.
+    @param data_folder: absolute path of the scenario folder
+    @param out_folder: folder of the snapshot files, created if needed
+    @param seed: seed of the simulation, None for a non reproducible run
+    @param plan: exploration plan of the explorers
+    @return: list of (file, time available to the rescuer) of the saved snapshots"""
+
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        env = build_env(data_folder, seed, plan)
+        result = env.run_headless(env.get_tick_limit())
+    if result.capped:
+        print("from replan: the run reached the tick limit, the snapshots may be incomplete", file=sys.stderr)
+
+    os.makedirs(out_folder, exist_ok=True)
+    saved = []
+    for body in env.agents:
+        rescuer = body.mind
+        if not isinstance(rescuer, Rescuer) or rescuer.problema is None:
+            continue
+        file = os.path.join(out_folder, f"{rescuer.NAME}.npz")
+        rescuer.problema.salva(file)
+        saved.append((file, rescuer.TLIM))
+
+    return saved
+
+
+def replan(problema, available_time, seed=None, engine="objetos", processes=1):
+    """ Plan the rescue of a problem once with the genetic rescue planner.
+    The output of the planner is discarded.
+    @param problema: Problema loaded from a snapshot
+    @param available_time: time available to the rescuer
+    @param seed: seed of the planner, None for a non reproducible run
+    @param engine: genetic engine of the planner (a key of PlanoResgateGenetico.MOTORES)
+    @param processes: processes of the objetos engine, None for all the cores
+    @return: (seconds, number of planned steps, planned victims, best fitness)"""
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        planner = PlanoResgateGenetico(problema, available_time, random.Random(seed), engine, processes)
+        steps = planner.executar()
+    seconds = time.perf_counter() - start
+
+    best = planner.otimizador.melhor_individuo_
+    victims = {destination for _, destination in best.genes['trajeto'] if destination != INDICE_BASE}
+    return seconds, len(steps), len(victims), best.pontuacao
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Snapshot and re-run VictimSim rescue plans")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parser_snapshot = commands.add_parser("snapshot", help="save the problems of the rescuers of a scenario")
+    parser_snapshot.add_argument("scenario", help="folder name under data_folder/ (or absolute path)")
+    parser_snapshot.add_argument("out_folder", help="folder of the snapshot files")
+    parser_snapshot.add_argument("--seed", type=int, default=None, help="seed of the simulation")
+    parser_snapshot.add_argument("--plan", choices=sorted(Explorer.PLANOS_EXPLORACAO), default="dfs",
+                                 help="exploration plan of the explorer (default: dfs)")
+
+    parser_run = commands.add_parser("run", help="plan the rescue of a snapshot")
+    parser_run.add_argument("snapshot", help="snapshot file (.npz)")
+    parser_run.add_argument("--time", type=float, required=True, help="time available to the rescuer")
+    parser_run.add_argument("--runs", type=int, default=1, help="number of plans (default: 1)")
+    parser_run.add_argument("--seed", type=int, default=None,
+                            help="seed of the first plan, the next plans use seed+1, seed+2...")
+    parser_run.add_argument("--engine", choices=sorted(PlanoResgateGenetico.MOTORES), default="objetos",
+                            help="genetic engine of the planner (default: objetos)")
+    parser_run.add_argument("--processes", type=int, default=1,
+                            help="processes of the objetos engine, 0 for all the cores (default: 1)")
+    args = parser.parse_args()
+
+    if args.command == "snapshot":
+        data_folder = args.scenario
+        if not os.path.isabs(data_folder):
+            data_folder = os.path.join(DATA_FOLDER, data_folder)
+        saved = snapshot(data_folder, args.out_folder, args.seed, args.plan)
+        if not saved:
+            print("from replan: no rescuer received a problem")
+            sys.exit(1)
+        for file, available_time in saved:
+            print(f"from replan: {file} (time available: {available_time})")
+        sys.exit(0)
+
+    problema = Problema.carrega(args.snapshot)
+    print(f"from replan: {len(problema.grafo_posicoes)} positions, "
+          f"{len(problema.sinais_vitais_vitimas)} victims")
+    total = 0.0
+    for run in range(args.runs):
+        seed = None if args.seed is None else args.seed + run
+        seconds, steps, victims, fitness = replan(problema, args.time, seed, args.engine, args.processes or None)
+        total += seconds
+        print(f"run {run + 1}: {seconds:.2f}s  steps {steps}  victims {victims}  fitness {fitness:.2f}")
+    print(f"from replan: {args.runs} runs in {total:.2f}s ({total / args.runs:.2f}s per run)")
@@ -0,0 +1,67 @@
+## SIMULATION RESULTS
+### Structured outcome of a simulation run. It is returned by the headless
+### engine (Env.run_headless) so the results can be used programmatically
+### instead of being printed on the console.
+
+from physical_agent import PhysAgent
+
+
+class AgentResult:
+    """It is what actually happened to one physical agent in the environment"""
+
+    def __init__(self, name, state, tlim, rtime, found, saved, found_metrics, saved_metrics):
+        """
+        @param name: the name of the agent (NAME in the config file)
+        @param state: the final state of the physical agent (ENDED, DEAD, IDLE...)
+        @param tlim: the time limit of the agent
+        @param rtime: the remaining time of the agent at the end of the simulation
+        @param found: list with the sequential number of the victims found by the agent
+        @param saved: list with the sequential number of the victims saved by the agent
+        @param found_metrics: VictimsMetrics of the found victims (Ve1..Ve4, Veg, ...)
+        @param saved_metrics: VictimsMetrics of the saved victims (Vs1..Vs4, Vsg, ...)"""
+
+        self.name = name
+        self.state = state
+        self.tlim = tlim
+        self.rtime = rtime
+        self.found = found
+        self.saved = saved
+        self.found_metrics = found_metrics
+        self.saved_metrics = saved_metrics
+
+    def used_time(self):
+        """ @return: the time consumed by the agent """
+        return self.tlim - self.rtime
+
+
+class SimulationResult:
+    """It is the outcome of a whole simulation run"""
+
+    def __init__(self, data_folder, nb_of_victims, ticks, agents, capped=False):
+        """
+        @param data_folder: the folder of the simulated scenario
+        @param nb_of_victims: total number of victims in the environment
+        @param ticks: number of reasoning cycles executed by the engine
+        @param agents: list of AgentResult, in the order the agents were added
+        @param capped: True if max_ticks stopped the run while agents were still ACTIVE"""
+
+        self.data_folder = data_folder
+        self.nb_of_victims = nb_of_victims
+        self.ticks = ticks
+        self.agents = agents
+        self.capped = capped
+
+    def complete(self):
+        """ @return: True if the run ended by itself, False if it was capped by max_ticks """
+        return not self.capped
+
+    def idle_agents(self):
+        """ @return: the AgentResult of the agents left IDLE, i.e. never activated by another agent """
+        return [agent for agent in self.agents if agent.state == PhysAgent.IDLE]
+
+    def get_agent(self, name):
+        """ @return: the AgentResult of the first agent with the given name or None """
+        for agent in self.agents:
+            if agent.name == name:
+                return agent
+        return None
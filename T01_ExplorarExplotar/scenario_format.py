@@ -0,0 +1,166 @@
+## SCENARIO BINARY FORMAT
+### Compact binary version of the data files of a scenario folder (env_walls.txt,
+### env_victims.txt and sinais_vitais.txt). The environment opens it with
+### numpy.memmap, so loading is near-instant and the pages are shared between
+### the processes that run the same scenario.
+###
+### Layout of env_scenario.bin (little endian, sections aligned to 64 bytes):
+###   header   64 bytes: magic, version, grid width and height, number of victims,
+###            rows and columns of the vital signals, offsets of the 3 sections
+###   walls    uint8   [GRID_WIDTH, GRID_HEIGHT] - 1 for walls, indexed by [x, y]
+###   victims  int32   [nb_of_victims, 2]        - (x, y) of each victim
+###   signals  float32 [rows, columns]           - sinais_vitais.txt [i, s1, ..., s5, g, l]
+###
+### Usage: python scenario_format.py [folders...]
+###   converts the text files of each folder (relative to data_folder/ or absolute)
+
+import os
+import sys
+import csv
+import struct
+import numpy as np
+
+SCENARIO_FILE = "env_scenario.bin"
+
+MAGIC = b"VSIMSCN\0"
+VERSION = 1
+HEADER = struct.Struct("<8s9I")   # magic, version, width, height, victims, rows, cols, 3 offsets
+HEADER_SIZE = 64
+ALIGN = 64
+SIGNALS_COLUMNS = 8               # i, s1, ..., s5, g, l
+
+
+def _align(offset):
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+def write_scenario(path, walls, victims, signals):
+    """ Write a scenario in the binary format
+    @param path: the file to be written
+    @param walls: uint8 array [GRID_WIDTH, GRID_HEIGHT], 1 for walls
+    @param victims: int array [nb_of_victims, 2] with the (x, y) of the victims
+    @param signals: float array [rows, columns] with the vital signals"""
+
+    walls = np.ascontiguousarray(walls, dtype=np.uint8)
+    victims = np.ascontiguousarray(np.asarray(victims).reshape(-1, 2), dtype=np.int32)
+    signals = np.ascontiguousarray(signals, dtype=np.float32)
+    if signals.ndim != 2:
+        signals = signals.reshape(len(signals), -1)
+
+    walls_offset = HEADER_SIZE
+    victims_offset = _align(walls_offset + walls.nbytes)
+    signals_offset = _align(victims_offset + victims.nbytes)
+
+    header = HEADER.pack(MAGIC, VERSION, walls.shape[0], walls.shape[1], len(victims),
+                         signals.shape[0], signals.shape[1],
+                         walls_offset, victims_offset, signals_offset)
+
+    with open(path, "wb") as file:
+        file.write(header.ljust(HEADER_SIZE, b"\0"))
+        file.write(walls.tobytes())
+        file.seek(victims_offset)
+        file.write(victims.tobytes())
+        file.seek(signals_offset)
+        file.write(signals.tobytes())
+
+
+def open_scenario(path):
+    """ Open a scenario in the binary format with read-only memory maps
+    @param path: the env_scenario.bin file
+    @return: (walls, victims, signals) as numpy.memmap arrays"""
+
+    with open(path, "rb") as file:
+        fields = HEADER.unpack(file.read(HEADER.size))
+
+    magic, version, width, height, nb_of_victims, rows, cols, walls_offset, victims_offset, signals_offset = fields
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a scenario file of version {VERSION}")
+
+    walls = np.memmap(path, dtype=np.uint8, mode="r", offset=walls_offset, shape=(width, height))
+
+    # numpy.memmap does not accept empty shapes
+    if nb_of_victims > 0:
+        victims = np.memmap(path, dtype=np.int32, mode="r", offset=victims_offset, shape=(nb_of_victims, 2))
+    else:
+        victims = np.zeros((0, 2), dtype=np.int32)
+    if rows > 0:
+        signals = np.memmap(path, dtype=np.float32, mode="r", offset=signals_offset, shape=(rows, cols))
+    else:
+        signals = np.zeros((0, cols), dtype=np.float32)
+
+    return walls, victims, signals
+
+
+def read_text_scenario(data_folder, width, height):
+    """ Read the text data files of a scenario folder
+    @param data_folder: folder with env_walls.txt, env_victims.txt and sinais_vitais.txt
+    @param width: GRID_WIDTH of the scenario
+    @param height: GRID_HEIGHT of the scenario
+    @return: (walls, victims, signals) arrays, signals in float64"""
+
+    walls = np.zeros((width, height), dtype=np.uint8)
+    with open(os.path.join(data_folder, "env_walls.txt"), "r") as csvfile:
+        for row in csv.reader(csvfile):
+            walls[int(row[0]), int(row[1])] = 1
+
+    victims = []
+    with open(os.path.join(data_folder, "env_victims.txt"), "r") as csvfile:
+        for row in csv.reader(csvfile):
+            victims.append((int(row[0]), int(row[1])))
+
+    signals = []
+    with open(os.path.join(data_folder, "sinais_vitais.txt"), "r") as csvfile:
+        for row in csv.reader(csvfile):
+            signals.append([float(value) for value in row])
+
+    victims = np.array(victims, dtype=np.int32).reshape(-1, 2)
+    if signals:
+        signals = np.array(signals, dtype=np.float64)
+    else:
+        signals = np.zeros((0, SIGNALS_COLUMNS), dtype=np.float64)
+    return walls, victims, signals
+
+
+def read_grid_size(data_folder):
+    """ @return: (GRID_WIDTH, GRID_HEIGHT) read from the env_size.txt of the folder """
+    size = {}
+    with open(os.path.join(data_folder, "env_size.txt"), "r") as file:
+        for line in file:
+            words = line.split()
+            if len(words) == 2 and words[0] in ("GRID_WIDTH", "GRID_HEIGHT"):
+                size[words[0]] = int(words[1])
+    return size["GRID_WIDTH"], size["GRID_HEIGHT"]
+
+
+def is_up_to_date(data_folder):
+    """ @return: True if the folder has an env_scenario.bin and no data text file is newer than it """
+    path = os.path.join(data_folder, SCENARIO_FILE)
+    if not os.path.isfile(path):
+        return False
+
+    for name in ("env_walls.txt", "env_victims.txt", "sinais_vitais.txt"):
+        text_file = os.path.join(data_folder, name)
+        if os.path.isfile(text_file) and os.path.getmtime(text_file) > os.path.getmtime(path):
+            return False
+    return True
+
+
+def convert_folder(data_folder):
+    """ Convert the text data files of a scenario folder into env_scenario.bin
+    @param data_folder: the scenario folder
+    @return: the path of the written file"""
+
+    width, height = read_grid_size(data_folder)
+    walls, victims, signals = read_text_scenario(data_folder, width, height)
+
+    path = os.path.join(data_folder, SCENARIO_FILE)
+    write_scenario(path, walls, victims, signals)
+    return path
+
+
+if __name__ == '__main__':
+    default_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data_folder")
+
+    for name in sys.argv[1:]:
+        folder = name if os.path.isabs(name) else os.path.join(default_folder, name)
+        print(f"from scenario_format: wrote {convert_folder(folder)}")
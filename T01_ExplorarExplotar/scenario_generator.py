@@ -0,0 +1,244 @@
+## SCENARIO GENERATOR
+### Generates scenario folders in the format read by the environment (env_size.txt,
+### env_walls.txt, env_victims.txt, sinais_vitais.txt and the agents' config files)
+### at configurable sizes, wall densities, structures and numbers of victims, for
+### scaling benchmarks of the agents. The vital signals are sampled from the rows of
+### T02_ClassicarRegredir/treino_sinais_vitais_com_label.csv.
+###
+### Structures:
+###   random - each cell is a wall with probability DENSITY
+###   maze   - a perfect maze whose walls are knocked down until at most DENSITY of the cells are walls
+###   rooms  - rooms of ROOM x ROOM cells with one door to each neighbour room, DENSITY of clutter inside
+###
+### Usage: python scenario_generator.py NAME [--width W] [--height H] [--structure S]
+###        [--density D] [--victims N] [--seed S] [--binary] ...
+###   writes the folder data_folder/NAME (or NAME if it is an absolute path)
+
+import os
+import csv
+import random
+import argparse
+from collections import deque
+import numpy as np
+
+import scenario_format
+
+SIGNALS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                            "T02_ClassicarRegredir", "treino_sinais_vitais_com_label.csv")
+
+STRUCTURES = ("random", "maze", "rooms")
+
+# 8-connected moves of the physical agents: they may cross the corners between walls
+MOVES = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def random_walls(width, height, density, rng):
+    """ @return: uint8 wall mask [width, height] where each cell is a wall with probability density """
+    return (rng.random((width, height)) < density).astype(np.uint8)
+
+
+def maze_walls(width, height, density, rng, py_rng):
+    """ Carve a perfect maze on the odd cells with an iterative backtracker, then knock
+    down random walls until at most density of the cells are walls (it opens loops).
+    @return: uint8 wall mask [width, height]"""
+
+    walls = np.ones((width, height), dtype=np.uint8)
+    cells_x, cells_y = (width + 1) // 2, (height + 1) // 2
+
+    visited = np.zeros((cells_x, cells_y), dtype=bool)
+    stack = [(0, 0)]
+    visited[0, 0] = True
+    walls[0, 0] = 0
+    while stack:
+        cx, cy = stack[-1]
+        neighbours = [(cx + dx, cy + dy) for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                      if 0 <= cx + dx < cells_x and 0 <= cy + dy < cells_y and not visited[cx + dx, cy + dy]]
+        if not neighbours:
+            stack.pop()
+            continue
+        nx, ny = py_rng.choice(neighbours)
+        visited[nx, ny] = True
+        walls[2 * nx, 2 * ny] = 0
+        walls[cx + nx, cy + ny] = 0     # the cell between (2cx, 2cy) and (2nx, 2ny)
+        stack.append((nx, ny))
+
+    wall_cells = np.flatnonzero(walls)
+    excess = len(wall_cells) - int(density * width * height)
+    if excess > 0:
+        walls.flat[rng.choice(wall_cells, size=excess, replace=False)] = 0
+
+    return walls
+
+
+def rooms_walls(width, height, density, room, rng):
+    """ Split the grid in rooms of room x room cells separated by walls with one door
+    between neighbour rooms, and put random clutter with probability density inside.
+    @return: uint8 wall mask [width, height]"""
+
+    walls = random_walls(width, height, density, rng)
+    walls[room::room + 1, :] = 1
+    walls[:, room::room + 1] = 1
+
+    # one door in each wall segment between two rooms
+    for x0 in range(0, width, room + 1):
+        for y0 in range(0, height, room + 1):
+            x1, y1 = min(x0 + room, width), min(y0 + room, height)
+            if x1 < width:   # wall at column x1, between rooms on the x axis
+                walls[x1, rng.integers(y0, y1)] = 0
+            if y1 < height:  # wall at row y1, between rooms on the y axis
+                walls[rng.integers(x0, x1), y1] = 0
+
+    return walls
+
+
+def reachable_cells(walls, base):
+    """ Breadth-first search of the free cells reachable from the base with the 8-connected moves
+    @return: bool mask [width, height] of the reachable cells"""
+
+    width, height = walls.shape
+    free = walls == 0
+    reached = np.zeros(walls.shape, dtype=bool)
+    reached[base] = True
+    queue = deque([base])
+    while queue:
+        x, y = queue.popleft()
+        for dx, dy in MOVES:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height and free[nx, ny] and not reached[nx, ny]:
+                reached[nx, ny] = True
+                queue.append((nx, ny))
+    return reached
+
+
+def load_signals_distribution(signals_file=SIGNALS_FILE):
+    """ @return: float array with the rows of the labelled vital signals (without the header) """
+    with open(signals_file, "r") as csvfile:
+        reader = csv.reader(csvfile)
+        next(reader)
+        return np.array([[float(value) for value in row] for row in reader], dtype=np.float64)
+
+
+def sample_signals(nb_of_victims, rng, distribution):
+    """ Sample the vital signals of the victims from the rows of the distribution
+    @return: float array [nb_of_victims, 8] - [i, s1, ..., s5, g, l] with i renumbered from 1"""
+
+    signals = distribution[rng.integers(0, len(distribution), size=nb_of_victims)].copy()
+    signals[:, 0] = np.arange(1, nb_of_victims + 1)
+    return signals
+
+
+def generate(width, height, structure="random", density=0.2, nb_of_victims=50, seed=None,
+             base=None, room=10):
+    """ Generate the walls, victims and vital signals of a scenario
+    @param width: GRID_WIDTH
+    @param height: GRID_HEIGHT
+    @param structure: one of STRUCTURES
+    @param density: fraction of wall cells (see the structures)
+    @param nb_of_victims: number of victims, placed on free cells reachable from the base
+    @param seed: seed of the random generators, None for a random scenario
+    @param base: (x, y) of the base, None for the center of the grid
+    @param room: side of the rooms for the rooms structure
+    @return: (walls, base, victims, signals)"""
+
+    rng = np.random.default_rng(seed)
+    py_rng = random.Random(seed)
+
+    if structure == "random":
+        walls = random_walls(width, height, density, rng)
+    elif structure == "maze":
+        walls = maze_walls(width, height, density, rng, py_rng)
+    elif structure == "rooms":
+        walls = rooms_walls(width, height, density, room, rng)
+    else:
+        raise ValueError(f"structure must be one of {STRUCTURES}")
+
+    if base is None:
+        base = (width // 2, height // 2)
+        # the maze only has free cells in even positions
+        if structure == "maze":
+            base = (base[0] - base[0] % 2, base[1] - base[1] % 2)
+    base = tuple(base)
+    walls[base] = 0
+
+    # victims on distinct free cells reachable from the base, but not at the base
+    reached = reachable_cells(walls, base)
+    reached[base] = False
+    candidates = np.flatnonzero(reached)
+    if nb_of_victims > len(candidates):
+        print(f"from generator: only {len(candidates)} reachable cells, placing {len(candidates)} victims")
+        nb_of_victims = len(candidates)
+    cells = rng.choice(candidates, size=nb_of_victims, replace=False)
+    victims = np.stack(np.unravel_index(cells, walls.shape), axis=1)
+
+    signals = sample_signals(nb_of_victims, rng, load_signals_distribution())
+
+    return walls, base, victims, signals
+
+
+def write_agent_config(path, name, color, trace_color, tlim):
+    with open(path, "w") as file:
+        file.write(f"NAME {name}\n")
+        file.write(f"COLOR {color}\n")
+        file.write(f"TRACE_COLOR {trace_color}\n")
+        file.write(f"TLIM {tlim}\n")
+        file.write("COST_LINE 1.0\nCOST_DIAG 1.5\nCOST_READ 2.0\nCOST_FIRST_AID 1.0\n")
+
+
+def write_folder(data_folder, walls, base, victims, signals, tlim, window=500, binary=False):
+    """ Write a scenario folder in the format of the environment
+    @param data_folder: the folder to be written (created if needed)
+    @param tlim: TLIM of the explorer and of the rescuer
+    @param window: WINDOW_WIDTH and WINDOW_HEIGHT
+    @param binary: if True, also write env_scenario.bin"""
+
+    os.makedirs(data_folder, exist_ok=True)
+    width, height = walls.shape
+
+    with open(os.path.join(data_folder, "env_size.txt"), "w") as file:
+        file.write(f"BASE {base[0]},{base[1]}\n")
+        file.write(f"GRID_WIDTH {width}\nGRID_HEIGHT {height}\n")
+        file.write(f"WINDOW_WIDTH {window}\nWINDOW_HEIGHT {window}\n")
+        file.write("DELAY 0.0\n")
+
+    np.savetxt(os.path.join(data_folder, "env_walls.txt"), np.argwhere(walls), fmt="%d", delimiter=",")
+    np.savetxt(os.path.join(data_folder, "env_victims.txt"), victims, fmt="%d", delimiter=",")
+    np.savetxt(os.path.join(data_folder, "sinais_vitais.txt"), signals,
+               fmt=["%d"] + ["%f"] * (signals.shape[1] - 2) + ["%d"], delimiter=",")
+
+    write_agent_config(os.path.join(data_folder, "explorer_config.txt"),
+                       "EXPLORER", "(0, 0, 255)", "(153, 153, 255)", tlim)
+    write_agent_config(os.path.join(data_folder, "rescuer_config.txt"),
+                       "RESCUER", "(255, 0, 127)", "(255, 153, 204)", tlim)
+
+    if binary:
+        scenario_format.write_scenario(os.path.join(data_folder, scenario_format.SCENARIO_FILE),
+                                       walls, victims, signals)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate VictimSim scenario folders")
+    parser.add_argument("name", help="folder name under data_folder/ or absolute path")
+    parser.add_argument("--width", type=int, default=100)
+    parser.add_argument("--height", type=int, default=100)
+    parser.add_argument("--structure", choices=STRUCTURES, default="random")
+    parser.add_argument("--density", type=float, default=0.2, help="fraction of wall cells")
+    parser.add_argument("--room", type=int, default=10, help="side of the rooms (rooms structure)")
+    parser.add_argument("--victims", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--base", default=None, help="x,y of the base (default: center)")
+    parser.add_argument("--tlim", type=float, default=None, help="TLIM of the agents (default: width*height)")
+    parser.add_argument("--binary", action="store_true", help="also write env_scenario.bin")
+    args = parser.parse_args()
+
+    base = tuple(int(i) for i in args.base.split(",")) if args.base else None
+    walls, base, victims, signals = generate(args.width, args.height, args.structure, args.density,
+                                             args.victims, args.seed, base, args.room)
+
+    folder = args.name
+    if not os.path.isabs(folder):
+        folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data_folder", folder)
+
+    tlim = args.tlim if args.tlim is not None else float(args.width * args.height)
+    write_folder(folder, walls, base, victims, signals, tlim, binary=args.binary)
+    print(f"from generator: {folder} - {args.width}x{args.height} {args.structure}, "
+          f"{int(walls.sum())} walls, {len(victims)} victims")
@@ -0,0 +1,115 @@
+import io
+import os
+import sys
+import contextlib
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import scenario_generator
+from main import build_env
+
+DATA_FOLDER = os.path.join(ROOT, "data_folder")
+
+
+@pytest.fixture
+def make_scenario(tmp_path):
+    """ Factory of generated scenario folders under the temporary folder of the test
+    @return: function(name, width, height, victims, seed, tlim, binary) -> folder path"""
+
+    def make(name="scenario", width=20, height=20, victims=10, seed=0, tlim=200.0, binary=False, **kwargs):
+        walls, base, positions, signals = scenario_generator.generate(
+            width, height, nb_of_victims=victims, seed=seed, **kwargs)
+        folder = str(tmp_path / name)
+        scenario_generator.write_folder(folder, walls, base, positions, signals, tlim, binary=binary)
+        return folder
+
+    return make
+
+
+def run_scenario(data_folder, seed=None, max_ticks=None, **kwargs):
+    """ Build and run a scenario headless, discarding the output of the agents
+    @return: (env, SimulationResult)"""
+
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        env = build_env(data_folder, seed, **kwargs)
+        result = env.run_headless(max_ticks)
+    return env, result
+
+
+def problema_aleatorio(semente, lado=10, passos=3000, qtd_vitimas=6):
+    """ Build a Problema the way an explorer does, by a random walk with collisions
+    on a random map of (2 * lado + 1)^2 cells around the base
+    @return: the Problema"""
+
+    from random import Random
+    from agentes.utils import movimentos
+    from agentes.utils.estado import Estado, CHAVE_BASE
+    from agentes.utils.problema import Problema
+
+    rng = Random(semente)
+    celulas = [(l, c) for l in range(-lado, lado + 1) for c in range(-lado, lado + 1)]
+    paredes = {celula for celula in celulas if rng.random() < 0.2} - {CHAVE_BASE}
+    livres = [celula for celula in celulas if celula not in paredes and celula != CHAVE_BASE]
+    vitimas = set(rng.sample(livres, qtd_vitimas))
+
+    problema = Problema()
+    estado = Estado()
+    for _ in range(passos):
+        passo = rng.choice(movimentos.VARIACOES)
+        destino = estado.desloca(passo)
+        chave = destino.get_chave_posicao()
+        if chave in paredes or max(abs(chave[0]), abs(chave[1])) > lado:
+            problema.atualiza_crenca_posicao_ambiente(passo, estado, 'w')
+            continue
+        estado = destino
+        if chave in vitimas:
+            problema.atualiza_crenca_posicao_ambiente(passo, estado, 'v')
+            problema.set_sinais_vitais_vitima(chave, [len(problema.sinais_vitais_vitimas) + 1,
+                                                      10.0, 0.0, 5.0, 50.0, 20.0, 30.0,
+                                                      float(rng.randint(1, 4))])
+        else:
+            problema.atualiza_crenca_posicao_ambiente(passo, estado, 'b' if chave == CHAVE_BASE else 'e')
+    return problema
+
+
+def dijkstra_referencia(grafo, origem):
+    """ Plain Dijkstra over the position graph with the line/diagonal step costs
+    @return: dict position -> cost of the shortest path from the origin"""
+
+    import heapq
+    from agentes.utils import movimentos
+
+    custos = {origem: 0.0}
+    fila = [(0.0, origem)]
+    while fila:
+        custo, posicao = heapq.heappop(fila)
+        if custo > custos[posicao]:
+            continue
+        for adjacente in grafo[posicao]:
+            novo = custo + movimentos.custo_passo(adjacente[0] - posicao[0], adjacente[1] - posicao[1])
+            if novo < custos.get(adjacente, float('inf')):
+                custos[adjacente] = novo
+                heapq.heappush(fila, (novo, adjacente))
+    return custos
+
+
+def problema_sintetico(semente, qtd_vitimas):
+    """ Random symmetric costs between the base and the victims, and gravities from 1 to 4,
+    for the genetic engines without a map
+    @return: (problem with only the victims' vital signals, float32 cost matrix [V + 1, V + 1])"""
+
+    from types import SimpleNamespace
+    import numpy as np
+
+    gerador = np.random.default_rng(semente)
+    custos = gerador.uniform(1.0, 20.0, (qtd_vitimas + 1, qtd_vitimas + 1)).astype(np.float32)
+    custos = np.minimum(custos, custos.T)
+    np.fill_diagonal(custos, 0.0)
+    sinais = {
+        (vitima, 0): [vitima, 0, 0, 0, 0, 0, int(gerador.integers(1, 5))]
+        for vitima in range(1, qtd_vitimas + 1)
+    }
+    return SimpleNamespace(sinais_vitais_vitimas=sinais), custos
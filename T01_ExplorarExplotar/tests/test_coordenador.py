@@ -0,0 +1,47 @@
+import os
+
+from physical_agent import PhysAgent
+from agentes.explorador.explorer import Explorer
+from agentes.resgate.rescuer import Rescuer
+from main import build_env
+from conftest import run_scenario
+
+
+def equipe(make_scenario, n_exploradores=2, n_resgatistas=2):
+    folder = make_scenario("equipe", width=15, height=15, victims=8, seed=3, tlim=300.0)
+    with open(os.path.join(folder, "env_size.txt"), "a") as file:
+        file.write(f"N_EXPLORERS {n_exploradores}\nN_RESCUERS {n_resgatistas}\n")
+    return folder
+
+
+def test_equipe_termina_com_todos_os_socorristas_acordados(make_scenario):
+    env, result = run_scenario(equipe(make_scenario), seed=1, max_ticks=10000, plan="fronteira")
+
+    assert not result.capped
+    assert not result.idle_agents()
+
+
+def test_morte_de_explorador_acorda_os_socorristas(make_scenario):
+    env = build_env(equipe(make_scenario), seed=1, plan="fronteira")
+    exploradores = [body for body in env.agents if isinstance(body.mind, Explorer)]
+
+    # O segundo explorador morre na primeira deliberação, sem nunca entregar o problema
+    exploradores[1].rtime = -1.0
+    result = env.run_headless(env.get_tick_limit())
+
+    assert exploradores[1].state == PhysAgent.DEAD
+    assert not result.capped
+    assert not result.idle_agents()
+    assert all(body.state != PhysAgent.IDLE for body in env.agents if isinstance(body.mind, Rescuer))
+
+
+def test_morte_de_todos_os_exploradores_acorda_os_socorristas(make_scenario):
+    env = build_env(equipe(make_scenario), seed=1, plan="fronteira")
+    for body in env.agents:
+        if isinstance(body.mind, Explorer):
+            body.rtime = -1.0
+    result = env.run_headless(env.get_tick_limit())
+
+    assert not result.idle_agents()
+    assert [agent.state for agent in result.agents if agent.name.startswith("RESCUER")] == \
+           [PhysAgent.ENDED, PhysAgent.ENDED]
@@ -0,0 +1,49 @@
+import os
+
+import metrics
+from physical_agent import PhysAgent
+from conftest import DATA_FOLDER, run_scenario
+from main import build_env
+
+
+def test_run_headless_is_reproducible():
+    folder = os.path.join(DATA_FOLDER, "data")
+    _, first = run_scenario(folder, seed=7)
+    _, second = run_scenario(folder, seed=7)
+
+    assert first.ticks == second.ticks
+    assert [(a.name, a.state, a.rtime, a.found, a.saved) for a in first.agents] == \
+           [(a.name, a.state, a.rtime, a.found, a.saved) for a in second.agents]
+
+
+def test_run_headless_stops_when_only_idle_agents_are_left():
+    # the explorer dies before waking the rescuer up: nobody can activate it anymore
+    env = build_env(os.path.join(DATA_FOLDER, "data"), seed=7)
+    explorer = next(body for body in env.agents if body.state == PhysAgent.ACTIVE)
+    explorer.set_state(PhysAgent.DEAD)
+
+    result = env.run_headless()
+
+    assert result.ticks == 1
+    assert [agent.name for agent in result.idle_agents()] == ["RESCUER"]
+
+
+def test_run_headless_stops_after_explorer_dies_on_its_own():
+    # seed 11 of the stock scenario: the explorer runs out of time before reaching the base
+    _, result = run_scenario(os.path.join(DATA_FOLDER, "data"), seed=11, max_ticks=3000)
+
+    assert result.ticks < 3000
+    assert {agent.name: agent.state for agent in result.agents} == \
+           {"EXPLORER": PhysAgent.DEAD, "RESCUER": PhysAgent.IDLE}
+
+
+def test_run_headless_marks_capped_runs_incomplete():
+    _, result = run_scenario(os.path.join(DATA_FOLDER, "data"), seed=7, max_ticks=5)
+    assert result.capped
+    assert [row["complete"] for row in metrics.results_rows(result)] == [False, False]
+
+    env = build_env(os.path.join(DATA_FOLDER, "data"), seed=7)
+    result = env.run_headless(env.get_tick_limit())
+    assert not result.capped
+    assert result.ticks < env.get_tick_limit()
+    assert all(row["complete"] for row in metrics.results_rows(result))
@@ -0,0 +1,79 @@
+import heapq
+from random import Random
+
+import numpy as np
+
+from agentes.utils import movimentos
+from agentes.utils.problema import Problema
+from agentes.utils.mapa_crencas import MapaCrencas
+from agentes.explorador.planos.exploracao_fronteira import ExploracaoFronteira
+
+
+def mapa_aleatorio(semente, lado=24):
+    """Problema com uma região conhecida aleatória (livres e paredes) em torno da base,
+        deslocada para que a grade cresça em todos os sentidos."""
+    rng = Random(semente)
+    problema = Problema()
+    mapa = problema.mapa_crencas
+    for linha in range(-lado // 2, lado // 2):
+        for coluna in range(-lado // 3, lado):
+            if rng.random() < 0.7:
+                codigo = MapaCrencas.PAREDE if rng.random() < 0.2 else MapaCrencas.VAZIA
+                mapa.define(linha, coluna, codigo)
+    mapa.define(0, 0, MapaCrencas.BASE)
+    return problema
+
+
+def melhor_utilidade_referencia(mapa):
+    """Dijkstra simples sobre as posições relativas: maior utilidade de uma posição da fronteira."""
+    livre = lambda l, c: mapa.obtem(l, c) not in (MapaCrencas.DESCONHECIDA, MapaCrencas.PAREDE)
+    custos = {(0, 0): 0.0}
+    fila = [(0.0, (0, 0))]
+    melhor = 0.0
+    while fila:
+        custo, (linha, coluna) = heapq.heappop(fila)
+        if custo > custos[(linha, coluna)]:
+            continue
+        qtd = sum(mapa.eh_desconhecida(linha + dl, coluna + dc) for dl, dc in movimentos.VARIACOES)
+        if custo > 0 and qtd:
+            melhor = max(melhor, qtd / custo)
+        for (dl, dc), custo_passo in zip(movimentos.VARIACOES, movimentos.CUSTOS):
+            vizinha = (linha + dl, coluna + dc)
+            if livre(*vizinha) and custo + custo_passo < custos.get(vizinha, float('inf')):
+                custos[vizinha] = custo + custo_passo
+                heapq.heappush(fila, (custo + custo_passo, vizinha))
+    return melhor
+
+
+def test_deslocamentos_planos_seguem_a_ordem_das_variacoes():
+    colunas = 7
+    grade = np.arange(5 * colunas).reshape(5, colunas)
+    centro = 2 * colunas + 3
+    esperado = [grade[2 + dl, 3 + dc] - centro for dl, dc in movimentos.VARIACOES]
+    assert list(movimentos.deslocamentos_planos(colunas)) == esperado
+
+
+def test_escolhe_a_fronteira_de_maior_utilidade():
+    for semente in range(10):
+        problema = mapa_aleatorio(semente)
+        mapa = problema.mapa_crencas
+        caminho = ExploracaoFronteira()._ExploracaoFronteira__escolhe_fronteira(problema, (0, 0))
+
+        referencia = melhor_utilidade_referencia(mapa)
+        if referencia == 0:
+            assert caminho == []
+            continue
+
+        # Caminho contínuo de passos entre posições livres, da fronteira até a vizinha da base
+        posicoes = caminho[::-1]
+        for anterior, atual in zip([(0, 0)] + posicoes, posicoes):
+            assert max(abs(atual[0] - anterior[0]), abs(atual[1] - anterior[1])) == 1
+            assert mapa.obtem(*atual) not in (MapaCrencas.DESCONHECIDA, MapaCrencas.PAREDE)
+
+        custo = sum(
+            movimentos.custo_passo(atual[0] - anterior[0], atual[1] - anterior[1])
+            for anterior, atual in zip([(0, 0)] + posicoes, posicoes)
+        )
+        alvo = caminho[0]
+        qtd = sum(mapa.eh_desconhecida(alvo[0] + dl, alvo[1] + dc) for dl, dc in movimentos.VARIACOES)
+        assert qtd / custo == referencia
@@ -0,0 +1,50 @@
+from random import Random
+
+import pytest
+
+from agentes.utils.mapa_crencas import MapaCrencas
+
+CODIGOS = [MapaCrencas.VAZIA, MapaCrencas.VITIMA, MapaCrencas.PAREDE]
+
+
+def crencas_aleatorias(semente, qtd=300, alcance=40):
+    """ @return: dict (linha, coluna) -> código, com a base em (0, 0) """
+    rng = Random(semente)
+    crencas = {
+        (rng.randint(-alcance, alcance), rng.randint(-alcance, alcance)): rng.choice(CODIGOS)
+        for _ in range(qtd)
+    }
+    crencas[(0, 0)] = MapaCrencas.BASE
+    return crencas
+
+
+def mapa_de(crencas, tamanho_inicial=4):
+    mapa = MapaCrencas(tamanho_inicial)
+    for (linha, coluna), codigo in crencas.items():
+        mapa.define(linha, coluna, codigo)
+    return mapa
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_grade_cresce_sem_perder_crencas(semente):
+    crencas = crencas_aleatorias(semente)
+    mapa = mapa_de(crencas)
+
+    assert mapa.celulas.shape[0] >= 81 and mapa.celulas.shape[1] >= 81
+    for linha in range(-45, 46):
+        for coluna in range(-45, 46):
+            assert mapa.obtem(linha, coluna) == crencas.get((linha, coluna), MapaCrencas.DESCONHECIDA)
+    assert mapa.qtd_conhecidas() == len(crencas)
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_incorpora_preenche_apenas_as_desconhecidas(semente):
+    proprias = crencas_aleatorias(semente, alcance=20)
+    outras = crencas_aleatorias(semente + 100, alcance=60)
+    mapa = mapa_de(proprias)
+    mapa.incorpora(mapa_de(outras, tamanho_inicial=16))
+
+    for linha in range(-65, 66):
+        for coluna in range(-65, 66):
+            esperado = proprias.get((linha, coluna), outras.get((linha, coluna), MapaCrencas.DESCONHECIDA))
+            assert mapa.obtem(linha, coluna) == esperado
@@ -0,0 +1,69 @@
+from random import Random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from agentes.resgate.planos.otimizador_genetico import paralelo
+from agentes.resgate.planos.otimizador_genetico.otimizador import Otimizador
+from agentes.resgate.planos.otimizador_genetico.algoritmo_genetico import AlgoritmoGenetico
+from conftest import problema_sintetico
+
+PROBABILIDADES = {
+    'chance_mutacao': 0.1,
+    'chace_selecao_aleatoria': 0.05,
+    'percentagem_retencao_populacao': 0.35
+}
+TEMPO = 60.0
+
+
+def evolui(semente, n_processos, qtd_vitimas=10):
+    problema, custos = problema_sintetico(semente, qtd_vitimas)
+    otimizador = Otimizador(60, 3, PROBABILIDADES, TEMPO, Random(semente), n_processos)
+    otimizador.evoluir(problema, custos)
+    return otimizador, custos
+
+
+@pytest.mark.parametrize("quantidade, partes", [(10, 3), (2, 4), (9, 3), (1, 1)])
+def test_divide_quantidade_sem_partes_vazias(quantidade, partes):
+    tamanhos = paralelo.divide_quantidade(quantidade, partes)
+    assert sum(tamanhos) == quantidade
+    assert len(tamanhos) <= partes and min(tamanhos) >= 1
+    assert max(tamanhos) - min(tamanhos) <= 1
+
+
+def test_avaliacao_nos_processos_igual_a_serial(capsys):
+    problema, custos = problema_sintetico(0, 10)
+    gravidades = [0] + [int(sinais[-1]) for sinais in problema.sinais_vitais_vitimas.values()]
+    algoritmo_genetico = AlgoritmoGenetico(PROBABILIDADES, custos, gravidades, TEMPO, Random(0))
+    populacao = algoritmo_genetico.gera_populacao_aleatoria(40)
+
+    otimizador = Otimizador(40, 1, PROBABILIDADES, TEMPO, Random(0), n_processos=2)
+    with ProcessPoolExecutor(
+        max_workers = 2,
+        initializer = paralelo.inicializa_processo,
+        initargs = (custos, gravidades, TEMPO, PROBABILIDADES)
+    ) as executor:
+        otimizador.avalia_populacao(populacao, gravidades, executor)
+    paralelas = [individuo.pontuacao for individuo in populacao]
+
+    otimizador.avalia_populacao(populacao, gravidades)
+    assert paralelas == [individuo.pontuacao for individuo in populacao]
+
+    # O genoma compacto reconstrói o mesmo indivíduo
+    for individuo in populacao:
+        copia = paralelo.de_genoma(paralelo.para_genoma(individuo), custos, TEMPO)
+        assert copia.genes == individuo.genes
+        assert copia.qtd_subcaminhos == individuo.qtd_subcaminhos
+        assert copia.pontuacao == individuo.pontuacao
+
+
+@pytest.mark.parametrize("n_processos", [1, 2])
+def test_evolucao_reproduzivel_e_viavel(n_processos):
+    primeiro, custos = evolui(5, n_processos)
+    segundo, _ = evolui(5, n_processos)
+    assert primeiro.melhor_individuo_.genes == segundo.melhor_individuo_.genes
+    assert primeiro.melhor_pontuacao_ == segundo.melhor_pontuacao_
+
+    trajeto = primeiro.melhor_individuo_.genes['trajeto']
+    assert all(anterior[1] == atual[0] for anterior, atual in zip(trajeto, trajeto[1:]))
+    assert sum(float(custos[origem, destino]) for origem, destino in trajeto) <= TEMPO
@@ -0,0 +1,50 @@
+from random import Random
+
+import numpy as np
+import pytest
+
+from agentes.resgate.planos.otimizador_genetico.individuo import INDICE_BASE
+from agentes.resgate.planos.otimizador_genetico.otimizador_vetorizado import OtimizadorVetorizado
+from conftest import problema_sintetico
+
+PROBABILIDADES = {
+    'chance_mutacao': 0.1,
+    'chace_selecao_aleatoria': 0.05,
+    'percentagem_retencao_populacao': 0.35
+}
+
+
+def evolui(semente, qtd_vitimas, tempo, n_populacao=50, n_geracoes=4):
+    problema, custos = problema_sintetico(semente, qtd_vitimas)
+    otimizador = OtimizadorVetorizado(n_populacao, n_geracoes, PROBABILIDADES, tempo, Random(semente))
+    otimizador.evoluir(problema, custos)
+    return otimizador, custos
+
+
+@pytest.mark.parametrize("semente", range(3))
+def test_melhor_trajeto_viavel_no_tempo(semente):
+    tempo = 60.0
+    otimizador, custos = evolui(semente, 12, tempo)
+    trajeto = otimizador.melhor_individuo_.genes['trajeto']
+
+    assert trajeto[0][0] == INDICE_BASE and trajeto[-1][1] == INDICE_BASE
+    assert all(anterior[1] == atual[0] for anterior, atual in zip(trajeto, trajeto[1:]))
+    visitadas = [destino for _, destino in trajeto[:-1]]
+    assert len(set(visitadas)) == len(visitadas) and INDICE_BASE not in visitadas
+    assert sum(float(custos[origem, destino]) for origem, destino in trajeto) <= tempo
+
+
+def test_evolucao_reproduzivel_e_silenciosa(capsys):
+    primeiro, _ = evolui(3, 12, 60.0)
+    segundo, _ = evolui(3, 12, 60.0)
+    assert primeiro.melhor_individuo_.genes == segundo.melhor_individuo_.genes
+    assert primeiro.melhor_pontuacao_ == segundo.melhor_pontuacao_
+    assert capsys.readouterr().out == ""
+
+
+def test_indices_de_muitas_vitimas_sem_estouro():
+    # 300 vítimas não cabem em uint8: todas devem aparecer, sem repetição, no trajeto
+    qtd_vitimas = 300
+    otimizador, _ = evolui(0, qtd_vitimas, np.inf, n_populacao=8, n_geracoes=2)
+    visitadas = [destino for _, destino in otimizador.melhor_individuo_.genes['trajeto'][:-1]]
+    assert sorted(visitadas) == list(range(1, qtd_vitimas + 1))
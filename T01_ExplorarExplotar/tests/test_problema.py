@@ -0,0 +1,69 @@
+import io
+from random import Random
+
+import numpy as np
+import pytest
+
+from agentes.utils import movimentos
+from agentes.utils.estado import CHAVE_BASE
+from agentes.utils.problema import Problema
+from agentes.explorador.planos.retorno import PlanoRetornoBase
+from agentes.resgate.planos.resgate_genetico import PlanoResgateGenetico
+from conftest import problema_aleatorio, dijkstra_referencia
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_campo_de_custos_ate_a_base_igual_a_um_dijkstra_novo(semente):
+    problema = problema_aleatorio(semente)
+
+    referencia = dijkstra_referencia(problema.grafo_posicoes, CHAVE_BASE)
+    assert problema.custo_base.keys() == referencia.keys()
+    for posicao, custo in referencia.items():
+        assert problema.custo_base[posicao] == pytest.approx(custo)
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_caminho_do_campo_chega_na_base_com_o_custo_do_campo(semente):
+    problema = problema_aleatorio(semente)
+    plano = PlanoRetornoBase()
+
+    for posicao in list(problema.grafo_posicoes)[::7]:
+        caminho = plano.obtem_caminho_campo_base(problema, posicao)
+        atual = posicao
+        custo = 0.0
+        for proxima in reversed(caminho):
+            passo = caminho[proxima]
+            assert (atual[0] + passo.linha, atual[1] + passo.coluna) == proxima
+            assert proxima in problema.grafo_posicoes[atual]
+            custo += movimentos.custo_passo(passo.linha, passo.coluna)
+            atual = proxima
+        assert atual == CHAVE_BASE
+        assert custo == pytest.approx(problema.custo_base[posicao])
+
+
+@pytest.mark.parametrize("semente", range(3))
+def test_npz_ida_e_volta_exata(semente):
+    problema = problema_aleatorio(semente)
+    arquivo = io.BytesIO()
+    problema.salva(arquivo)
+    arquivo.seek(0)
+    carregado = Problema.carrega(arquivo)
+
+    mapa, mapa_carregado = problema.mapa_crencas, carregado.mapa_crencas
+    assert mapa_carregado.celulas.dtype == mapa.celulas.dtype
+    assert np.array_equal(mapa_carregado.celulas, mapa.celulas)
+    assert (mapa_carregado.origem_linha, mapa_carregado.origem_coluna) == (
+        mapa.origem_linha, mapa.origem_coluna)
+
+    # Mesma ordem das posições e das listas de adjacência
+    assert list(carregado.grafo_posicoes.items()) == list(problema.grafo_posicoes.items())
+    assert carregado.custo_base == problema.custo_base
+    assert carregado.proximo_passo_base == problema.proximo_passo_base
+    assert list(carregado.sinais_vitais_vitimas.items()) == list(problema.sinais_vitais_vitimas.items())
+
+    # O replanejamento do problema carregado é o mesmo do original
+    passos = [
+        PlanoResgateGenetico(atual, 200.0, Random(semente), 'vetorizado').executar()
+        for atual in (problema, carregado)
+    ]
+    assert passos[0] == passos[1]
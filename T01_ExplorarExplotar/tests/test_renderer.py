@@ -0,0 +1,51 @@
+import io
+import os
+import contextlib
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from main import build_env
+from physical_agent import PhysAgent
+from renderer import Renderer
+from conftest import DATA_FOLDER
+
+
+@pytest.fixture
+def display(monkeypatch):
+    """ pygame display without a window """
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    yield
+    pygame.display.quit()
+
+
+def full_redraw(env):
+    """ @return: the pixels of a complete frame drawn by a new renderer """
+    surface = pygame.Surface((env.dic["WINDOW_WIDTH"], env.dic["WINDOW_HEIGHT"]))
+    Renderer(env, surface).draw()
+    return pygame.surfarray.array3d(surface)
+
+
+@pytest.mark.parametrize("scenario", ["data", "generated"])
+def test_incremental_frames_equal_full_redraw(display, make_scenario, scenario):
+    if scenario == "data":
+        data_folder = os.path.join(DATA_FOLDER, "data")
+    else:
+        # 30 cells in a 500 pixels window: cells with fractional sizes
+        data_folder = make_scenario(width=30, height=30, victims=15, seed=2, tlim=150.0)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        env = build_env(data_folder, seed=3)
+        screen = pygame.display.set_mode((env.dic["WINDOW_WIDTH"], env.dic["WINDOW_HEIGHT"]))
+        renderer = Renderer(env, screen)
+        renderer.draw()
+
+        active = True
+        while active:
+            # one cycle of the simulation, then the incremental frame
+            env.run_headless(1)
+            active = any(body.state == PhysAgent.ACTIVE for body in env.agents)
+            renderer.draw()
+            assert (pygame.surfarray.array3d(screen) == full_redraw(env)).all()
@@ -0,0 +1,39 @@
+from random import Random
+
+import numpy as np
+import pytest
+
+from agentes.utils import movimentos
+from agentes.utils.estado import CHAVE_BASE
+from agentes.resgate.planos.resgate_genetico import PlanoResgateGenetico
+from conftest import problema_aleatorio, dijkstra_referencia
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_custos_e_caminhos_dos_subcaminhos(semente):
+    problema = problema_aleatorio(semente)
+    plano = PlanoResgateGenetico(problema, 500.0, Random(semente))
+    custos = plano.processa_problema()
+
+    chaves = [CHAVE_BASE] + list(problema.sinais_vitais_vitimas)
+    assert plano.posicoes_chave == chaves
+    assert custos.dtype == np.float32 and custos.shape == (len(chaves), len(chaves))
+
+    # As buscas compartilham um único array de predecessores do tamanho do grafo
+    assert len(plano.anteriores) == len(problema.grafo_posicoes)
+
+    for linha, origem in enumerate(chaves):
+        referencia = dijkstra_referencia(problema.grafo_posicoes, origem)
+        for coluna, destino in enumerate(chaves):
+            assert custos[linha, coluna] == np.float32(referencia.get(destino, np.inf))
+
+            caminho = plano.materializa_caminho(origem, destino).tolist()
+            if origem == destino or destino not in referencia:
+                assert caminho == []
+                continue
+            assert tuple(caminho[-1]) == destino
+            custo = 0.0
+            for anterior, atual in zip([list(origem)] + caminho, caminho):
+                assert tuple(atual) in problema.grafo_posicoes[tuple(anterior)]
+                custo += movimentos.custo_passo(atual[0] - anterior[0], atual[1] - anterior[1])
+            assert custo == pytest.approx(referencia[destino])
@@ -0,0 +1,35 @@
+import os
+
+import numpy as np
+import pytest
+
+import scenario_format
+from conftest import run_scenario
+
+
+@pytest.mark.parametrize("victims", [0, 1, 25])
+def test_binary_scenario_loads_the_same_as_the_text_files(make_scenario, victims):
+    folder = make_scenario(width=30, height=20, victims=victims, seed=5, binary=True)
+    width, height = scenario_format.read_grid_size(folder)
+
+    text = scenario_format.read_text_scenario(folder, width, height)
+    binary = scenario_format.open_scenario(os.path.join(folder, scenario_format.SCENARIO_FILE))
+
+    walls, positions, signals = text
+    assert positions.shape == (victims, 2)
+    assert signals.shape == (victims, scenario_format.SIGNALS_COLUMNS)
+    np.testing.assert_array_equal(binary[0], walls)
+    np.testing.assert_array_equal(binary[1], positions)
+    np.testing.assert_array_equal(binary[2], signals.astype(np.float32))
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_environment_runs_a_scenario_without_victims(make_scenario, binary):
+    folder = make_scenario(victims=0, binary=binary)
+    assert os.path.getsize(os.path.join(folder, "sinais_vitais.txt")) == 0
+
+    env, result = run_scenario(folder, seed=1)
+
+    assert env.nb_of_victims == 0
+    assert not result.capped
+    assert [agent.found for agent in result.agents] == [[], []]